@@ -1,11 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import iterate_in_threadpool
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from datetime import datetime
+from typing import List, Optional
+import json
 import os
 
-from ..db.session import get_db
-from ..models.epic import Epic, EpicCreate, EpicUpdate, EpicResponse
-from ..services.epic import EpicService
+from ..db.session import get_db, get_async_db, USE_ASYNC_DB
+from ..db.sharding import ShardSessions, shard_map
+from ..models.epic import (
+    Epic, EpicCreate, EpicUpdate, EpicResponse, EpicBatchRequest, EpicBatchResult, EpicChangeFeed,
+    EpicDeleteResponse, EpicImportResponse, EpicSearchResult, EpicRollupSummary, EpicFreeSlots, EpicMove, EpicSwap,
+)
+from ..services.epic import EpicService, PositionConflictError, encode_cursor, iter_ndjson_records, TRANSFER_CHUNK_SIZE
+from ..services.epic_async import AsyncEpicService, fan_out
+from ..services.history import HistoryCompactedError
+from ..services.cache import epic_cache
+from ..services.coalesce import epic_write_coalescer
+from ..services.serialization import JSON_MEDIA_TYPE, dumps
 
 router = APIRouter(
     prefix="/api/epic",
@@ -23,89 +39,520 @@ def get_db_override():
     else:
         yield from get_db()
 
+# DB_ASYNC=true이면 AsyncSession을 주입해 DB I/O가 이벤트 루프를 막지 않도록 함
+get_session = get_async_db if USE_ASYNC_DB else get_db_override
+
+async def get_shards(db: Session = Depends(get_session)):
+    """요청에서 쓸 보드 shard 세션들. DB_SHARD_URLS가 없으면 모든 요청이 기본 세션을 사용합니다."""
+    shards = ShardSessions(db, shard_map)
+    try:
+        yield shards
+    except Exception:
+        # 새 보드를 만들지 못했으면 디렉터리의 보드 수를 되돌림
+        await shards.release_boards()
+        raise
+    finally:
+        await shards.close()
+
+def session_for(shards: ShardSessions, epic_id: Optional[int]):
+    """epic id가 속한 shard의 세션. 설정되지 않은 shard의 id이면 404"""
+    try:
+        return shards.for_epic(epic_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Epic not found")
+
+async def get_epic_session(epic_id: int, shards: ShardSessions = Depends(get_shards)):
+    """경로의 epic id로 고른 shard 세션 (shard를 나누지 않으면 get_session과 같은 세션)"""
+    return session_for(shards, epic_id)
+
+async def batch_session(shards: ShardSessions, batch: EpicBatchRequest):
+    """batch가 가리키는 epic들의 shard 세션. 한 batch는 한 shard 안에서만 처리합니다."""
+    if not shards.enabled:
+        return shards.default
+    epic_ids = {operation.id for operation in batch.operations if operation.id is not None}
+    epic_ids |= {
+        operation.data["core_epic_id"]
+        for operation in batch.operations
+        if operation.data and operation.data.get("core_epic_id") is not None
+    }
+    if len({shard_map.shard_of(epic_id) for epic_id in epic_ids}) > 1:
+        raise HTTPException(status_code=400, detail="Batch operations must stay on one board shard")
+    return session_for(shards, next(iter(epic_ids))) if epic_ids else await shards.for_new_board()
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 확인합니다.
+
+    압축한 응답은 약한 ETag(W/"...")로 나가므로 약한 비교(W/ 접두사 무시)를 사용합니다.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if etag is None or not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag.removeprefix("W/") in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+
+def position_conflict_detail(error: Exception) -> str:
+    """(core_epic_id, position) 유니크 인덱스 위반은 DB 메시지 대신 알기 쉬운 메시지로 응답합니다."""
+    if isinstance(error, IntegrityError):
+        return "Position is already taken under the core epic"
+    return str(error)
+
 class EpicController:
-    def __init__(self, db: Session):
-        self.service = EpicService(db)
+    def __init__(self, db: Session, shards: Optional[ShardSessions] = None):
+        self.service = AsyncEpicService(db) if isinstance(db, AsyncSession) else EpicService(db)
+        # 목록/검색/내보내기/전체 삭제는 shard가 나뉘어 있으면 모든 shard에 나눠 실행
+        self.shards = shards if shards is not None and shards.enabled else None
+
+    async def create_epic(self, epic: EpicCreate, allocate_position: bool = False) -> EpicResponse:
+        try:
+            return await self.service.create_epic(epic, allocate_position=allocate_position)
+        except (PositionConflictError, IntegrityError) as e:
+            raise HTTPException(status_code=409, detail=position_conflict_detail(e))
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-    async def create_epic(self, epic: EpicCreate) -> EpicResponse:
+    async def batch_epics(self, batch: EpicBatchRequest) -> List[EpicBatchResult]:
         try:
-            return await self.service.create_epic(epic)
+            return await self.service.batch_epics(batch.operations)
+        except IntegrityError as e:
+            raise HTTPException(status_code=409, detail=position_conflict_detail(e))
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
 
-    async def get_epics(self, skip: int = 0, limit: int = 100) -> List[EpicResponse]:
-        return await self.service.get_epics(skip, limit)
+    async def get_epics(
+        self,
+        request: Request,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_subs: bool = True,
+        fields: Optional[str] = None,
+    ) -> Response:
+        field_list = [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+        if field_list == []:
+            raise HTTPException(status_code=400, detail="fields must name at least one field")
+        if self.shards is not None:
+            return await self._get_epics_across_shards(request, skip, limit, cursor, include_subs, field_list)
+
+        etag = await self.service.get_list_version()
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        try:
+            epics, next_id = await self.service.get_epics(skip, limit, cursor, include_subs, field_list, etag)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        headers = {"ETag": etag}
+        # 다음 페이지가 있으면 커서를 헤더로 내려줌 (본문 형식은 기존과 동일)
+        if next_id is not None:
+            headers["X-Next-Cursor"] = encode_cursor(next_id)
+
+        if field_list is not None:
+            # 선택한 필드만 내려주기 위해 response_model 검증을 거치지 않음
+            return JSONResponse(content=jsonable_encoder(epics), headers=headers)
+        # 서비스에서 이미 EpicResponse 형식으로 인코딩한 바이트를 그대로 전송
+        return Response(content=epics, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+    async def _get_epics_across_shards(
+        self, request: Request, skip: int, limit: int, cursor: Optional[str], include_subs: bool, field_list
+    ) -> Response:
+        """shard마다 (offset + limit)개까지 병렬로 읽어 이어 붙입니다.
+
+        shard 번호가 epic id의 상위 비트이므로 shard 순서대로 이어 붙이면 전체 id 순서가 됩니다.
+        ETag는 shard별 revision을 이어 붙인 값입니다.
+        """
+        sessions = self.shards.all()
+        versions = await fan_out(sessions, lambda service: service.get_list_version())
+        etag = '"' + ".".join(version.strip('"') for version in versions) + '"'
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        # cursor가 있으면 skip은 쓰지 않음 (단일 DB와 동일). 한 행을 더 읽어 다음 페이지가 있는지 확인
+        offset = 0 if cursor is not None else skip
+        try:
+            pages = await fan_out(
+                sessions, lambda service: service.get_epics(0, offset + limit + 1, cursor, include_subs, field_list)
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        epics = []
+        for page, _ in pages:
+            epics.extend(page if field_list is not None else json.loads(page))
+        has_more = len(epics) > offset + limit
+        epics = epics[offset:offset + limit]
+
+        headers = {"ETag": etag}
+        if has_more and (field_list is None or "id" in field_list):
+            headers["X-Next-Cursor"] = encode_cursor(epics[-1]["id"])
+        if field_list is not None:
+            return JSONResponse(content=jsonable_encoder(epics), headers=headers)
+        return Response(content=dumps(epics), media_type=JSON_MEDIA_TYPE, headers=headers)
+
+    async def get_changes(self, since: int, limit: int) -> EpicChangeFeed:
+        return await self.service.get_changes(since, limit)
+
+    async def search_epics(
+        self, q: str, root_id: Optional[int], status: Optional[str], depth: Optional[int], limit: int
+    ) -> List[EpicSearchResult]:
+        if self.shards is not None and root_id is None:
+            # shard별 상위 limit개를 병렬로 찾아 점수 순으로 합침 (점수는 shard마다 따로 계산됨)
+            pages = await fan_out(self.shards.all(), lambda service: service.search_epics(q, None, status, depth, limit))
+            results = [result for page in pages for result in page]
+            return sorted(results, key=lambda result: (-result.score, result.epic.id))[:limit]
+        results = await self.service.search_epics(q, root_id, status, depth, limit)
+        if results is None:
+            raise HTTPException(status_code=404, detail="Epic not found")
+        return results
+
+    async def export_epics(self, root_id: Optional[int] = None) -> StreamingResponse:
+        if self.shards is not None and root_id is None:
+            return StreamingResponse(
+                _export_across_shards(self.shards.all()),
+                media_type="application/x-ndjson",
+                headers={"Content-Disposition": 'attachment; filename="epics.ndjson"'},
+            )
+        root_path = None
+        if root_id is not None:
+            root_path = await self.service.get_epic_path(root_id)
+            if root_path is None:
+                raise HTTPException(status_code=404, detail="Epic not found")
+        return StreamingResponse(
+            self.service.export_epics(root_path),
+            media_type="application/x-ndjson",
+            headers={"Content-Disposition": 'attachment; filename="epics.ndjson"'},
+        )
+
+    async def import_epics(self, request: Request, core_epic_id: Optional[int] = None) -> EpicImportResponse:
+        state = await self.service.begin_import(core_epic_id)
+        if state is None:
+            raise HTTPException(status_code=404, detail="Epic not found")
+        try:
+            # 본문을 한 번에 읽지 않고 청크 단위로 파싱해 TRANSFER_CHUNK_SIZE개씩 INSERT
+            records = []
+            async for record in iter_ndjson_records(request.stream()):
+                records.append(record)
+                if len(records) >= TRANSFER_CHUNK_SIZE:
+                    await self.service.import_epics(records, state)
+                    records = []
+            await self.service.import_epics(records, state)
+            return await self.service.finish_import(state)
+        except IntegrityError as e:
+            raise HTTPException(status_code=409, detail=position_conflict_detail(e))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def get_epic(self, request: Request, epic_id: int) -> Response:
+        etag = await self.service.get_subtree_version(epic_id)
+        if etag is None:
+            raise HTTPException(status_code=404, detail="Epic not found")
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        content = await self.service.get_epic(epic_id, etag)
+        if content is None:
+            raise HTTPException(status_code=404, detail="Epic not found")
+        return Response(content=content, media_type=JSON_MEDIA_TYPE, headers={"ETag": etag})
+
+    async def get_epic_tree(
+        self, request: Request, epic_id: int, max_depth: Optional[int] = None
+    ) -> Response:
+        etag = await self.service.get_subtree_version(epic_id)
+        if etag is None:
+            raise HTTPException(status_code=404, detail="Epic not found")
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        content = await self.service.get_epic_tree(epic_id, max_depth, etag)
+        if content is None:
+            raise HTTPException(status_code=404, detail="Epic not found")
+        return Response(content=content, media_type=JSON_MEDIA_TYPE, headers={"ETag": etag})
+
+    async def get_board_at(self, board_id: int, at: Optional[datetime] = None) -> Response:
+        try:
+            content = await self.service.get_board_at(board_id, at or datetime.now())
+        except HistoryCompactedError as e:
+            raise HTTPException(status_code=410, detail=str(e))
+        if content is None:
+            raise HTTPException(status_code=404, detail="Board not found at the requested time")
+        return Response(content=content, media_type=JSON_MEDIA_TYPE)
+
+    async def get_ancestors(self, epic_id: int) -> List[EpicResponse]:
+        ancestors = await self.service.get_ancestors(epic_id)
+        if ancestors is None:
+            raise HTTPException(status_code=404, detail="Epic not found")
+        return ancestors
 
-    async def get_epic(self, epic_id: int) -> EpicResponse:
-        epic = await self.service.get_epic(epic_id)
-        if epic is None:
+    async def get_free_slots(self, epic_id: int) -> EpicFreeSlots:
+        slots = await self.service.get_free_slots(epic_id)
+        if slots is None:
             raise HTTPException(status_code=404, detail="Epic not found")
-        return epic
+        return slots
+
+    async def get_rollup(self, epic_id: int) -> EpicRollupSummary:
+        rollup = await self.service.get_rollup(epic_id)
+        if rollup is None:
+            raise HTTPException(status_code=404, detail="Epic not found")
+        return rollup
     
-    async def update_epic(self, epic_id: int, epic: EpicUpdate) -> EpicResponse:
+    async def update_epic(self, epic_id: int, epic: EpicUpdate, durable: Optional[bool] = None) -> EpicResponse:
+        fields = epic.dict(exclude_unset=True)
+        if epic_write_coalescer.accepts(fields):
+            return await self._update_coalesced(epic_id, fields, epic_write_coalescer.durable if durable is None else durable)
         try:
-            return await self.service.update_epic(epic_id, epic)
+            result = await self.service.update_epic(epic_id, epic)
+        except IntegrityError as e:
+            raise HTTPException(status_code=409, detail=position_conflict_detail(e))
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
+        if result is None:
+            raise HTTPException(status_code=404, detail="Epic not found")
+        return result
+
+    async def _update_coalesced(self, epic_id: int, fields: dict, durable: bool) -> Response:
+        """묶음 쓰기 모드. durable이면 묶음이 commit된 뒤 트리를, 아니면 합쳐질 값을 반영한 트리를 바로 응답합니다."""
+        if not durable:
+            content = await self.service.get_epic_tree(epic_id)
+            if content is None:
+                raise HTTPException(status_code=404, detail="Epic not found")
+            epic_write_coalescer.submit(epic_id, fields, durable=False)
+            node = json.loads(content)
+            node.update(epic_write_coalescer.pending(epic_id), updated_at=datetime.now())
+            return Response(content=dumps(node), media_type=JSON_MEDIA_TYPE)
+
+        try:
+            applied = await epic_write_coalescer.submit(epic_id, fields)
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        content = await self.service.get_epic_tree(epic_id) if epic_id in applied else None
+        if content is None:
+            raise HTTPException(status_code=404, detail="Epic not found")
+        return Response(content=content, media_type=JSON_MEDIA_TYPE)
         
-    async def delete_epic(self, epic_id: int) -> EpicResponse:
+    async def move_epic(self, epic_id: int, move: EpicMove) -> EpicResponse:
         try:
-            return await self.service.delete_epic(epic_id)
+            result = await self.service.move_epic(epic_id, move)
+        except (PositionConflictError, IntegrityError) as e:
+            raise HTTPException(status_code=409, detail=position_conflict_detail(e))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if result is None:
+            raise HTTPException(status_code=404, detail="Epic not found")
+        return result
+
+    async def swap_epics(self, swap: EpicSwap) -> List[EpicResponse]:
+        try:
+            result = await self.service.swap_epics(swap.first_id, swap.second_id)
+        except IntegrityError as e:
+            raise HTTPException(status_code=409, detail=position_conflict_detail(e))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if result is None:
+            raise HTTPException(status_code=404, detail="Epic not found")
+        return result
+
+    async def delete_epic(self, epic_id: int) -> EpicDeleteResponse:
+        try:
+            result = await self.service.delete_epic(epic_id)
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
+        if result is None:
+            raise HTTPException(status_code=404, detail="Epic not found")
+        return result
     
     async def delete_all_epics(self) -> dict:
         try:
+            if self.shards is not None:
+                results = await fan_out(self.shards.all(), lambda service: service.delete_all_epics())
+                count = sum(result["count"] for result in results)
+                return {"message": f"All {count} epics deleted successfully", "count": count}
             return await self.service.delete_all_epics()
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
 
+async def _export_across_shards(sessions: list):
+    """shard 순서(= id 순서)대로 각 shard의 NDJSON 스트림을 이어 보냅니다."""
+    for db in sessions:
+        if isinstance(db, AsyncSession):
+            async for chunk in AsyncEpicService(db).export_epics():
+                yield chunk
+        else:
+            async for chunk in iterate_in_threadpool(EpicService(db).export_epics()):
+                yield chunk
+
 # Route handlers
 @router.post("", response_model=EpicResponse)
 async def create_epic(
     epic: EpicCreate,
-    db: Session = Depends(get_db_override)
+    allocate_position: bool = Query(False, description="상위 epic 주변의 빈 칸을 서버에서 배정"),
+    shards: ShardSessions = Depends(get_shards)
+):
+    # 하위 epic은 상위 epic의 shard에, 새 보드는 디렉터리에서 고른 shard에 생성
+    db = session_for(shards, epic.core_epic_id) if epic.core_epic_id is not None else await shards.for_new_board()
+    controller = EpicController(db)
+    return await controller.create_epic(epic, allocate_position)
+
+@router.post("/batch", response_model=List[EpicBatchResult])
+async def batch_epics(
+    batch: EpicBatchRequest,
+    shards: ShardSessions = Depends(get_shards)
 ):
+    controller = EpicController(await batch_session(shards, batch))
+    return await controller.batch_epics(batch)
+
+@router.post("/swap", response_model=List[EpicResponse])
+async def swap_epics(
+    swap: EpicSwap,
+    shards: ShardSessions = Depends(get_shards)
+):
+    if shard_map.shard_of(swap.first_id) != shard_map.shard_of(swap.second_id):
+        raise HTTPException(status_code=400, detail="Cannot swap epics on different board shards")
+    controller = EpicController(session_for(shards, swap.first_id))
+    return await controller.swap_epics(swap)
+
+@router.get("/cache/stats", response_model=dict)
+async def read_cache_stats():
+    return epic_cache.stats()
+
+@router.get("/changes", response_model=EpicChangeFeed)
+async def read_epic_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(1000, ge=1, le=10000),
+    shard: int = Query(0, ge=0, description="보드 shard 번호 (revision은 shard마다 따로 증가)"),
+    shards: ShardSessions = Depends(get_shards)
+):
+    try:
+        db = shards.get(shard)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Shard not found")
     controller = EpicController(db)
-    return await controller.create_epic(epic)
+    return await controller.get_changes(since, limit)
+
+@router.get("/search", response_model=List[EpicSearchResult])
+async def search_epics(
+    q: str = Query(..., min_length=1, max_length=200),
+    root_id: Optional[int] = None,
+    status: Optional[str] = None,
+    depth: Optional[int] = Query(None, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    shards: ShardSessions = Depends(get_shards)
+):
+    controller = EpicController(session_for(shards, root_id), shards)
+    return await controller.search_epics(q, root_id, status, depth, limit)
 
-@router.get("", response_model=List[EpicResponse])
+@router.get("/export")
+async def export_epics(
+    root_id: Optional[int] = None,
+    shards: ShardSessions = Depends(get_shards)
+):
+    controller = EpicController(session_for(shards, root_id), shards)
+    return await controller.export_epics(root_id)
+
+@router.post("/import", response_model=EpicImportResponse)
+async def import_epics(
+    request: Request,
+    core_epic_id: Optional[int] = None,
+    shards: ShardSessions = Depends(get_shards)
+):
+    db = session_for(shards, core_epic_id) if core_epic_id is not None else await shards.for_new_board()
+    controller = EpicController(db)
+    return await controller.import_epics(request, core_epic_id)
+
+@router.get("", responses={200: {"model": List[EpicResponse]}})
 async def read_epics(
+    request: Request,
     skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db_override)
+    limit: int = Query(100, ge=1),
+    cursor: Optional[str] = None,
+    include_subs: bool = True,
+    fields: Optional[str] = None,
+    shards: ShardSessions = Depends(get_shards)
 ):
-    controller = EpicController(db)
-    return await controller.get_epics(skip, limit)
+    controller = EpicController(shards.default, shards)
+    return await controller.get_epics(request, skip, limit, cursor, include_subs, fields)
 
-@router.get("/{epic_id}", response_model=EpicResponse)
+@router.get("/{epic_id}", responses={200: {"model": EpicResponse}})
 async def read_epic(
+    request: Request,
     epic_id: int,
-    db: Session = Depends(get_db_override)
+    db: Session = Depends(get_epic_session)
 ):
     controller = EpicController(db)
-    return await controller.get_epic(epic_id) 
+    return await controller.get_epic(request, epic_id) 
+
+@router.get("/{epic_id}/tree", responses={200: {"model": EpicResponse}})
+async def read_epic_tree(
+    request: Request,
+    epic_id: int,
+    max_depth: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_epic_session)
+):
+    controller = EpicController(db)
+    return await controller.get_epic_tree(request, epic_id, max_depth)
+
+@router.get("/{epic_id}/history", responses={200: {"model": EpicResponse}})
+async def read_epic_history(
+    epic_id: int,
+    at: Optional[datetime] = Query(None, description="재구성할 시점 (기본: 현재). epic_id는 보드(루트 epic) id"),
+    db: Session = Depends(get_epic_session)
+):
+    controller = EpicController(db)
+    return await controller.get_board_at(epic_id, at)
+
+@router.get("/{epic_id}/ancestors", response_model=List[EpicResponse])
+async def read_epic_ancestors(
+    epic_id: int,
+    db: Session = Depends(get_epic_session)
+):
+    controller = EpicController(db)
+    return await controller.get_ancestors(epic_id)
+
+@router.get("/{epic_id}/free-slots", response_model=EpicFreeSlots)
+async def read_epic_free_slots(
+    epic_id: int,
+    db: Session = Depends(get_epic_session)
+):
+    controller = EpicController(db)
+    return await controller.get_free_slots(epic_id)
+
+@router.get("/{epic_id}/rollup", response_model=EpicRollupSummary)
+async def read_epic_rollup(
+    epic_id: int,
+    db: Session = Depends(get_epic_session)
+):
+    controller = EpicController(db)
+    return await controller.get_rollup(epic_id)
+
+@router.post("/{epic_id}/move", response_model=EpicResponse)
+async def move_epic(
+    epic_id: int,
+    move: EpicMove,
+    db: Session = Depends(get_epic_session)
+):
+    if move.core_epic_id is not None and shard_map.shard_of(move.core_epic_id) != shard_map.shard_of(epic_id):
+        raise HTTPException(status_code=400, detail="Cannot move an epic to a board on another shard")
+    controller = EpicController(db)
+    return await controller.move_epic(epic_id, move)
 
 @router.put("/{epic_id}", response_model=EpicResponse)
 async def update_epic(
     epic_id: int,
     epic: EpicUpdate,
-    db: Session = Depends(get_db_override)
+    durable: Optional[bool] = Query(None, description="묶음 쓰기 모드에서 commit 후 응답할지 여부 (기본: EPIC_WRITE_DURABLE)"),
+    db: Session = Depends(get_epic_session)
 ):
     controller = EpicController(db)
-    return await controller.update_epic(epic_id, epic)
+    return await controller.update_epic(epic_id, epic, durable)
 
-@router.delete("/{epic_id}", response_model=EpicResponse)
+@router.delete("/{epic_id}", response_model=EpicDeleteResponse)
 async def delete_epic(
     epic_id: int,
-    db: Session = Depends(get_db_override)
+    db: Session = Depends(get_epic_session)
 ):
     controller = EpicController(db)
     return await controller.delete_epic(epic_id)
 
 @router.delete("", response_model=dict)
 async def delete_all_epics(
-    db: Session = Depends(get_db_override)
+    shards: ShardSessions = Depends(get_shards)
 ):
-    controller = EpicController(db)
+    controller = EpicController(shards.default, shards)
     return await controller.delete_all_epics()
\ No newline at end of file
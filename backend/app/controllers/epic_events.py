@@ -0,0 +1,49 @@
+import json
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from ..services.events import epic_broker
+from .epic import EpicController, get_epic_session
+
+EPIC_EVENTS_KEEPALIVE_SECONDS = float(os.getenv("EPIC_EVENTS_KEEPALIVE_SECONDS", "15"))
+
+router = APIRouter(
+    prefix="/api/epic",
+    tags=["epic-events"]
+)
+
+async def epic_event_stream(request: Request, root_id: Optional[int] = None):
+    """root_id 하위 트리의 변경 이벤트를 Server-Sent Events 형식으로 내보냅니다."""
+    subscription = epic_broker.subscribe(root_id)
+    try:
+        yield f"event: ready\ndata: {json.dumps({'root_id': root_id})}\n\n"
+        while not await request.is_disconnected():
+            message = await subscription.next_batch(timeout=EPIC_EVENTS_KEEPALIVE_SECONDS)
+            if message is None:
+                # 유휴 연결 유지 및 끊긴 연결 감지용
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: {message['type']}\ndata: {json.dumps(message)}\n\n"
+    finally:
+        subscription.close()
+
+def _sse_response(request: Request, root_id: Optional[int]) -> StreamingResponse:
+    return StreamingResponse(
+        epic_event_stream(request, root_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.get("/events")
+async def stream_all_epic_events(request: Request):
+    return _sse_response(request, None)
+
+@router.get("/{epic_id}/events")
+async def stream_epic_events(epic_id: int, request: Request, db: Session = Depends(get_epic_session)):
+    if await EpicController(db).service.get_epic_path(epic_id) is None:
+        raise HTTPException(status_code=404, detail="Epic not found")
+    return _sse_response(request, epic_id)
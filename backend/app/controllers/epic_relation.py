@@ -1,46 +1,111 @@
-from fastapi import APIRouter, Depends
+from typing import Callable, Dict, List
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from ..models.epic import EpicRelation, EpicRelationCreate, Epic
-from ..db.session import get_db
+from ..db.sharding import ShardSessions, shard_map
+from .epic import get_shards, session_for
 
 router = APIRouter()
 
+async def _run(db, query: Callable[[Session], object]):
+    """동기 조회 함수를 세션에서 실행합니다. AsyncSession이면 run_sync 안에서 실행합니다."""
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(query)
+    return query(db)
+
 @router.post("/api/epic/relation")
-def create_epic_relation(relation: EpicRelationCreate, db: Session = Depends(get_db)):
-    db_relation = EpicRelation(**relation.dict())
-    db.add(db_relation)
-    db.commit()
-    db.refresh(db_relation)
-    return db_relation
+async def create_epic_relation(relation: EpicRelationCreate, shards: ShardSessions = Depends(get_shards)):
+    # 관계는 두 epic이 있는 보드 shard에 저장
+    if shard_map.shard_of(relation.core_epic_id) != shard_map.shard_of(relation.sub_epic_id):
+        raise HTTPException(status_code=400, detail="Cannot relate epics on different board shards")
+
+    def create(db: Session) -> EpicRelation:
+        db_relation = EpicRelation(**relation.dict())
+        db.add(db_relation)
+        db.commit()
+        db.refresh(db_relation)
+        return db_relation
+
+    return await _run(session_for(shards, relation.core_epic_id), create)
+
+@router.get("/api/epic/relations")
+async def get_relations(core_ids: str, shards: ShardSessions = Depends(get_shards)):
+    """여러 core epic의 관계를 shard마다 한 번의 join 쿼리로 조회합니다. (예: ?core_ids=1,2,3)"""
+    try:
+        ids = [int(core_id) for core_id in core_ids.split(",") if core_id.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="core_ids must be a comma separated list of integers")
+
+    ids_by_shard: Dict[int, List[int]] = {}
+    for core_id in ids:
+        ids_by_shard.setdefault(shard_map.shard_of(core_id), []).append(core_id)
+
+    def query(shard_ids: List[int]):
+        return lambda db: (
+            db.query(EpicRelation, Epic.title)
+            .join(Epic, Epic.id == EpicRelation.sub_epic_id)
+            .filter(EpicRelation.core_epic_id.in_(shard_ids))
+            .order_by(EpicRelation.core_epic_id, EpicRelation.position_row, EpicRelation.position_col)
+            .all()
+        )
+
+    rows = []
+    # shard 번호가 id의 상위 비트이므로 shard 순서대로 이어 붙이면 core_epic_id 순서가 유지됨
+    for shard in sorted(ids_by_shard):
+        try:
+            db = shards.get(shard)
+        except KeyError:
+            # 설정되지 않은 shard의 id는 관계가 없는 것으로 취급
+            continue
+        rows.extend(await _run(db, query(ids_by_shard[shard])))
+    return [
+        {
+            "core_epic_id": rel.core_epic_id,
+            "sub_epic_id": rel.sub_epic_id,
+            "title": title,
+            "position_row": rel.position_row,
+            "position_col": rel.position_col,
+            "depth": rel.depth,
+        }
+        for rel, title in rows
+    ]
 
 @router.get("/api/epic/{core_epic_id}/subs")
-def get_sub_epics(core_epic_id: int, db: Session = Depends(get_db)):
-    relations = db.query(EpicRelation).filter(EpicRelation.core_epic_id == core_epic_id).all()
-    result = []
-    for rel in relations:
-        sub_epic = db.query(Epic).filter(Epic.id == rel.sub_epic_id).first()
-        if sub_epic:
-            result.append({
-                "sub_epic_id": rel.sub_epic_id,
-                "title": sub_epic.title,
-                "position_row": rel.position_row,
-                "position_col": rel.position_col,
-                "depth": rel.depth,
-            })
-    return result
+async def get_sub_epics(core_epic_id: int, shards: ShardSessions = Depends(get_shards)):
+    rows = await _run(session_for(shards, core_epic_id), lambda db: (
+        db.query(EpicRelation, Epic.title)
+        .join(Epic, Epic.id == EpicRelation.sub_epic_id)
+        .filter(EpicRelation.core_epic_id == core_epic_id)
+        .order_by(EpicRelation.position_row, EpicRelation.position_col)
+        .all()
+    ))
+    return [
+        {
+            "sub_epic_id": rel.sub_epic_id,
+            "title": title,
+            "position_row": rel.position_row,
+            "position_col": rel.position_col,
+            "depth": rel.depth,
+        }
+        for rel, title in rows
+    ]
 
 @router.get("/api/epic/{sub_epic_id}/cores")
-def get_core_epics(sub_epic_id: int, db: Session = Depends(get_db)):
-    relations = db.query(EpicRelation).filter(EpicRelation.sub_epic_id == sub_epic_id).all()
-    result = []
-    for rel in relations:
-        core_epic = db.query(Epic).filter(Epic.id == rel.core_epic_id).first()
-        if core_epic:
-            result.append({
-                "core_epic_id": rel.core_epic_id,
-                "title": core_epic.title,
-                "position_row": rel.position_row,
-                "position_col": rel.position_col,
-                "depth": rel.depth,
-            })
-    return result
\ No newline at end of file
+async def get_core_epics(sub_epic_id: int, shards: ShardSessions = Depends(get_shards)):
+    rows = await _run(session_for(shards, sub_epic_id), lambda db: (
+        db.query(EpicRelation, Epic.title)
+        .join(Epic, Epic.id == EpicRelation.core_epic_id)
+        .filter(EpicRelation.sub_epic_id == sub_epic_id)
+        .all()
+    ))
+    return [
+        {
+            "core_epic_id": rel.core_epic_id,
+            "title": title,
+            "position_row": rel.position_row,
+            "position_col": rel.position_col,
+            "depth": rel.depth,
+        }
+        for rel, title in rows
+    ]
@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ..services.metrics import metrics_registry
+
+router = APIRouter(tags=["metrics"])
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def read_metrics():
+    """Prometheus 텍스트 형식의 요청/DB 계측 값"""
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
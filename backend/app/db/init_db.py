@@ -1,23 +1,43 @@
 import logging
+import os
+from alembic import command
+from alembic.config import Config
 from sqlalchemy.orm import Session
-from ..models.base import Base
-from .session import engine
-from ..models.epic import Epic  # Import all models here
+from .session import SQLALCHEMY_DATABASE_URL, engine
+from .sharding import DB_SHARD_URLS, shard_map
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "alembic.ini")
+
+def upgrade(url: str, revision: str = "head") -> None:
+    """url의 DB에 alembic 마이그레이션을 revision까지 적용합니다."""
+    config = Config(ALEMBIC_INI)
+    config.attributes["url"] = url
+    # 이미 설정된 앱 로거를 덮어쓰지 않음
+    config.attributes["configure_logger"] = False
+    command.upgrade(config, revision)
+
 def init_db() -> None:
-    """Initialize the database with all tables."""
+    """배포 시 한 번 실행: 기본 DB와 모든 shard(DB_SHARD_URLS)에 마이그레이션을 적용하고 shard 디렉터리를 등록합니다.
+
+    워커는 시작할 때 DB에 접속하지 않으므로 서버를 띄우기 전에 실행해야 합니다.
+    """
     try:
-        # Create all tables
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database tables created successfully")
+        for url in [SQLALCHEMY_DATABASE_URL, *DB_SHARD_URLS]:
+            upgrade(url)
+            logger.info("Database migrated to head")
+        if DB_SHARD_URLS:
+            shard_map.configure(DB_SHARD_URLS, engine, async_mode=False)
+            with Session(engine) as directory:
+                shards = shard_map.register(directory)
+            logger.info(f"Registered shards: {sorted(shards)}")
     except Exception as e:
-        logger.error(f"Error creating database tables: {e}")
+        logger.error(f"Error migrating database: {e}")
         raise
 
 if __name__ == "__main__":
-    logger.info("Creating initial database tables")
+    logger.info("Applying database migrations")
     init_db()
-    logger.info("Database initialization completed") 
\ No newline at end of file
+    logger.info("Database initialization completed")
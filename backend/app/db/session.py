@@ -1,17 +1,120 @@
-from sqlalchemy import create_engine
+import os
+import time
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.declarative import declarative_base
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./bemorelog.db"
+from ..services.metrics import record_statement
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+# 환경 변수로 DB와 커넥션 풀 설정을 바꿀 수 있습니다
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./bemorelog.db")
+# default: SQLite 기본 저널링, production: WAL 등 동시 쓰기에 맞춘 PRAGMA 적용
+DB_PROFILE = os.getenv("DB_PROFILE", "default")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+# true이면 API가 AsyncSession(aiosqlite/asyncpg)으로 DB에 접근해 이벤트 루프를 막지 않음
+USE_ASYNC_DB = os.getenv("DB_ASYNC", "false").lower() in ("1", "true", "yes")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", str(64 * 1024)))
+
+SQLITE_PRODUCTION_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": SQLITE_BUSY_TIMEOUT_MS,
+    "mmap_size": SQLITE_MMAP_SIZE,
+    # 음수 값은 KiB 단위
+    "cache_size": -SQLITE_CACHE_SIZE_KB,
+}
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRODUCTION_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    record_statement(statement, time.perf_counter() - conn.info["query_start_time"].pop())
+
+def _handle_error(exception_context):
+    start_times = exception_context.connection.info.get("query_start_time") if exception_context.connection else None
+    if start_times:
+        start_times.pop()
+
+def instrument_engine(engine):
+    """요청별 SQL 문 수/DB 시간 측정과 느린 쿼리 로그를 위한 이벤트 훅을 등록합니다."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+    return engine
+
+def create_db_engine(url: str = SQLALCHEMY_DATABASE_URL, profile: str = DB_PROFILE):
+    """URL과 프로필에 맞는 엔진을 생성합니다."""
+    if url.startswith("sqlite"):
+        engine = create_engine(url, connect_args={"check_same_thread": False})
+        if profile == "production":
+            event.listen(engine, "connect", set_sqlite_pragmas)
+        return engine
+
+    return create_engine(
+        url,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+
+def to_async_url(url: str) -> str:
+    """동기 드라이버 URL을 async 드라이버 URL로 바꿉니다."""
+    if url.startswith("sqlite:"):
+        return "sqlite+aiosqlite:" + url[len("sqlite:"):]
+    if url.startswith("postgresql:"):
+        return "postgresql+asyncpg:" + url[len("postgresql:"):]
+    return url
+
+def create_async_db_engine(url: str = SQLALCHEMY_DATABASE_URL, profile: str = DB_PROFILE):
+    """create_db_engine과 같은 설정의 async 엔진을 생성합니다."""
+    async_url = to_async_url(url)
+    if async_url.startswith("sqlite"):
+        # aiosqlite 기본값(NullPool)은 요청마다 새로 연결하므로 풀을 사용
+        engine = create_async_engine(
+            async_url,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+        )
+        if profile == "production":
+            event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+        return engine
+
+    return create_async_engine(
+        async_url,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+
+engine = instrument_engine(create_db_engine())
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# async 드라이버(aiosqlite/asyncpg)는 DB_ASYNC=true일 때만 필요
+async_engine = create_async_db_engine() if USE_ASYNC_DB else None
+if async_engine is not None:
+    instrument_engine(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False) if USE_ASYNC_DB else None
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,243 @@
+import inspect
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.engine import make_url
+
+from ..models.epic import EpicShard
+from .session import USE_ASYNC_DB, create_db_engine, create_async_db_engine, instrument_engine
+
+# 보드(루트 epic)의 하위 트리를 나눠 담을 추가 DB URL (쉼표 구분, SQLite 파일 또는 search_path로 스키마를 고른
+# PostgreSQL URL). 비어 있으면 DATABASE_URL 하나만 사용합니다. 기본 DB는 항상 shard 0입니다.
+DB_SHARD_URLS = [url.strip() for url in os.getenv("DB_SHARD_URLS", "").split(",") if url.strip()]
+# epic id의 상위 비트가 shard 번호: shard k는 (k << DB_SHARD_ID_BITS) + 1부터 id를 발급
+DB_SHARD_ID_BITS = int(os.getenv("DB_SHARD_ID_BITS", "40"))
+# PostgreSQL의 epics.id는 INTEGER
+POSTGRES_MAX_ID = 2**31 - 1
+
+def _directory_url(url: str) -> str:
+    """디렉터리에 기록할 URL (비밀번호 제외)"""
+    return make_url(url).render_as_string(hide_password=True)
+
+def _start_ids(engine, first_id: int) -> None:
+    """비어 있는 shard가 first_id부터 epic id를 발급하도록 시퀀스를 맞춥니다."""
+    with engine.begin() as conn:
+        if conn.dialect.name == "sqlite":
+            conn.execute(
+                text(
+                    "INSERT INTO sqlite_sequence (name, seq) SELECT 'epics', 0 "
+                    "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'epics')"
+                )
+            )
+            conn.execute(
+                text("UPDATE sqlite_sequence SET seq = :seq WHERE name = 'epics' AND seq < :seq"),
+                {"seq": first_id - 1},
+            )
+        elif conn.dialect.name == "postgresql":
+            conn.execute(
+                text(
+                    "SELECT setval(pg_get_serial_sequence('epics', 'id'), :seq) "
+                    "WHERE (SELECT COALESCE(MAX(id), 0) FROM epics) < :seq"
+                ),
+                {"seq": first_id - 1},
+            )
+
+class ShardMap:
+    """보드 단위 shard 라우팅
+
+    보드의 하위 트리는 모두 루트가 만들어진 shard에 있고, epic id의 상위 비트가 shard 번호이므로
+    id만으로 shard를 찾습니다. 새 보드는 기본 DB의 epic_shards 디렉터리에서 보드가 가장 적은 shard에
+    배치합니다. shard 0은 기본 DB이고, 요청에서는 get_session이 주는 세션을 그대로 씁니다.
+
+    configure()는 DB에 접속하지 않습니다. shard 번호는 처음 shard 세션이 필요할 때 디렉터리에서 한 번 읽고,
+    디렉터리 등록과 id 시작값 지정은 배포 시 register()(python -m app.db.init_db)가 합니다.
+    """
+
+    def __init__(self, id_bits: int = DB_SHARD_ID_BITS):
+        self.id_bits = id_bits
+        self.urls: List[str] = []
+        self.directory_bind = None
+        self.async_mode = False
+        self.engines: Dict[int, object] = {}
+        self._urls_by_shard: Optional[Dict[int, str]] = None
+        self._session_factories: Dict[int, Callable] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.urls)
+
+    @property
+    def shards(self) -> List[int]:
+        """설정된 shard 번호 (0 포함)"""
+        return [0, *sorted(self._load())]
+
+    def shard_of(self, epic_id: Optional[int]) -> int:
+        if epic_id is None or not self.enabled or epic_id < 0:
+            return 0
+        return epic_id >> self.id_bits
+
+    def first_id(self, shard: int) -> int:
+        return (shard << self.id_bits) + 1
+
+    def configure(self, urls: List[str], directory_bind, async_mode: bool = USE_ASYNC_DB) -> None:
+        """shard URL과 디렉터리가 있는 기본 DB 엔진을 기록합니다."""
+        self.reset()
+        self.urls = list(urls)
+        self.directory_bind = directory_bind
+        self.async_mode = async_mode
+
+    def reset(self) -> None:
+        for engine in self.engines.values():
+            engine.dispose()
+        self.urls = []
+        self.engines = {}
+        self._urls_by_shard = None
+        self._session_factories = {}
+
+    def register(self, directory: Session) -> Dict[int, str]:
+        """기본 DB(directory)의 epic_shards에 URL을 등록하고, 각 shard가 자기 번호의 id부터 발급하도록 맞춥니다.
+
+        마이그레이션을 적용한 뒤 배포 시 한 번 실행합니다. 이미 등록된 URL은 번호가 유지되므로 URL 순서를 바꾸거나
+        중간 URL을 빼도 기존 epic id가 그대로 라우팅됩니다.
+        """
+        numbers = dict(directory.execute(select(EpicShard.url, EpicShard.shard)).all())
+        if None not in numbers:
+            directory.add(EpicShard(shard=0, url=None, boards=0))
+            numbers[None] = 0
+        for url in self.urls:
+            key = _directory_url(url)
+            if key not in numbers:
+                numbers[key] = max(numbers.values()) + 1
+                directory.add(EpicShard(shard=numbers[key], url=key, boards=0))
+        directory.commit()
+
+        for url in self.urls:
+            shard = numbers[_directory_url(url)]
+            if not url.startswith("sqlite") and self.first_id(shard + 1) - 1 > POSTGRES_MAX_ID:
+                raise ValueError(f"DB_SHARD_ID_BITS={self.id_bits} overflows INTEGER epic ids on shard {shard}")
+            engine = create_db_engine(url)
+            _start_ids(engine, self.first_id(shard))
+            engine.dispose()
+        self._urls_by_shard = None
+        return {numbers[_directory_url(url)]: url for url in self.urls}
+
+    def _load(self) -> Dict[int, str]:
+        """디렉터리에서 shard 번호 -> URL을 읽습니다 (프로세스당 한 번)."""
+        if self._urls_by_shard is None:
+            with self._lock:
+                if self._urls_by_shard is None:
+                    with Session(self.directory_bind) as directory:
+                        numbers = dict(directory.execute(select(EpicShard.url, EpicShard.shard)).all())
+                    unregistered = [url for url in self.urls if _directory_url(url) not in numbers]
+                    if unregistered:
+                        raise RuntimeError(
+                            f"Shard {_directory_url(unregistered[0])} is not registered; run python -m app.db.init_db"
+                        )
+                    self._urls_by_shard = {numbers[_directory_url(url)]: url for url in self.urls}
+        return self._urls_by_shard
+
+    def session_factory(self, shard: int) -> Callable:
+        """shard의 세션 팩토리. 설정되지 않은 shard(삭제된 URL, 잘못된 id)이면 KeyError"""
+        if shard not in self._session_factories:
+            url = self._load()[shard]
+            with self._lock:
+                if shard not in self._session_factories:
+                    engine = instrument_engine(create_db_engine(url))
+                    self.engines[shard] = engine
+                    if self.async_mode:
+                        async_engine = create_async_db_engine(url)
+                        instrument_engine(async_engine.sync_engine)
+                        self._session_factories[shard] = async_sessionmaker(
+                            async_engine, autoflush=False, info={"shard": shard}
+                        )
+                    else:
+                        self._session_factories[shard] = sessionmaker(
+                            autocommit=False, autoflush=False, bind=engine, info={"shard": shard}
+                        )
+        return self._session_factories[shard]
+
+    def place_board(self, directory: Session) -> int:
+        """보드 수가 가장 적은 shard를 골라 보드 수를 늘리고 번호를 반환합니다."""
+        if not self.enabled:
+            return 0
+        shard = directory.execute(
+            select(EpicShard.shard)
+            .where(EpicShard.shard.in_(self.shards))
+            .order_by(EpicShard.boards, EpicShard.shard)
+            .limit(1)
+        ).scalar()
+        directory.execute(update(EpicShard).where(EpicShard.shard == shard).values(boards=EpicShard.boards + 1))
+        directory.commit()
+        return shard
+
+    def release_board(self, directory: Session, shard: int) -> None:
+        """place_board로 늘린 보드 수를 되돌립니다. 보드를 만들지 못한 요청에서 호출합니다."""
+        directory.execute(
+            update(EpicShard).where(EpicShard.shard == shard, EpicShard.boards > 0).values(boards=EpicShard.boards - 1)
+        )
+        directory.commit()
+
+class ShardSessions:
+    """요청 하나에서 쓰는 shard별 세션. shard 0은 기본 세션이고, 나머지는 처음 쓸 때 엽니다."""
+
+    def __init__(self, default, shard_map: ShardMap):
+        self.default = default
+        self.shard_map = shard_map
+        self._opened: Dict[int, object] = {}
+        self._placed: List[int] = []  # 이 요청에서 새 보드를 배치한 shard
+
+    @property
+    def enabled(self) -> bool:
+        return self.shard_map.enabled
+
+    def get(self, shard: int):
+        if shard == 0:
+            return self.default
+        if shard not in self._opened:
+            self._opened[shard] = self.shard_map.session_factory(shard)()
+        return self._opened[shard]
+
+    def for_epic(self, epic_id: Optional[int]):
+        return self.get(self.shard_map.shard_of(epic_id))
+
+    def all(self) -> list:
+        return [self.get(shard) for shard in self.shard_map.shards]
+
+    async def for_new_board(self):
+        """새 보드(루트 epic)를 만들 shard의 세션"""
+        if not self.enabled:
+            return self.default
+        if isinstance(self.default, AsyncSession):
+            shard = await self.default.run_sync(self.shard_map.place_board)
+        else:
+            shard = self.shard_map.place_board(self.default)
+        self._placed.append(shard)
+        return self.get(shard)
+
+    async def release_boards(self) -> None:
+        """요청이 실패하면 for_new_board에서 늘린 보드 수를 되돌립니다.
+
+        보드는 shard DB에, 보드 수는 기본 DB의 디렉터리에 있어 한 트랜잭션으로 묶을 수 없으므로 실패 시 보상합니다.
+        """
+        placed, self._placed = self._placed, []
+        for shard in placed:
+            if isinstance(self.default, AsyncSession):
+                await self.default.rollback()
+                await self.default.run_sync(self.shard_map.release_board, shard)
+            else:
+                self.default.rollback()
+                self.shard_map.release_board(self.default, shard)
+
+    async def close(self) -> None:
+        for db in self._opened.values():
+            closed = db.close()
+            if inspect.isawaitable(closed):
+                await closed
+        self._opened = {}
+
+shard_map = ShardMap()
@@ -1,7 +1,10 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
-from sqlalchemy.sql import func
-from pydantic import BaseModel
-from typing import Optional
+import json
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, LargeBinary, DDL, event, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import func, table, column
+from sqlalchemy.sql.functions import FunctionElement
+from pydantic import BaseModel, Field
+from typing import Dict, Optional, Literal
 from datetime import datetime
 from sqlalchemy.orm import relationship
 from typing import List
@@ -22,6 +25,19 @@ class Epic(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     core_epic_id = Column(Integer, ForeignKey("epics.id"), nullable=True)
+    # 루트부터 자신까지의 id 경로 (예: "/1/5/23/"), 하위 트리/조상 조회용 인덱스
+    path = Column(String, index=True, nullable=True)
+    # 마지막으로 변경된 트랜잭션의 전역 revision (ETag 계산용)
+    revision = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # 하위 트리 버전(count, max(revision))을 인덱스만으로 계산
+        Index("ix_epics_path_revision", "path", "revision"),
+        # 같은 상위 epic 아래에서 그리드 칸은 하나의 epic만 차지 (하위 epic 조회에도 사용)
+        Index("ux_epics_core_position", "core_epic_id", "position", unique=True),
+        # SQLite에서도 id를 재사용하지 않고 sqlite_sequence에서 이어서 발급 (shard별 id 시작값 지정에 사용)
+        {"sqlite_autoincrement": True},
+    )
 
     # One to many relationship with sub_epics
     # core_epic_id가 자신의 id인 epic들을 subs로 가져옴
@@ -37,6 +53,127 @@ class Epic(Base):
         remote_side=[id]
     )
 
+    # 하위 epic 상태별 개수 (EpicService가 쓰기 때마다 증분으로 유지)
+    rollups = relationship("EpicRollupCount", viewonly=True)
+
+# 제목/설명 전문 검색 인덱스. SQLite는 epics를 외부 콘텐츠로 쓰는 FTS5 테이블을 트리거로 동기화하고,
+# PostgreSQL은 생성 컬럼(tsvector)과 GIN 인덱스를 사용합니다. 집합 단위 UPDATE/DELETE에도 자동으로 반영됩니다.
+SEARCH_INDEX_DDL = {
+    "sqlite": [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS epics_fts USING fts5(
+            title, description, content='epics', content_rowid='id', prefix='2 3'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS epics_fts_ai AFTER INSERT ON epics BEGIN
+            INSERT INTO epics_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS epics_fts_ad AFTER DELETE ON epics BEGIN
+            INSERT INTO epics_fts(epics_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+        END
+        """,
+        # path/depth만 바뀌는 이동에서는 인덱스를 건드리지 않음
+        """
+        CREATE TRIGGER IF NOT EXISTS epics_fts_au AFTER UPDATE OF title, description ON epics BEGIN
+            INSERT INTO epics_fts(epics_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+            INSERT INTO epics_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+        END
+        """,
+    ],
+    "postgresql": [
+        """
+        ALTER TABLE epics ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+            to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, ''))
+        ) STORED
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_epics_search_vector ON epics USING gin (search_vector)",
+    ],
+}
+
+# 검색 쿼리에서 사용하는 FTS5 테이블 (rowid = epics.id)
+epics_fts = table("epics_fts", column("rowid", Integer), column("title", String), column("description", String))
+
+for _dialect, _statements in SEARCH_INDEX_DDL.items():
+    for _statement in _statements:
+        event.listen(Epic.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+event.listen(Epic.__table__, "before_drop", DDL("DROP TABLE IF EXISTS epics_fts").execute_if(dialect="sqlite"))
+
+class EpicRevision(Base):
+    """epic을 변경하는 트랜잭션마다 1씩 증가하는 전역 revision 카운터 (단일 행)"""
+    __tablename__ = "epic_revision"
+    id = Column(Integer, primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+class EpicChangeLog(Base):
+    """epic 변경 기록. 삭제된 epic도 tombstone으로 남아 증분 동기화에 사용됩니다."""
+    __tablename__ = "epic_changes"
+    id = Column(Integer, primary_key=True)
+    revision = Column(Integer, nullable=False, index=True)
+    epic_id = Column(Integer, nullable=False)  # 삭제 후에도 남아야 하므로 FK 없음
+    op = Column(String, nullable=False)  # "upsert" | "delete"
+
+class EpicHistory(Base):
+    """epic 편집 기록 (추가만 함). 보드(루트 epic)별로 바뀐 필드만 JSON으로 남겨 특정 시점의 보드를 재구성하는 데 사용됩니다."""
+    __tablename__ = "epic_history"
+    id = Column(Integer, primary_key=True)
+    board_id = Column(Integer, nullable=False)  # 삭제 후에도 남아야 하므로 FK 없음
+    epic_id = Column(Integer, nullable=False)
+    revision = Column(Integer, nullable=False)
+    op = Column(String, nullable=False)  # "create" | "update" | "delete" (하위 트리째 삭제)
+    changes = Column(String, nullable=True)  # create: 전체 필드, update: 바뀐 필드만, delete: NULL
+    changed_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        # 보드별 기록을 순서대로 읽음
+        Index("ix_epic_history_board_id", "board_id", "id"),
+        # 정리(compaction) 후에도 id를 재사용하지 않음 (스냅샷이 history_id로 위치를 가리킴)
+        {"sqlite_autoincrement": True},
+    )
+
+class EpicSnapshot(Base):
+    """보드 전체 상태의 압축 스냅샷. 같은 보드의 history_id까지의 기록이 반영되어 있습니다."""
+    __tablename__ = "epic_snapshots"
+    id = Column(Integer, primary_key=True)
+    board_id = Column(Integer, nullable=False)
+    history_id = Column(Integer, nullable=False)
+    size = Column(Integer, nullable=False)  # 스냅샷의 epic 수
+    data = Column(LargeBinary, nullable=False)  # zlib으로 압축한 JSON 배열
+    taken_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_epic_snapshots_board_id", "board_id", "history_id"),
+    )
+
+class EpicShard(Base):
+    """보드 shard 디렉터리 (기본 DB에만 사용). epic id 상위 비트가 shard 번호이므로 한 번 정한 번호는 바뀌지 않습니다."""
+    __tablename__ = "epic_shards"
+    shard = Column(Integer, primary_key=True)
+    url = Column(String, unique=True, nullable=True)  # NULL: 기본 DB (DATABASE_URL)
+    boards = Column(Integer, nullable=False, default=0)  # 이 shard에 배치한 보드 수
+
+class EpicRollupCount(Base):
+    """epic별 하위 epic(자기 자신 제외)의 상태별 개수. 쓰기 시 조상 체인에 증분으로 반영됩니다."""
+    __tablename__ = "epic_rollups"
+    epic_id = Column(Integer, ForeignKey("epics.id"), primary_key=True)
+    status = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+class json_object_agg(FunctionElement):
+    """(key, value) 쌍을 JSON 객체 하나로 모으는 집계 함수 (PostgreSQL json_object_agg, SQLite json_group_object)"""
+    name = "json_object_agg"
+    inherit_cache = True
+
+@compiles(json_object_agg)
+def _compile_json_object_agg(element, compiler, **kw):
+    return "json_object_agg(%s)" % compiler.process(element.clauses, **kw)
+
+@compiles(json_object_agg, "sqlite")
+def _compile_json_group_object(element, compiler, **kw):
+    return "json_group_object(%s)" % compiler.process(element.clauses, **kw)
+
 class EpicRelation(Base):
     __tablename__ = "epic_relations"
     id = Column(Integer, primary_key=True, index=True)
@@ -46,6 +183,15 @@ class EpicRelation(Base):
     position_col = Column(Integer, nullable=False)
     depth = Column(Integer, nullable=False, default=1)
 
+    __table_args__ = (
+        # 보드 렌더링 시 core epic 기준으로 위치 순서대로 조회
+        Index("ix_epic_relations_core_position", "core_epic_id", "position_row", "position_col"),
+        Index("ix_epic_relations_sub_epic_id", "sub_epic_id"),
+    )
+
+# 3x3 그리드에서 상위 epic 주변 칸의 위치 번호 (시계방향 1~8, 중앙 0은 상위 epic 자신)
+GRID_SLOTS = tuple(range(1, 9))
+
 # Pydantic Models
 class EpicBase(BaseModel):
     title: str
@@ -54,16 +200,20 @@ class EpicBase(BaseModel):
 
 class EpicCreate(EpicBase):
     core_epic_id: Optional[int] = None
-    position: Optional[int] = None
+    position: Optional[int] = Field(None, ge=0, le=8)
 
 class EpicUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     status: Optional[str] = None
     depth: Optional[int] = None
-    position: Optional[int] = None
+    position: Optional[int] = Field(None, ge=0, le=8)
     core_epic_id: Optional[int] = None
 
+class EpicRollup(BaseModel):
+    total: int  # 하위 epic 수 (자기 자신 제외)
+    statuses: Dict[str, int] = {}  # 상태별 하위 epic 수
+
 class EpicResponse(EpicBase):
     id: int
     created_at: datetime
@@ -71,6 +221,7 @@ class EpicResponse(EpicBase):
     depth: int = 0
     position: Optional[int] = None
     core_epic_id: Optional[int] = None
+    rollup: Optional[EpicRollup] = None  # 하위 epic이 없으면 None
     subs: List["EpicResponse"] = []
 
     class Config:
@@ -83,17 +234,105 @@ class EpicRelationCreate(BaseModel):
     position_col: int
     depth: int = 1
 
+# 보드 전체 편집을 한 번에 처리하기 위한 batch 요청/응답 모델
+class EpicBatchOperation(BaseModel):
+    op: Literal["create", "update", "delete"]
+    id: Optional[int] = None  # update/delete 대상 epic id
+    temp_id: Optional[str] = None  # create 시 클라이언트가 붙이는 임시 id
+    core_temp_id: Optional[str] = None  # 같은 batch에서 생성되는 상위 epic의 임시 id
+    data: Optional[dict] = None  # create: EpicCreate, update: EpicUpdate 필드
+
+class EpicBatchRequest(BaseModel):
+    operations: List[EpicBatchOperation]
+
+class EpicBatchResult(BaseModel):
+    op: str
+    id: int
+    temp_id: Optional[str] = None
+    epic: Optional["EpicResponse"] = None
+
+# 하위 트리 삭제 결과 요약
+class EpicDeleteResponse(BaseModel):
+    id: int
+    deleted: int  # 삭제된 epic 수 (자기 자신 포함)
+    deleted_relations: int = 0
+
+# NDJSON export/import 한 줄에 해당하는 레코드 (path, depth는 import 시 다시 계산)
+class EpicExportRecord(EpicBase):
+    id: int
+    core_epic_id: Optional[int] = None
+    position: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+class EpicImportResponse(BaseModel):
+    imported: int  # 생성된 epic 수
+    roots: int  # 대상 위치 바로 아래에 붙은 epic 수
+    core_epic_id: Optional[int] = None
+
+# 전문 검색 결과 모델
+class EpicPathItem(BaseModel):
+    id: int
+    title: Optional[str] = None
+
+class EpicSearchResult(BaseModel):
+    epic: "EpicResponse"  # subs 제외
+    score: float  # 높을수록 관련도가 높음
+    ancestors: List[EpicPathItem] = []  # 루트부터 상위 epic까지
+
+# 하위 트리 이동/칸 교환 요청 모델
+class EpicMove(BaseModel):
+    core_epic_id: Optional[int] = None  # 없으면 루트로 이동
+    position: Optional[int] = Field(None, ge=0, le=8)  # 없으면 새 상위 epic 주변의 빈 칸을 배정
+
+class EpicSwap(BaseModel):
+    first_id: int
+    second_id: int
+
+# 상위 epic 주변 그리드 칸 사용 현황
+class EpicFreeSlots(BaseModel):
+    id: int
+    free: List[int] = []
+    taken: List[int] = []
+
+# 보드 진행률 요약: epic과 바로 아래 epic들의 rollup
+class EpicRollupSummary(BaseModel):
+    id: int
+    title: str
+    status: Optional[str] = None
+    position: Optional[int] = None
+    rollup: Optional[EpicRollup] = None
+    subs: List["EpicRollupSummary"] = []
+
+# 증분 동기화(change feed) 응답 모델
+class EpicChange(BaseModel):
+    revision: int
+    epic_id: int
+    op: str  # "upsert" | "delete"
+    epic: Optional["EpicResponse"] = None  # upsert일 때 현재 상태 (subs 제외)
+
+class EpicChangeFeed(BaseModel):
+    revision: int  # 다음 요청의 since로 사용
+    has_more: bool = False
+    changes: List[EpicChange] = []
+
+def to_epic_rollup(counts: Dict[str, int]) -> Optional[dict]:
+    """{상태: 개수}에서 0 이하를 버리고 상태 이름 순으로 정렬한 rollup dict를 만듭니다. 하위 epic이 없으면 None."""
+    statuses = {status: count for status, count in sorted(counts.items()) if count > 0}
+    if not statuses:
+        return None
+    return {"total": sum(statuses.values()), "statuses": statuses}
+
+def rollup_from_json(value) -> Optional[dict]:
+    """EPIC_ROLLUP_COLUMN 값(SQLite는 JSON 문자열, PostgreSQL은 드라이버가 변환한 dict)을 rollup dict로 바꿉니다."""
+    if isinstance(value, str):
+        value = json.loads(value)
+    return to_epic_rollup(value or {})
+
 # Epic 객체를 EpicResponse로 변환하는 함수
 def to_epic_response(epic: "Epic") -> EpicResponse:
-    # subs가 None이거나 예상과 다른 형태일 때를 대비하여 안전하게 처리
-    subs_list = []
-    if hasattr(epic, 'subs') and epic.subs is not None:
-        try:
-            subs_list = [to_epic_response(sub) for sub in epic.subs]
-        except Exception as e:
-            print(f"Warning: Error processing subs for epic {epic.id}: {e}")
-            subs_list = []
-    
+    subs_list = [to_epic_response(sub) for sub in epic.subs or []]
+
     return EpicResponse(
         id=epic.id,
         title=epic.title,
@@ -104,8 +343,71 @@ def to_epic_response(epic: "Epic") -> EpicResponse:
         core_epic_id=epic.core_epic_id,
         created_at=epic.created_at,
         updated_at=epic.updated_at,
+        rollup=to_epic_rollup({rollup.status: rollup.count for rollup in epic.rollups}),
         subs=subs_list
     )
 
+# subs를 로딩하지 않고 Epic 하나만 EpicResponse로 변환하는 함수
+def to_flat_epic_response(epic: "Epic") -> EpicResponse:
+    return EpicResponse(
+        id=epic.id,
+        title=epic.title,
+        description=epic.description,
+        status=epic.status,
+        depth=epic.depth,
+        position=epic.position,
+        core_epic_id=epic.core_epic_id,
+        created_at=epic.created_at,
+        updated_at=epic.updated_at,
+        rollup=to_epic_rollup({rollup.status: rollup.count for rollup in epic.rollups}),
+        subs=[]
+    )
+
+# 한 번의 쿼리로 가져온 flat epic 목록을 중첩된 EpicResponse 트리로 조립하는 함수
+def build_epic_tree(epics: List["Epic"], root_id: int) -> Optional[EpicResponse]:
+    """subs 관계를 건드리지 않고 core_epic_id만으로 O(n)에 트리를 구성합니다."""
+    nodes = {epic.id: to_flat_epic_response(epic) for epic in epics}
+
+    for epic in epics:
+        if epic.id != root_id and epic.core_epic_id in nodes:
+            nodes[epic.core_epic_id].subs.append(nodes[epic.id])
+
+    return nodes.get(root_id)
+
+# EpicResponse 필드 순서와 같은 컬럼 목록 (ORM 객체 없이 Core row로 응답을 만들 때 사용)
+# rollup은 epic_rollups를 상관 서브쿼리(PK 범위 조회)로 모아 같은 row에 JSON 객체로 가져옵니다.
+EPIC_ROLLUP_COLUMN = (
+    select(json_object_agg(EpicRollupCount.status, EpicRollupCount.count))
+    .where(EpicRollupCount.epic_id == Epic.id, EpicRollupCount.count > 0)
+    .scalar_subquery()
+    .label("rollup")
+)
+EPIC_RESPONSE_FIELDS = ("title", "description", "status", "id", "created_at", "updated_at", "depth", "position", "core_epic_id", "rollup")
+EPIC_RESPONSE_COLUMNS = tuple(getattr(Epic, field) for field in EPIC_RESPONSE_FIELDS[:-1]) + (EPIC_ROLLUP_COLUMN,)
+
+def epic_row_dict(row) -> dict:
+    """EPIC_RESPONSE_COLUMNS 순서의 row를 subs를 제외한 EpicResponse 형식의 dict로 바꿉니다."""
+    node = dict(zip(EPIC_RESPONSE_FIELDS, row))
+    node["rollup"] = rollup_from_json(node["rollup"])
+    return node
+
+def link_epic_dicts(rows) -> dict:
+    """EPIC_RESPONSE_COLUMNS 순서의 row들을 한 번 훑어 subs가 연결된 응답 dict를 만들고 {id: dict}로 반환합니다.
+
+    row 뒤에 추가 컬럼이 있어도 무시합니다. 상위 epic이 나중에 나와도 같은 subs 리스트를 공유하므로 순서와 무관합니다.
+    """
+    nodes = {}
+    subs_by_core = {}
+    for row in rows:
+        node = epic_row_dict(row)
+        node["subs"] = subs_by_core.setdefault(node["id"], [])
+        subs_by_core.setdefault(node["core_epic_id"], []).append(node)
+        nodes[node["id"]] = node
+    return nodes
+
 EpicResponse.update_forward_refs()
+EpicBatchResult.update_forward_refs()
+EpicChange.update_forward_refs()
+EpicSearchResult.update_forward_refs()
+EpicRollupSummary.update_forward_refs()
 
@@ -0,0 +1,180 @@
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+EPIC_CACHE_ENABLED = os.getenv("EPIC_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+EPIC_CACHE_SIZE = int(os.getenv("EPIC_CACHE_SIZE", "1024"))
+EPIC_CACHE_TTL = float(os.getenv("EPIC_CACHE_TTL", "60"))
+
+_MISSING = object()
+
+class CacheBackend(ABC):
+    """캐시 저장소 인터페이스. 다른 저장소를 쓰려면 이 클래스를 상속해 set_backend로 교체합니다."""
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Any:
+        """값이 없으면 _MISSING을 반환합니다."""
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        ...
+
+    @abstractmethod
+    def contains(self, key: Hashable) -> bool:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    def stats(self) -> dict:
+        return {}
+
+class MemoryCacheBackend(CacheBackend):
+    """프로세스 내 LRU + TTL 캐시"""
+
+    def __init__(self, max_size: int = EPIC_CACHE_SIZE, ttl: float = EPIC_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.evictions += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def contains(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        return {"size": len(self._entries), "max_size": self.max_size, "ttl": self.ttl, "evictions": self.evictions}
+
+class EpicCache:
+    """epic 조회 응답 캐시
+
+    각 항목은 조회 전에 DB에서 읽은 버전(ETag 버전)과 함께 저장되고, 조회 시 지금 읽은 버전과 같을 때만 적중합니다.
+    그래서 다른 워커의 쓰기로 DB가 바뀌었거나, 조회 도중 쓰기가 끼어들어 이전 버전으로 저장된 항목은 응답에 쓰이지 않습니다.
+    같은 프로세스의 쓰기는 항목을 바로 지워 메모리를 비웁니다: 각 항목은 응답의 루트 epic path와 함께 저장되며,
+    epic이 바뀌면 그 epic과 조상들의 항목(하위 트리 응답에 해당 epic이 포함됨)과 목록 항목만 무효화합니다.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, enabled: bool = EPIC_CACHE_ENABLED):
+        self.backend = backend or MemoryCacheBackend()
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._keys_by_epic = {}  # epic id -> 해당 epic이 루트인 캐시 키
+        self._key_paths = {}  # 캐시 키 -> 루트 epic path
+        self._list_keys = set()  # 모든 epic을 포함할 수 있는 목록 응답 키
+        self._lock = threading.Lock()
+
+    def set_backend(self, backend: CacheBackend) -> None:
+        self.backend = backend
+        self.clear()
+
+    def get(self, key: Hashable, version: str) -> Any:
+        """version으로 저장된 항목이 있으면 값을, 없거나 다른 버전이면 None을 반환합니다."""
+        if not self.enabled:
+            return None
+        entry = self.backend.get(key)
+        hit = entry is not _MISSING and entry[0] == version
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry[1] if hit else None
+
+    def set(self, key: Hashable, value: Any, version: str, path: Optional[str] = None) -> None:
+        """조회 전에 읽은 version으로 값을 저장합니다. path가 없으면 목록 항목으로 취급합니다."""
+        if not self.enabled or value is None:
+            return
+        self.backend.set(key, (version, value))
+        with self._lock:
+            if path is None:
+                self._list_keys.add(key)
+                return
+            self._key_paths[key] = path
+            epic_id = int(path.strip("/").split("/")[-1])
+            self._keys_by_epic.setdefault(epic_id, set()).add(key)
+            if len(self._key_paths) + len(self._list_keys) > 4 * getattr(self.backend, "max_size", EPIC_CACHE_SIZE):
+                self._prune()
+
+    def invalidate(self, path: str, subtree: bool = False) -> None:
+        """path의 epic과 모든 조상의 항목, 목록 항목을 지웁니다. subtree면 하위 epic 항목도 지웁니다."""
+        epic_ids = [int(epic_id) for epic_id in path.strip("/").split("/") if epic_id]
+        with self._lock:
+            keys = set(self._list_keys)
+            self._list_keys.clear()
+            for epic_id in epic_ids:
+                keys |= self._keys_by_epic.get(epic_id, set())
+            if subtree:
+                keys |= {key for key, key_path in self._key_paths.items() if key_path.startswith(path)}
+            for key in keys:
+                self._forget(key)
+        for key in keys:
+            self.backend.delete(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys_by_epic.clear()
+            self._key_paths.clear()
+            self._list_keys.clear()
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        return {"enabled": self.enabled, "hits": hits, "misses": misses, **self.backend.stats()}
+
+    def _forget(self, key) -> None:
+        self._list_keys.discard(key)
+        path = self._key_paths.pop(key, None)
+        if path:
+            epic_id = int(path.strip("/").split("/")[-1])
+            keys = self._keys_by_epic.get(epic_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_epic[epic_id]
+
+    def _prune(self) -> None:
+        """저장소에서 이미 evict된 키를 인덱스에서 정리합니다."""
+        for key in [key for key in list(self._key_paths) + list(self._list_keys) if not self.backend.contains(key)]:
+            self._forget(key)
+
+epic_cache = EpicCache()
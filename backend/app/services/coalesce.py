@@ -0,0 +1,194 @@
+import asyncio
+import inspect
+import logging
+import os
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.sharding import shard_map
+from .epic import EpicService
+from .epic_async import AsyncEpicService
+
+EPIC_WRITE_COALESCE_MS = int(os.getenv("EPIC_WRITE_COALESCE_MS", "0"))
+EPIC_WRITE_COALESCE_MAX = int(os.getenv("EPIC_WRITE_COALESCE_MAX", "500"))
+EPIC_WRITE_DURABLE = os.getenv("EPIC_WRITE_DURABLE", "true").lower() in ("1", "true", "yes")
+
+# 묶어서 반영하는 필드. 이동/칸 변경은 path와 유니크 인덱스가 걸려 있어 요청마다 바로 반영합니다.
+COALESCABLE_FIELDS = {"title", "description", "status"}
+
+logger = logging.getLogger("app.db.coalesce")
+
+class _WriteBatch:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.updates: Dict[int, dict] = {}
+        self.requests = 0
+        # epic별 결과: commit되면 반영된 epic id 집합으로, 그 epic의 변경이 실패하면 예외로 완료됨
+        self.done: Dict[int, asyncio.Future] = {}
+        # durable=False로만 들어와 아무도 결과를 기다리지 않는 epic (실패하면 로그로 남김)
+        self.unawaited: Set[int] = set()
+        self._loop = loop
+
+    def future(self, epic_id: int) -> asyncio.Future:
+        if epic_id not in self.done:
+            future = self.done[epic_id] = self._loop.create_future()
+            # durable=False 요청만 있으면 아무도 결과를 기다리지 않으므로 예외를 여기서 회수
+            future.add_done_callback(lambda future: future.cancelled() or future.exception())
+        return self.done[epic_id]
+
+class WriteCoalescer:
+    """자동 저장처럼 연달아 들어오는 epic 수정(PUT)을 묶어서 반영하는 group commit
+
+    window 동안 들어온 변경은 epic별로 합쳐지고(필드별로 마지막 값), 모든 epic을 한 트랜잭션과
+    commit 한 번으로 반영합니다. durable 요청은 commit이 끝난 뒤 응답하고, durable이 아니면
+    합쳐진 값으로 바로 응답합니다. 종료 시 close()가 대기 중인 묶음을 바로 반영합니다.
+    """
+
+    def __init__(self, window_ms: int = EPIC_WRITE_COALESCE_MS, max_pending: int = EPIC_WRITE_COALESCE_MAX,
+                 durable: bool = EPIC_WRITE_DURABLE):
+        self.window = window_ms / 1000
+        self.max_pending = max_pending
+        self.durable = durable
+        self.session_factory: Optional[Callable] = None
+        self.flushes = 0
+        self.requests = 0
+        self._batch: Optional[_WriteBatch] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._closing = False
+
+    def configure(self, session_factory: Callable, window_ms: Optional[int] = None, durable: Optional[bool] = None) -> None:
+        """묶음을 반영할 세션 팩토리(Session 또는 AsyncSession)를 지정합니다. window_ms가 0이면 꺼집니다."""
+        self.session_factory = session_factory
+        if window_ms is not None:
+            self.window = window_ms / 1000
+        if durable is not None:
+            self.durable = durable
+        self._closing = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.window > 0 and self.session_factory is not None and not self._closing
+
+    def accepts(self, fields: dict) -> bool:
+        return self.enabled and bool(fields) and set(fields) <= COALESCABLE_FIELDS
+
+    def submit(self, epic_id: int, fields: dict, durable: bool = True) -> asyncio.Future:
+        """변경을 현재 묶음에 합치고, 묶음이 commit되면 반영된 epic id 집합으로 완료되는 future를 반환합니다.
+
+        durable=False이면 호출한 쪽이 결과를 기다리지 않는다는 뜻이며, 반영에 실패하면 버려진 변경을 로그로 남깁니다.
+        """
+        batch = self._batch
+        if batch is None:
+            loop = asyncio.get_running_loop()
+            batch = self._batch = _WriteBatch(loop)
+            self._wake = asyncio.Event()
+            task = loop.create_task(self._flush_after_window(batch, self._wake))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        batch.updates.setdefault(epic_id, {}).update(fields)
+        batch.requests += 1
+        self.requests += 1
+        if durable:
+            batch.unawaited.discard(epic_id)
+        elif epic_id not in batch.done:
+            batch.unawaited.add(epic_id)
+        done = batch.future(epic_id)
+        if len(batch.updates) >= self.max_pending:
+            self._wake.set()
+        return done
+
+    def pending(self, epic_id: int) -> dict:
+        """아직 반영되지 않은, 합쳐진 변경 필드"""
+        return dict(self._batch.updates.get(epic_id, {})) if self._batch else {}
+
+    async def _flush_after_window(self, batch: _WriteBatch, wake: asyncio.Event) -> None:
+        try:
+            await asyncio.wait_for(wake.wait(), self.window)
+        except asyncio.TimeoutError:
+            pass
+        if self._batch is batch:
+            self._batch = None
+        await self._flush(batch)
+
+    async def _flush(self, batch: _WriteBatch) -> None:
+        # 보드 shard마다 한 트랜잭션으로 나눠 동시에 반영 (shard를 나누지 않으면 기본 DB 하나)
+        by_shard: Dict[int, Dict[int, dict]] = {}
+        for epic_id, fields in batch.updates.items():
+            by_shard.setdefault(shard_map.shard_of(epic_id), {})[epic_id] = fields
+        applied: Set[int] = set()
+        failed: Dict[int, Exception] = {}
+        try:
+            for shard_applied, shard_failed in await asyncio.gather(
+                *[self._apply(shard, updates) for shard, updates in by_shard.items()]
+            ):
+                applied |= shard_applied
+                failed.update(shard_failed)
+        except Exception as e:
+            logger.exception("coalesced write of %d epics failed", len(batch.updates))
+            failed = {epic_id: e for epic_id in batch.updates}
+        finally:
+            self.flushes += 1
+        for epic_id in sorted(failed.keys() & batch.unawaited):
+            logger.error("dropped non-durable write to epic %d: %r", epic_id, batch.updates[epic_id])
+        for epic_id, future in batch.done.items():
+            if epic_id in failed:
+                future.set_exception(failed[epic_id])
+            else:
+                future.set_result(applied)
+
+    async def _apply(self, shard: int, updates: Dict[int, dict]) -> Tuple[Set[int], Dict[int, Exception]]:
+        """shard 하나의 변경을 한 트랜잭션으로 반영합니다.
+
+        묶음 전체가 실패하면(한 epic의 잘못된 값 등) epic마다 따로 다시 반영해, 실패한 epic만 예외로 돌려줍니다.
+        반환값은 (반영된 epic id 집합, epic id -> 예외)입니다.
+        """
+        try:
+            session_factory = self.session_factory if shard == 0 else shard_map.session_factory(shard)
+        except KeyError:
+            # 설정되지 않은 shard의 id는 없는 epic과 같음
+            return set(), {}
+        try:
+            return await self._apply_in_session(session_factory, updates), {}
+        except Exception as e:
+            logger.exception("coalesced write of %d epics failed", len(updates))
+            if len(updates) == 1:
+                return set(), {epic_id: e for epic_id in updates}
+        # 실패한 epic을 가려내기 위해 epic마다 따로 다시 반영
+        applied: Set[int] = set()
+        failed: Dict[int, Exception] = {}
+        for epic_id, fields in updates.items():
+            try:
+                applied |= await self._apply_in_session(session_factory, {epic_id: fields})
+            except Exception as e:
+                failed[epic_id] = e
+        return applied, failed
+
+    async def _apply_in_session(self, session_factory: Callable, updates: Dict[int, dict]) -> Set[int]:
+        db = session_factory()
+        try:
+            service = AsyncEpicService(db) if isinstance(db, AsyncSession) else EpicService(db)
+            return set(await service.apply_updates(updates))
+        finally:
+            closed = db.close()
+            if inspect.isawaitable(closed):
+                await closed
+
+    async def close(self) -> None:
+        """새 요청은 바로 반영하도록 바꾸고, 대기 중인 묶음을 window를 기다리지 않고 반영합니다."""
+        self._closing = True
+        if self._wake is not None:
+            self._wake.set()
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "window_ms": self.window * 1000,
+            "durable": self.durable,
+            "requests": self.requests,
+            "flushes": self.flushes,
+        }
+
+epic_write_coalescer = WriteCoalescer()
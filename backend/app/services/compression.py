@@ -0,0 +1,211 @@
+"""
+응답 압축 (Content-Encoding: zstd, br, gzip)
+Accept-Encoding 협상으로 고른 방식으로 RESPONSE_COMPRESSION_MIN_BYTES 이상인 JSON/텍스트 응답을 압축합니다.
+캐시에서 나온 본문(Payload)은 압축 결과를 본문 객체에 붙여 두어, 자주 조회되는 보드는 요청마다 다시 압축하지 않습니다.
+brotli, zstandard가 설치되어 있지 않으면 해당 방식은 건너뛰고 gzip만 사용합니다.
+"""
+
+import os
+import zlib
+from typing import Dict, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from .metrics import measure_compression
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli 미설치 환경
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard 미설치 환경
+    zstandard = None
+
+# 압축 수준: 응답마다 실행되므로 압축률보다 속도를 우선 (캐시된 본문은 한 번만 압축)
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+ZSTD_LEVEL = 3
+
+# 이보다 작은 본문은 압축하지 않음 (헤더/CPU 비용이 줄어드는 바이트보다 큼)
+COMPRESSION_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+# 이보다 큰 본문은 스레드풀에서 압축해 이벤트 루프를 막지 않음
+COMPRESSION_THREADPOOL_BYTES = 64 * 1024
+
+COMPRESSIBLE_TYPES = {"application/json", "application/x-ndjson"}
+
+def _available_encodings() -> tuple:
+    installed = {"gzip": True, "br": brotli is not None, "zstd": zstandard is not None}
+    # 서버 선호 순서 (쉼표로 구분, 비우면 압축하지 않음)
+    configured = os.getenv("RESPONSE_COMPRESSION", "zstd,br,gzip")
+    return tuple(name for name in (item.strip() for item in configured.split(",")) if installed.get(name))
+
+COMPRESSION_ENCODINGS = _available_encodings()
+
+def compress(encoding: str, data: bytes) -> bytes:
+    """본문 전체를 한 번에 압축합니다."""
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # wbits 31 = gzip 헤더
+    return compressor.compress(data) + compressor.flush()
+
+class StreamCompressor:
+    """스트리밍 응답(NDJSON 내보내기 등)을 조각 단위로 압축합니다."""
+
+    def __init__(self, encoding: str):
+        if encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+            self.compress, self.finish = self._compressor.compress, self._compressor.flush
+        elif encoding == "br":
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self.compress, self.finish = self._compressor.process, self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+            self.compress, self.finish = self._compressor.compress, self._compressor.flush
+
+def negotiate(accept_encoding: str, encodings: tuple = COMPRESSION_ENCODINGS) -> Optional[str]:
+    """Accept-Encoding에서 q 값이 가장 높은 방식을 고릅니다. 같으면 서버 선호 순서를 따릅니다."""
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            weights[name.strip()] = quality
+    best, best_quality = None, 0.0
+    for name in encodings:
+        quality = weights.get(name, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+def is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type == "text/event-stream":
+        # SSE는 이벤트마다 바로 전달되어야 하므로 압축하지 않음
+        return False
+    return media_type in COMPRESSIBLE_TYPES or media_type.startswith("text/") or media_type.endswith("+json")
+
+class CompressionMiddleware:
+    """Accept-Encoding에 맞춰 응답 본문을 압축합니다.
+
+    한 번에 보내는 본문이 Payload이면 압축 결과를 본문의 encoded에 저장/재사용하고,
+    여러 조각으로 나뉜 스트리밍 응답은 Content-Length 없이 조각 단위로 압축합니다.
+    압축한 응답의 강한 ETag는 약한 ETag(W/)로 바꿉니다 (표현 바이트가 달라지므로).
+    """
+
+    def __init__(self, app, encodings: tuple = None, min_bytes: int = None):
+        self.app = app
+        self.encodings = COMPRESSION_ENCODINGS if encodings is None else encodings
+        self.min_bytes = COMPRESSION_MIN_BYTES if min_bytes is None else min_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = ""
+        for key, value in scope["headers"]:
+            if key == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = negotiate(accept_encoding, self.encodings) if accept_encoding else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        stream: Optional[StreamCompressor] = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, stream, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                headers = {key.lower(): value for key, value in message.get("headers", [])}
+                if (
+                    message["status"] in (204, 304)
+                    or b"content-encoding" in headers
+                    or not is_compressible(headers.get(b"content-type", b"").decode("latin-1"))
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    # 본문 크기와 스트리밍 여부를 알 때까지 헤더 전송을 미룸
+                    start_message = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if stream is None and start_message is not None:
+                if not more_body:
+                    if len(body) < self.min_bytes:
+                        passthrough = True
+                        await send(start_message)
+                        await send(message)
+                        return
+                    compressed = await self._encode(encoding, body)
+                    await send(self._start(start_message, encoding, len(compressed)))
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+                await send(self._start(start_message, encoding, None))
+                start_message = None
+                stream = StreamCompressor(encoding)
+
+            with measure_compression():
+                chunk = stream.compress(body) if body else b""
+                if not more_body:
+                    chunk += stream.finish()
+            if chunk or not more_body:
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+    async def _encode(self, encoding: str, body: bytes) -> bytes:
+        """본문 전체를 압축합니다. Payload이면 한 번 압축한 결과를 본문 객체에 붙여 두고 재사용합니다."""
+        encoded = getattr(body, "encoded", None)
+        if encoded is not None and encoding in encoded:
+            return encoded[encoding]
+        with measure_compression():
+            if len(body) >= COMPRESSION_THREADPOOL_BYTES:
+                compressed = await run_in_threadpool(compress, encoding, body)
+            else:
+                compressed = compress(encoding, body)
+        if encoded is not None:
+            encoded[encoding] = compressed
+        return compressed
+
+    @staticmethod
+    def _start(message, encoding: str, content_length: Optional[int]):
+        """압축한 응답의 시작 메시지: Content-Encoding/Vary를 붙이고 Content-Length와 ETag를 고칩니다."""
+        headers = []
+        vary = None
+        for key, value in message.get("headers", []):
+            name = key.lower()
+            if name == b"content-length":
+                continue
+            if name == b"vary":
+                vary = value
+                continue
+            if name == b"etag" and not value.startswith(b"W/"):
+                value = b"W/" + value
+            headers.append((key, value))
+        if content_length is not None:
+            headers.append((b"content-length", str(content_length).encode()))
+        headers.append((b"content-encoding", encoding.encode()))
+        headers.append((b"vary", vary + b", Accept-Encoding" if vary else b"Accept-Encoding"))
+        return {**message, "headers": headers}
@@ -1,81 +1,1285 @@
-from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional
+import base64
+import functools
+import json
+import logging
+import os
+import re
+from datetime import datetime
+from sqlalchemy import select, insert, update, literal, literal_column, func, and_, or_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, aliased, selectinload
+from typing import Dict, Iterator, List, Optional
 
-from ..models.epic import Epic, EpicCreate, EpicUpdate, EpicResponse, to_epic_response
+from .cache import epic_cache
+from .events import epic_broker
+from .history import (
+    HISTORY_FIELDS, HISTORY_SNAPSHOT_EVERY, SNAPSHOT_FIELDS, HistoryCompactedError, board_of, build_board_tree, decode_snapshot,
+    encode_changes, encode_snapshot, reachable, replay,
+)
+from .serialization import dumps
+from ..models.epic import (
+    Epic, EpicRelation, EpicDeleteResponse, EpicExportRecord, EpicImportResponse, EpicPathItem, EpicSearchResult, EpicRollupCount, EpicRollupSummary, EpicFreeSlots, EpicMove, epics_fts, EpicRevision, EpicChangeLog, EpicHistory, EpicSnapshot, EpicChange, EpicChangeFeed, EpicCreate, EpicUpdate, EpicResponse, EpicBatchOperation, EpicBatchResult,
+    EPIC_RESPONSE_COLUMNS, EPIC_ROLLUP_COLUMN, to_epic_response, to_flat_epic_response, link_epic_dicts,
+    epic_row_dict, rollup_from_json, GRID_SLOTS,
+)
+
+logger = logging.getLogger("app.events")
+
+def service_method(method):
+    """EpicService의 공개 메서드
+
+    본문은 동기 코드이고 await로 호출하면 그대로 실행합니다. AsyncEpicService는 AsyncSession.run_sync 안에서
+    동기 본문(method.sync)을 직접 호출합니다.
+    """
+    @functools.wraps(method)
+    async def call(self, *args, **kwargs):
+        return method(self, *args, **kwargs)
+
+    call.sync = method
+    return call
+
+def subtree_filter(path: str):
+    """path로 시작하는 모든 epic(자기 자신 포함)을 B-tree 인덱스 범위 조건으로 찾습니다."""
+    # "/1/5/" 로 시작하는 문자열은 모두 ["/1/5/", "/1/50") 범위에 들어갑니다 ('/' 다음 문자가 '0')
+    return and_(Epic.path >= path, Epic.path < path[:-1] + "0")
+
+def ancestor_ids(path: str) -> List[int]:
+    """path에서 자기 자신을 제외한 조상 id 목록을 루트부터 순서대로 반환합니다."""
+    return [int(epic_id) for epic_id in path.strip("/").split("/")[:-1]]
+
+# fields= 로 선택할 수 있는 컬럼 (subs는 include_subs로 제어)
+PROJECTABLE_FIELDS = {
+    "id", "title", "description", "status", "depth", "position",
+    "core_epic_id", "created_at", "updated_at",
+}
+
+def encode_cursor(last_id: int) -> str:
+    """마지막으로 반환한 epic id를 불투명한 커서 문자열로 만듭니다."""
+    return base64.urlsafe_b64encode(json.dumps({"id": last_id}).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(padded))["id"])
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+# 조건(보드/상태/깊이)이 있는 검색에서 관련도 순으로 남기는 최대 후보 수
+SEARCH_MAX_CANDIDATES = int(os.getenv("EPIC_SEARCH_MAX_CANDIDATES", "2000"))
+
+def fts_match_query(q: str) -> Optional[str]:
+    """검색어를 단어별 접두사 검색 FTS5 MATCH 식으로 바꿉니다. ("목표 건강" -> '"목표"* "건강"*')"""
+    terms = [term.replace('"', '""') for term in q.split()]
+    return " ".join(f'"{term}"*' for term in terms) or None
+
+def tsquery(q: str) -> Optional[str]:
+    """검색어를 PostgreSQL 접두사 tsquery 식으로 바꿉니다. ("목표 건강" -> "목표:* & 건강:*")"""
+    terms = [re.sub(r"[^\w]", "", term) for term in q.split()]
+    return " & ".join(f"{term}:*" for term in terms if term) or None
+
+# export/import에서 한 번에 읽고 쓰는 행 수
+TRANSFER_CHUNK_SIZE = 1000
+
+def export_statement(root_path: Optional[str] = None):
+    """export할 epic들을 path 순서(상위 epic이 항상 하위 epic보다 먼저)로 조회합니다."""
+    stmt = select(
+        Epic.id, Epic.core_epic_id, Epic.title, Epic.description, Epic.status,
+        Epic.position, Epic.created_at, Epic.updated_at,
+    ).order_by(Epic.path)
+    if root_path:
+        stmt = stmt.where(subtree_filter(root_path))
+    # 서버 측 커서로 일정 크기씩만 가져와 보드 크기와 관계없이 메모리 사용량을 일정하게 유지
+    return stmt.execution_options(yield_per=TRANSFER_CHUNK_SIZE)
+
+def to_ndjson(rows) -> bytes:
+    """조회한 행들을 NDJSON 바이트로 변환합니다."""
+    lines = []
+    for row in rows:
+        record = dict(row._mapping)
+        for field in ("created_at", "updated_at"):
+            if record[field] is not None:
+                record[field] = record[field].isoformat()
+        lines.append(json.dumps(record, ensure_ascii=False))
+    return ("\n".join(lines) + "\n").encode() if lines else b""
+
+async def iter_ndjson_records(chunks):
+    """업로드 본문을 청크 단위로 읽으면서 NDJSON 한 줄씩 dict로 반환합니다."""
+    buffer = b""
+    async for chunk in chunks:
+        *lines, buffer = (buffer + chunk).split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+    if buffer.strip():
+        yield json.loads(buffer)
+
+class PositionConflictError(ValueError):
+    """요청한 그리드 칸이 이미 차 있거나 빈 칸이 없을 때 발생합니다."""
+
+class _ImportNode:
+    __slots__ = ("source_id", "id", "path", "depth")
+
+    def __init__(self, source_id: Optional[int], epic_id: Optional[int], path: Optional[str], depth: int):
+        self.source_id = source_id  # export 파일의 원래 id
+        self.id = epic_id
+        self.path = path
+        self.depth = depth
+
+class EpicImportState:
+    """청크 단위 import 사이에 유지하는 상태
+
+    export는 path 순서이므로 현재 행의 조상들만 스택에 들고 있으면 상위 epic의 새 id를 찾을 수 있습니다.
+    메모리 사용량은 전체 행 수가 아니라 트리 깊이와 청크 크기에 비례합니다.
+    """
+
+    def __init__(self, target: _ImportNode, revision: int):
+        self.target = target  # import한 루트들을 붙일 위치
+        self.revision = revision
+        self.stack: List[_ImportNode] = []
+        self.imported = 0
+        self.roots = 0
+        self.taken_slots = set()  # 대상 epic 아래에서 이미 쓰이는 그리드 칸
+        self.boards = set()  # 편집 기록을 남긴 보드 (끝날 때 스냅샷 필요 여부 확인)
 
 class EpicService:
     def __init__(self, db: Session):
         self.db = db
+        # commit 후 무효화할 캐시 항목 (path, 하위 트리 포함 여부)
+        self._invalidations = []
+        # 현재 트랜잭션에서 발급받은 revision
+        self._revision = None
+        # commit 후 구독자에게 보낼 변경 이벤트
+        self._events = []
+        # commit 전에 epic_rollups에 반영할 (조상 id, 상태) -> 개수 증감
+        self._rollup_deltas = {}
+        # commit 직전에 epic_history에 추가할 편집 기록
+        self._history = []
+        # 보드 shard 번호. 목록/검색 캐시는 shard마다 따로 둠 (epic id는 shard 사이에서도 겹치지 않음)
+        self._shard = db.info.get("shard", 0)
+
+    def _publish(self, op: str, epic_id: int, path: str, old_path: Optional[str] = None):
+        """op: upsert | move | delete (move/delete는 하위 트리 전체에 적용)"""
+        routing_paths = [path] if old_path is None else [path, old_path]
+        self._events.append({"op": op, "epic_id": epic_id, "path": path, "routing_paths": routing_paths})
+
+    def _write_revision(self) -> int:
+        """현재 트랜잭션의 revision을 발급합니다. 트랜잭션당 한 번만 카운터를 증가시킵니다."""
+        if self._revision is None:
+            revision = self.db.execute(
+                update(EpicRevision)
+                .where(EpicRevision.id == 1)
+                .values(value=EpicRevision.value + 1)
+                .returning(EpicRevision.value),
+                execution_options={"synchronize_session": False},
+            ).scalar()
+            if revision is None:
+                revision = 1
+                self.db.add(EpicRevision(id=1, value=revision))
+                self.db.flush()
+            self._revision = revision
+        return self._revision
+
+    def _record_changes(self, epic_ids: List[int], op: str):
+        """변경된 epic들을 현재 revision으로 change log에 기록합니다."""
+        if epic_ids:
+            revision = self._write_revision()
+            self.db.execute(
+                insert(EpicChangeLog),
+                [{"revision": revision, "epic_id": epic_id, "op": op} for epic_id in epic_ids],
+            )
+
+    def _record_matching_changes(self, condition, op: str):
+        """조건에 맞는 epic들의 변경 기록을 INSERT ... SELECT 한 번으로 남깁니다."""
+        revision = self._write_revision()
+        self.db.execute(
+            insert(EpicChangeLog).from_select(
+                ["revision", "epic_id", "op"],
+                select(literal(revision), Epic.id, literal(op)).where(condition),
+            )
+        )
+
+    def _record_history(self, board_id: int, epic_id: int, op: str, changes: Optional[dict] = None, at: Optional[datetime] = None):
+        """편집 기록 한 건을 모아 둡니다. commit 직전에 한 번에 INSERT합니다."""
+        self._history.append({
+            "board_id": board_id,
+            "epic_id": epic_id,
+            "revision": self._write_revision(),
+            "op": op,
+            "changes": encode_changes(changes),
+            "changed_at": at or datetime.now(),
+        })
+
+    def _history_state(self, db_epic: Epic) -> dict:
+        return {field: getattr(db_epic, field) for field in HISTORY_FIELDS}
+
+    def _record_created(self, db_epic: Epic, at: Optional[datetime] = None, **extra):
+        """새 epic의 값이 있는 필드를 생성 기록으로 남깁니다. 생성 시각은 따로 주지 않으면 기록 시각을 사용합니다."""
+        changes = {field: value for field, value in self._history_state(db_epic).items() if value is not None}
+        self._record_history(board_of(db_epic.path), db_epic.id, "create", {**changes, **extra}, at)
 
-    async def create_epic(self, epic: EpicCreate) -> EpicResponse:
+    def _record_updated(self, db_epic: Epic, before: dict, before_path: str, at: datetime):
+        """변경 전 필드(before)와 비교해 바뀐 필드만 기록합니다. 다른 보드로 옮겨졌으면 새 보드에 생성으로 기록합니다."""
+        if board_of(db_epic.path) != board_of(before_path):
+            self._record_created(db_epic, at, created_at=db_epic.created_at, updated_at=at)
+            return
+        changes = {field: value for field, value in self._history_state(db_epic).items() if value != before[field]}
+        if changes:
+            self._record_history(board_of(db_epic.path), db_epic.id, "update", changes, at)
+
+    def _flush_history(self, snapshot: bool = True) -> set:
+        """모아 둔 편집 기록을 INSERT 한 번(executemany)으로 반영하고, 기록된 보드 id들을 반환합니다.
+
+        snapshot이면 기록이 충분히 쌓인 보드의 스냅샷을 함께 남깁니다.
+        """
+        rows, self._history = self._history, []
+        if not rows:
+            return set()
+        self.db.execute(insert(EpicHistory), rows)
+        boards = {row["board_id"] for row in rows}
+        if snapshot:
+            for board_id in sorted(boards):
+                self._snapshot_if_due(board_id)
+        return boards
+
+    def _snapshot_if_due(self, board_id: int):
+        """마지막 스냅샷 이후 기록이 HISTORY_SNAPSHOT_EVERY와 보드 크기 중 큰 값 이상 쌓였으면 스냅샷을 남깁니다.
+
+        재구성 시 적용할 기록 수가 스냅샷 크기에 묶이고, 스냅샷 비용은 기록 한 건당 일정하게 나뉩니다.
+        """
+        last = self.db.execute(
+            select(EpicSnapshot.history_id, EpicSnapshot.size)
+            .where(EpicSnapshot.board_id == board_id)
+            .order_by(EpicSnapshot.history_id.desc())
+            .limit(1)
+        ).first()
+        since, size = last or (0, 0)
+        threshold = max(HISTORY_SNAPSHOT_EVERY, size)
+        # (board_id, id) 인덱스 범위에서 threshold개까지만 셈
+        pending = self.db.execute(
+            select(func.count()).select_from(
+                select(EpicHistory.id)
+                .where(EpicHistory.board_id == board_id, EpicHistory.id > since)
+                .limit(threshold)
+                .subquery()
+            )
+        ).scalar()
+        if pending >= threshold:
+            self._take_snapshot(board_id)
+
+    def _take_snapshot(self, board_id: int):
+        """보드의 현재 epic 전체를 path 범위 조회 한 번으로 읽어 압축 스냅샷으로 저장합니다."""
+        self.db.flush()
+        rows = self.db.execute(
+            select(*[getattr(Epic, field) for field in SNAPSHOT_FIELDS])
+            .where(subtree_filter(f"/{board_id}/"))
+            .order_by(Epic.id)
+        ).all()
+        history_id = self.db.execute(
+            select(func.max(EpicHistory.id)).where(EpicHistory.board_id == board_id)
+        ).scalar()
+        self.db.execute(insert(EpicSnapshot).values(
+            board_id=board_id, history_id=history_id or 0, size=len(rows), data=encode_snapshot(rows), taken_at=datetime.now(),
+        ))
+
+    def _board_state_at(self, board_id: int, at: datetime):
+        """at 시점의 보드 상태를 그 이전의 가장 가까운 스냅샷과 이후 기록으로 재구성합니다.
+
+        (상태 {epic id: 필드}, 마지막으로 반영한 history id, 적용한 기록 수)를 반환합니다.
+        """
+        snapshot = self.db.execute(
+            select(EpicSnapshot.history_id, EpicSnapshot.data)
+            .where(EpicSnapshot.board_id == board_id, EpicSnapshot.taken_at <= at)
+            .order_by(EpicSnapshot.history_id.desc())
+            .limit(1)
+        ).first()
+        if snapshot is None:
+            state, since = {}, 0
+            # 가장 오래된 스냅샷 이전의 기록이 정리되었으면 처음부터 재구성할 수 없음
+            oldest = self.db.execute(
+                select(func.min(EpicSnapshot.history_id)).where(EpicSnapshot.board_id == board_id)
+            ).scalar()
+            if oldest is not None:
+                earliest = self.db.execute(
+                    select(func.min(EpicHistory.id)).where(EpicHistory.board_id == board_id)
+                ).scalar()
+                if earliest is None or earliest > oldest:
+                    raise HistoryCompactedError(f"History of board {board_id} before {at.isoformat()} has been compacted")
+        else:
+            state, since = decode_snapshot(snapshot.data), snapshot.history_id
+        rows = self.db.execute(
+            select(EpicHistory.id, EpicHistory.epic_id, EpicHistory.op, EpicHistory.changes, EpicHistory.changed_at)
+            .where(EpicHistory.board_id == board_id, EpicHistory.id > since, EpicHistory.changed_at <= at)
+            .order_by(EpicHistory.id)
+        ).all()
+        replay(state, (row[1:] for row in rows))
+        return state, rows[-1].id if rows else since, len(rows)
+
+    def _adjust_rollups(self, path: str, counts: Dict[Optional[str], int], sign: int = 1):
+        """path의 조상들(자기 자신 제외)의 상태별 하위 epic 수에 counts를 더하거나(sign=1) 뺍니다."""
+        if not path:
+            return
+        for ancestor_id in ancestor_ids(path):
+            for status, count in counts.items():
+                key = (ancestor_id, status or "")
+                self._rollup_deltas[key] = self._rollup_deltas.get(key, 0) + sign * count
+
+    def _change_status_rollups(self, db_epic: Epic, status: Optional[str]):
+        if status != db_epic.status:
+            self._adjust_rollups(db_epic.path, {db_epic.status: 1}, -1)
+            self._adjust_rollups(db_epic.path, {status: 1})
+
+    def _subtree_status_counts(self, path: str) -> Dict[Optional[str], int]:
+        """자기 자신을 포함한 하위 트리의 상태별 epic 수 (path 범위 GROUP BY 한 번)"""
+        return dict(self.db.execute(
+            select(Epic.status, func.count()).where(subtree_filter(path)).group_by(Epic.status)
+        ).all())
+
+    def _flush_rollups(self):
+        """모아 둔 증감을 (epic_id, status) upsert 한 번(executemany)으로 반영합니다."""
+        deltas = [
+            {"epic_id": epic_id, "status": status, "count": delta}
+            for (epic_id, status), delta in self._rollup_deltas.items()
+            if delta
+        ]
+        self._rollup_deltas = {}
+        if not deltas:
+            return
+        dialect_insert = postgresql.insert if self.db.get_bind().dialect.name == "postgresql" else sqlite.insert
+        statement = dialect_insert(EpicRollupCount)
+        self.db.connection().execute(
+            statement.on_conflict_do_update(
+                index_elements=[EpicRollupCount.epic_id, EpicRollupCount.status],
+                set_={"count": EpicRollupCount.count + statement.excluded.count},
+            ),
+            deltas,
+        )
+
+    def _invalidate(self, path: Optional[str], subtree: bool = False):
+        if path:
+            self._invalidations.append((path, subtree))
+
+    def _commit(self):
+        """commit 후 변경된 epic과 조상들의 캐시 항목을 무효화합니다."""
+        committed = False
+        try:
+            self._flush_rollups()
+            self._flush_history()
+            self.db.commit()
+            committed = True
+        finally:
+            revision, self._revision = self._revision, None
+            invalidations, self._invalidations = self._invalidations, []
+            events, self._events = self._events, []
+            for path, subtree in invalidations:
+                epic_cache.invalidate(path, subtree)
+            if committed and events:
+                for event in events:
+                    event["revision"] = revision
+                try:
+                    epic_broker.publish(events)
+                except Exception:
+                    # 이미 commit된 쓰기이므로 알림 실패로 요청을 실패시키지 않음 (구독자는 변경 피드로 따라잡음)
+                    logger.exception("publishing %d epic events failed", len(events))
+
+    @service_method
+    def create_epic(self, epic: EpicCreate, allocate_position: bool = False) -> EpicResponse:
+        """epic을 만듭니다. allocate_position이면 상위 epic 주변의 비어 있는 가장 작은 칸을 배정합니다."""
         # core_epic_id가 있을 때 depth 값을 자동으로 설정
         epic_data = epic.dict()
+        parent_path = "/"
         if epic.core_epic_id:
             core_epic = self.db.query(Epic).filter(Epic.id == epic.core_epic_id).first()
             epic_data['depth'] = core_epic.depth + 1 if core_epic else 0
+            if core_epic and core_epic.path:
+                parent_path = core_epic.path
         
+        epic_data['revision'] = self._write_revision()
+        if allocate_position:
+            # revision 카운터 행을 갱신해 쓰기가 직렬화된 뒤에 칸을 고르므로 동시 요청이 같은 칸을 받지 않음
+            # (그래도 겹치면 (core_epic_id, position) 유니크 인덱스가 막음)
+            epic_data['position'] = self._allocate_slot(epic.core_epic_id)
         db_epic = Epic(**epic_data)
         self.db.add(db_epic)
-        self.db.commit()
+        # id가 발급된 뒤에 path를 채웁니다
+        self.db.flush()
+        db_epic.path = f"{parent_path}{db_epic.id}/"
+        self._adjust_rollups(db_epic.path, {db_epic.status: 1})
+        self._invalidate(db_epic.path)
+        self._record_changes([db_epic.id], "upsert")
+        self._record_created(db_epic)
+        self._publish("upsert", db_epic.id, db_epic.path)
+        self._commit()
         self.db.refresh(db_epic)
         return to_epic_response(db_epic)
 
-    async def get_epics(self, skip: int = 0, limit: int = 100) -> List[EpicResponse]:
-        epics = self.db.query(Epic).options(joinedload(Epic.subs)).offset(skip).limit(limit).all()
-        return [to_epic_response(epic) for epic in epics]
+    @service_method
+    def get_epics(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_subs: bool = True,
+        fields: Optional[List[str]] = None,
+        version: Optional[str] = None,
+    ):
+        """cursor가 주어지면 id 기준 keyset 페이지네이션, 아니면 기존 skip/limit 방식으로 조회합니다.
+
+        (epic 목록, 다음 페이지가 있으면 커서용 마지막 id 아니면 None)을 반환합니다. fields가 없으면 목록은
+        List[EpicResponse]와 같은 형식으로 미리 인코딩된 JSON 바이트입니다.
+        version은 조회 전에 읽은 get_list_version 값이며, 없으면 여기서 읽습니다 (캐시 항목 검증용).
+        """
+        version = version or EpicService.get_list_version.sync(self)
+        cache_key = ("list", self._shard, skip, limit, cursor, include_subs, tuple(fields) if fields is not None else None)
+        cached = epic_cache.get(cache_key, version)
+        if cached is not None:
+            return cached
+        epics = self._get_epics(skip, limit, cursor, include_subs, fields)
+        epic_cache.set(cache_key, epics, version)
+        return epics
+
+    def _get_epics(self, skip, limit, cursor, include_subs, fields):
+        query = select(*EPIC_RESPONSE_COLUMNS, Epic.path).order_by(Epic.id)
+        if cursor is not None:
+            query = query.where(Epic.id > decode_cursor(cursor))
+        elif skip:
+            query = query.offset(skip)
+
+        if fields is not None:
+            unknown = set(fields) - PROJECTABLE_FIELDS
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+            # 한 행을 더 읽어 다음 페이지가 있는지 확인
+            rows = self.db.execute(query.with_only_columns(*[getattr(Epic, field) for field in fields]).limit(limit + 1)).all()
+            next_id = rows[limit - 1].id if len(rows) > limit and "id" in fields else None
+            return [dict(row._mapping) for row in rows[:limit]], next_id
+
+        page = self.db.connection().execute(query.limit(limit + 1)).all()
+        next_id = page[limit - 1].id if len(page) > limit else None
+        page = page[:limit]
+        if not include_subs:
+            return dumps([{**epic_row_dict(row), "subs": []} for row in page]), next_id
+
+        # 페이지 epic들의 하위 트리를 페이지 조회를 부분 쿼리로 한 path 범위 join 한 번으로 가져와 중첩 dict로 조립
+        # (epic마다 OR 조건을 붙이면 limit이 클 때 SQLite 식 깊이 제한에 걸림)
+        roots = query.with_only_columns(Epic.path.label("root_path")).limit(limit).subquery()
+        member = aliased(Epic)
+        subtree_ids = select(member.id).join(roots, and_(
+            member.path >= roots.c.root_path,
+            member.path < func.substr(roots.c.root_path, 1, func.length(roots.c.root_path) - 1).concat("0"),
+        ))
+        rows = self.db.connection().execute(
+            select(*EPIC_RESPONSE_COLUMNS).where(Epic.id.in_(subtree_ids)).order_by(Epic.id)
+        ).all() if page else []
+        nodes = link_epic_dicts(rows)
+        return dumps([nodes[row.id] for row in page]), next_id
+
+    @service_method
+    def get_epic(self, epic_id: int, version: Optional[str] = None) -> Optional[bytes]:
+        """epic 하나를 하위 epic 전체를 포함한 EpicResponse JSON 바이트로 반환합니다. (tree 조회와 같은 응답)"""
+        return EpicService.get_epic_tree.sync(self, epic_id, version=version)
+
+    @service_method
+    def get_epic_tree(self, epic_id: int, max_depth: Optional[int] = None, version: Optional[str] = None) -> Optional[bytes]:
+        """core_epic_id에 대한 재귀 CTE 한 번으로 하위 트리 전체를 조회해 EpicResponse JSON 바이트로 반환합니다.
+
+        version은 조회 전에 읽은 get_subtree_version 값이며, 없으면 여기서 읽습니다 (캐시 항목 검증용).
+        """
+        if version is None:
+            version = EpicService.get_subtree_version.sync(self, epic_id)
+            if version is None:
+                return None
+        cache_key = ("tree", epic_id, max_depth)
+        cached = epic_cache.get(cache_key, version)
+        if cached is not None:
+            return cached
+
+        tree = (
+            select(Epic.id, literal(0).label("level"))
+            .where(Epic.id == epic_id)
+            .cte("epic_tree", recursive=True)
+        )
+        children = select(Epic.id, (tree.c.level + 1).label("level")).join(
+            tree, Epic.core_epic_id == tree.c.id
+        )
+        if max_depth is not None:
+            children = children.where(tree.c.level < max_depth)
+        tree = tree.union_all(children)
+
+        # ORM 객체와 pydantic 모델을 거치지 않고 필요한 컬럼만 Core row로 읽어 바로 인코딩
+        rows = self.db.connection().execute(
+            select(*EPIC_RESPONSE_COLUMNS, Epic.path)
+            .join(tree, Epic.id == tree.c.id)
+            .order_by(Epic.id)
+        ).all()
+        root = next((row for row in rows if row.id == epic_id), None)
+        if root is None:
+            return None
+        content = dumps(link_epic_dicts(rows)[epic_id])
+        epic_cache.set(cache_key, content, version, root.path)
+        return content
+
+    def _taken_slots(self, core_epic_id: int) -> List[int]:
+        """(core_epic_id, position) 인덱스만으로 상위 epic 아래에서 사용 중인 칸을 조회합니다."""
+        return list(self.db.execute(
+            select(Epic.position)
+            .where(Epic.core_epic_id == core_epic_id, Epic.position.is_not(None))
+            .order_by(Epic.position)
+        ).scalars())
+
+    def _allocate_slot(self, core_epic_id: Optional[int]) -> int:
+        if core_epic_id is None:
+            raise ValueError("allocate_position requires core_epic_id")
+        taken = set(self._taken_slots(core_epic_id))
+        slot = next((slot for slot in GRID_SLOTS if slot not in taken), None)
+        if slot is None:
+            raise PositionConflictError(f"No free position under epic {core_epic_id}")
+        return slot
 
-    async def get_epic(self, epic_id: int) -> Optional[EpicResponse]:
-        epic = self.db.query(Epic).options(joinedload(Epic.subs)).filter(Epic.id == epic_id).first()
-        if epic:
-            return to_epic_response(epic)
-        return None 
+    @service_method
+    def get_free_slots(self, epic_id: int) -> Optional[EpicFreeSlots]:
+        """epic 주변 그리드 칸 중 비어 있는 칸과 사용 중인 칸을 반환합니다."""
+        subtree = self._subtree_version(epic_id)
+        if subtree is None:
+            return None
+        version, path = subtree
+        cache_key = ("free-slots", epic_id)
+        cached = epic_cache.get(cache_key, version)
+        if cached is not None:
+            return cached
+        taken = self._taken_slots(epic_id)
+        slots = EpicFreeSlots(id=epic_id, free=[slot for slot in GRID_SLOTS if slot not in taken], taken=taken)
+        epic_cache.set(cache_key, slots, version, path)
+        return slots
+
+    @service_method
+    def get_rollup(self, epic_id: int) -> Optional[EpicRollupSummary]:
+        """epic과 바로 아래 epic들의 진행률(rollup)을 미리 계산된 값으로 한 번에 조회합니다."""
+        version = EpicService.get_subtree_version.sync(self, epic_id)
+        if version is None:
+            return None
+        cache_key = ("rollup", epic_id)
+        cached = epic_cache.get(cache_key, version)
+        if cached is not None:
+            return cached
+
+        rows = self.db.execute(
+            select(Epic.id, Epic.title, Epic.status, Epic.position, Epic.core_epic_id, Epic.path, EPIC_ROLLUP_COLUMN)
+            .where(or_(Epic.id == epic_id, Epic.core_epic_id == epic_id))
+            .order_by(Epic.position, Epic.id)
+        ).all()
+        root = next((row for row in rows if row.id == epic_id), None)
+        if root is None:
+            return None
+        summaries = {
+            row.id: EpicRollupSummary(
+                id=row.id, title=row.title, status=row.status, position=row.position, rollup=rollup_from_json(row.rollup)
+            )
+            for row in rows
+        }
+        summary = summaries[epic_id]
+        summary.subs = [summaries[row.id] for row in rows if row.id != epic_id]
+        epic_cache.set(cache_key, summary, version, root.path)
+        return summary
+
+    @service_method
+    def get_list_version(self) -> str:
+        """epic 목록 ETag: epic이 바뀔 때마다 증가하는 전역 revision
+
+        다른 워커의 변경도 반영되도록 프로세스 캐시에 두지 않고 매번 DB에서 읽습니다 (단일 행 조회).
+        """
+        revision = self.db.query(EpicRevision.value).filter(EpicRevision.id == 1).scalar()
+        return f'"l{revision or 0}"'
+
+    @service_method
+    def get_subtree_version(self, epic_id: int) -> Optional[str]:
+        """하위 트리 ETag: (epic 수, 최대 revision)을 (path, revision) 인덱스 범위 조회 한 번으로 계산
+
+        다른 워커의 변경도 반영되도록 프로세스 캐시에 두지 않고 매번 DB에서 읽습니다.
+        """
+        subtree = self._subtree_version(epic_id)
+        return subtree[0] if subtree else None
+
+    def _subtree_version(self, epic_id: int):
+        """(하위 트리 ETag, 루트 path)를 반환합니다. epic이 없으면 None"""
+        root_path = select(Epic.path).where(Epic.id == epic_id).scalar_subquery()
+        count, revision, path = (
+            self.db.query(func.count(), func.max(Epic.revision), root_path)
+            .filter(Epic.path >= root_path, Epic.path < func.substr(root_path, 1, func.length(root_path) - 1) + "0")
+            .one()
+        )
+        if not count:
+            return None
+        return f'"e{epic_id}-{count}-{revision}"', path
+
+    @service_method
+    def get_changes(self, since: int = 0, limit: int = 1000) -> EpicChangeFeed:
+        """since 이후의 변경 사항을 epic별 최신 상태로 묶어 반환합니다. revision 단위로 잘라서 페이지를 나눕니다."""
+        rows = (
+            self.db.query(EpicChangeLog)
+            .filter(EpicChangeLog.revision > since)
+            .order_by(EpicChangeLog.revision, EpicChangeLog.id)
+            .limit(limit + 1)
+            .all()
+        )
+        has_more = len(rows) > limit
+        if has_more:
+            # 마지막 revision이 잘리지 않도록 완전한 revision까지만 반환
+            cut_revision = rows[limit].revision
+            rows = [row for row in rows[:limit] if row.revision != cut_revision]
+            if not rows:
+                rows = (
+                    self.db.query(EpicChangeLog)
+                    .filter(EpicChangeLog.revision == cut_revision)
+                    .order_by(EpicChangeLog.id)
+                    .all()
+                )
+
+        if rows:
+            revision = rows[-1].revision
+        else:
+            revision = max(since, self.db.query(EpicRevision.value).filter(EpicRevision.id == 1).scalar() or 0)
+
+        latest = {}
+        for row in rows:
+            latest.pop(row.epic_id, None)
+            latest[row.epic_id] = row
+        upsert_ids = [epic_id for epic_id, row in latest.items() if row.op == "upsert"]
+        epics = {
+            epic.id: epic
+            for epic in self.db.query(Epic).options(selectinload(Epic.rollups)).filter(Epic.id.in_(upsert_ids)).all()
+        } if upsert_ids else {}
+
+        changes = []
+        for epic_id, row in latest.items():
+            epic = epics.get(epic_id)
+            if row.op == "upsert" and epic is not None:
+                changes.append(EpicChange(revision=row.revision, epic_id=epic_id, op="upsert", epic=to_flat_epic_response(epic)))
+            else:
+                # 이후 revision에서 삭제된 epic은 tombstone으로 내려줌
+                changes.append(EpicChange(revision=row.revision, epic_id=epic_id, op="delete"))
+        return EpicChangeFeed(revision=revision, has_more=has_more, changes=changes)
+
+    @service_method
+    def get_board_at(self, board_id: int, at: datetime) -> Optional[bytes]:
+        """보드(루트 epic)를 at 시점의 모습으로 재구성해 /tree와 같은 형식의 JSON 바이트로 반환합니다.
+
+        그 시점에 보드가 없었으면 None을 반환하고, 기록이 정리된 시점이면 HistoryCompactedError가 발생합니다.
+        rollup은 재구성한 트리에서 계산하고, 생성 시각은 기록 시각을 사용합니다.
+        """
+        if at.tzinfo is not None:
+            # 기록 시각은 서버 현지 시각(datetime.now())으로 저장됨
+            at = at.astimezone().replace(tzinfo=None)
+        state, _, _ = self._board_state_at(board_id, at)
+        tree = build_board_tree(state, board_id)
+        return dumps(tree) if tree is not None else None
+
+    @service_method
+    def compact_history(self, before: datetime) -> dict:
+        """before 이전의 편집 기록을 보드마다 before 시점 스냅샷 하나로 합치고 더 오래된 기록과 스냅샷을 지웁니다.
+
+        before 이후 시점은 그대로 재구성할 수 있고 그 이전 시점은 재구성할 수 없게 됩니다.
+        before 시점에 없던 보드(삭제됨)는 이후 기록도 없으면 기록을 모두 지웁니다.
+        """
+        boards = set(self.db.execute(
+            select(EpicHistory.board_id).where(EpicHistory.changed_at <= before).distinct()
+        ).scalars())
+        boards |= set(self.db.execute(
+            select(EpicSnapshot.board_id).where(EpicSnapshot.taken_at <= before).distinct()
+        ).scalars())
+        deleted_history = deleted_snapshots = 0
+        for board_id in sorted(boards):
+            try:
+                state, history_id, _ = self._board_state_at(board_id, before)
+            except HistoryCompactedError:
+                continue
+            # 삭제된 상위 epic 아래에 남은 epic은 스냅샷에 넣지 않음
+            state = reachable(state, board_id)
+            deleted_history += self.db.query(EpicHistory).filter(
+                EpicHistory.board_id == board_id, EpicHistory.id <= history_id
+            ).delete(synchronize_session=False)
+            later = self.db.execute(
+                select(EpicHistory.id).where(EpicHistory.board_id == board_id).limit(1)
+            ).first()
+            if not state and later is None:
+                deleted_snapshots += self.db.query(EpicSnapshot).filter(
+                    EpicSnapshot.board_id == board_id
+                ).delete(synchronize_session=False)
+                continue
+            # 같은 위치의 스냅샷이 이미 있으면 그대로 두고 더 오래된 것만 지움
+            kept = self.db.execute(
+                select(EpicSnapshot.id)
+                .where(EpicSnapshot.board_id == board_id, EpicSnapshot.history_id == history_id, EpicSnapshot.taken_at <= before)
+                .order_by(EpicSnapshot.id.desc())
+                .limit(1)
+            ).scalar()
+            deleted_snapshots += self.db.query(EpicSnapshot).filter(
+                EpicSnapshot.board_id == board_id, EpicSnapshot.taken_at <= before, EpicSnapshot.id != (kept or 0)
+            ).delete(synchronize_session=False)
+            if kept is None:
+                self.db.add(EpicSnapshot(
+                    board_id=board_id,
+                    history_id=history_id,
+                    size=len(state),
+                    data=encode_snapshot([node[field] for field in SNAPSHOT_FIELDS] for node in state.values()),
+                    taken_at=before,
+                ))
+        self.db.commit()
+        return {"boards": len(boards), "history": deleted_history, "snapshots": deleted_snapshots}
+
+    @service_method
+    def get_epic_path(self, epic_id: int) -> Optional[str]:
+        return self.db.execute(select(Epic.path).where(Epic.id == epic_id)).scalar()
+
+    def export_epics(self, root_path: Optional[str] = None) -> Iterator[bytes]:
+        """epic들(root_path가 있으면 해당 하위 트리)을 NDJSON으로 스트리밍합니다.
+
+        StreamingResponse 본문은 의존성이 요청 세션을 닫은 뒤에 전송되므로, 같은 bind에 스트림 전용 세션을 열어
+        읽고 스트림이 끝나면 닫습니다.
+        """
+        with Session(self.db.get_bind()) as db:
+            for partition in db.execute(export_statement(root_path)).partitions():
+                yield to_ndjson(partition)
+
+    @service_method
+    def begin_import(self, core_epic_id: Optional[int] = None) -> Optional[EpicImportState]:
+        """import 대상 위치를 확인하고 상태를 만듭니다. 대상 epic이 없으면 None을 반환합니다."""
+        target = _ImportNode(None, None, "/", -1)
+        if core_epic_id is not None:
+            core_epic = self.db.query(Epic).filter(Epic.id == core_epic_id).first()
+            if core_epic is None:
+                return None
+            target = _ImportNode(None, core_epic.id, core_epic.path, core_epic.depth)
+        state = EpicImportState(target, self._write_revision())
+        if target.id is not None:
+            state.taken_slots = set(self._taken_slots(target.id))
+        return state
+
+    @service_method
+    def import_epics(self, records: List[dict], state: EpicImportState) -> None:
+        """NDJSON 레코드 한 청크를 bulk INSERT ... RETURNING과 bulk UPDATE로 추가하고 id를 새로 매깁니다."""
+        self._revision = state.revision
+        now = datetime.now()
+        rows, nodes, parents = [], [], []
+        for ordinal, record in enumerate(records):
+            data = EpicExportRecord(**record)
+            # 상위 epic이 나올 때까지 스택을 되감고, 스택에 없으면 대상 위치 바로 아래에 붙임
+            while state.stack and state.stack[-1].source_id != data.core_epic_id:
+                state.stack.pop()
+            parent = state.stack[-1] if state.stack else state.target
+            position = data.position
+            if parent is state.target:
+                state.roots += 1
+                if parent.id is not None and position is not None and position in state.taken_slots:
+                    # 대상 epic 아래에서 이미 쓰이는 칸이면 남은 칸으로 옮기고, 없으면 위치 없이 붙임
+                    position = next((slot for slot in GRID_SLOTS if slot not in state.taken_slots), None)
+                state.taken_slots.add(position)
+            node = _ImportNode(data.id, None, None, parent.depth + 1)
+            state.stack.append(node)
+            nodes.append(node)
+            parents.append(parent)
+            rows.append({
+                "title": data.title,
+                "description": data.description,
+                "status": data.status,
+                "position": position,
+                "depth": node.depth,
+                "revision": state.revision,
+                "created_at": data.created_at or now,
+                "updated_at": data.updated_at,
+                # RETURNING 행 순서는 보장되지 않으므로 임시 path로 레코드와 짝을 맞춤
+                "path": f"#{ordinal}",
+            })
+        if not rows:
+            return
+
+        inserted = {
+            path: epic_id
+            for epic_id, path in self.db.execute(insert(Epic).returning(Epic.id, Epic.path), rows)
+        }
+        # 상위 epic은 항상 먼저 나오므로 순서대로 계산하면 같은 청크의 상위 epic도 이미 새 id와 path가 있음
+        for ordinal, (node, parent) in enumerate(zip(nodes, parents)):
+            node.id = inserted[f"#{ordinal}"]
+            node.path = f"{parent.path}{node.id}/"
+        self.db.execute(
+            update(Epic),
+            [{"id": node.id, "core_epic_id": parent.id, "path": node.path} for node, parent in zip(nodes, parents)],
+        )
+        for node, parent, row in zip(nodes, parents, rows):
+            self._adjust_rollups(node.path, {row["status"]: 1})
+            changes = {field: row[field] for field in ("title", "description", "status", "position", "created_at", "updated_at")}
+            changes["core_epic_id"] = parent.id
+            self._record_history(
+                board_of(node.path), node.id, "create", {field: value for field, value in changes.items() if value is not None}
+            )
+        # 청크마다 새 서비스 인스턴스가 쓰일 수 있으므로 증감과 편집 기록을 바로 반영 (스냅샷은 끝날 때 한 번 확인)
+        self._flush_rollups()
+        state.boards |= self._flush_history(snapshot=False)
+        self._record_changes([node.id for node in nodes], "upsert")
+        state.imported += len(nodes)
+
+    @service_method
+    def finish_import(self, state: EpicImportState) -> EpicImportResponse:
+        self._revision = state.revision
+        for board_id in sorted(state.boards):
+            self._snapshot_if_due(board_id)
+        # 새 epic들은 캐시에 없으므로 대상 epic과 조상, 목록 항목만 무효화
+        self._invalidate(state.target.path)
+        self._commit()
+        # 대량 추가는 개별 이벤트 대신 구독자에게 재조회를 요청
+        epic_broker.reset_all()
+        return EpicImportResponse(imported=state.imported, roots=state.roots, core_epic_id=state.target.id)
+
+    @service_method
+    def search_epics(
+        self,
+        q: str,
+        root_id: Optional[int] = None,
+        status: Optional[str] = None,
+        depth: Optional[int] = None,
+        limit: int = 20,
+    ) -> Optional[List[EpicSearchResult]]:
+        """제목/설명 전문 검색. 관련도 순으로 limit개를 상위 epic 경로와 함께 반환하며, root_id가 없으면 None을 반환합니다."""
+        version = EpicService.get_list_version.sync(self)
+        cache_key = ("search", self._shard, q, root_id, status, depth, limit)
+        cached = epic_cache.get(cache_key, version)
+        if cached is not None:
+            return cached
+
+        filters = []
+        if root_id is not None:
+            root_path = self.db.execute(select(Epic.path).where(Epic.id == root_id)).scalar()
+            if root_path is None:
+                return None
+            filters.append(subtree_filter(root_path))
+        if status is not None:
+            filters.append(Epic.status == status)
+        if depth is not None:
+            filters.append(Epic.depth == depth)
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            match = tsquery(q)
+            if match is None:
+                return []
+            search_vector = literal_column("epics.search_vector")
+            score = func.ts_rank(search_vector, func.to_tsquery("simple", match))
+            query = select(*EPIC_RESPONSE_COLUMNS, Epic.path, score.label("score")).where(
+                search_vector.op("@@")(func.to_tsquery("simple", match)), *filters
+            )
+        else:
+            match = fts_match_query(q)
+            if match is None:
+                return []
+            # FTS 인덱스 안에서 bm25 순으로 정렬해 상위 후보만 남긴 뒤 epics와 join하므로 흔한 검색어도 일정 시간 안에 끝남.
+            # 조건이 있으면 조건에 맞지 않는 후보를 감안해 SEARCH_MAX_CANDIDATES개까지 남김 (bm25는 작을수록 관련도가 높음)
+            rank = func.bm25(literal_column("epics_fts"))
+            ranked = (
+                select(epics_fts.c.rowid.label("id"), (-rank).label("score"))
+                .where(literal_column("epics_fts").op("MATCH")(match))
+                .order_by(rank)
+                .limit(max(limit, SEARCH_MAX_CANDIDATES) if filters else limit)
+                .subquery()
+            )
+            score = ranked.c.score
+            query = select(*EPIC_RESPONSE_COLUMNS, Epic.path, score).join(ranked, ranked.c.id == Epic.id).where(*filters)
+        rows = self.db.execute(query.order_by(score.desc(), Epic.id).limit(limit)).all()
+
+        # 결과들의 상위 epic 제목을 한 번에 조회
+        ancestor_id_lists = [ancestor_ids(row.path) for row in rows]
+        wanted = {epic_id for ids in ancestor_id_lists for epic_id in ids}
+        titles = dict(self.db.execute(select(Epic.id, Epic.title).where(Epic.id.in_(wanted))).all()) if wanted else {}
+        results = [
+            EpicSearchResult(
+                epic=EpicResponse(**epic_row_dict(row)),
+                score=row.score,
+                ancestors=[EpicPathItem(id=epic_id, title=titles.get(epic_id)) for epic_id in ids],
+            )
+            for row, ids in zip(rows, ancestor_id_lists)
+        ]
+        epic_cache.set(cache_key, results, version)
+        return results
+
+    @service_method
+    def get_ancestors(self, epic_id: int) -> Optional[List[EpicResponse]]:
+        """path에 기록된 조상들을 루트부터 순서대로 한 번의 PK 조회로 가져옵니다."""
+        db_epic = self.db.query(Epic).filter(Epic.id == epic_id).first()
+        if db_epic is None:
+            return None
+        ids = ancestor_ids(db_epic.path or f"/{db_epic.id}/")
+        if not ids:
+            return []
+        epics = self.db.query(Epic).options(selectinload(Epic.rollups)).filter(Epic.id.in_(ids)).order_by(Epic.depth).all()
+        return [to_flat_epic_response(epic) for epic in epics]
     
-    async def update_epic(self, epic_id: int, epic: EpicUpdate) -> EpicResponse:
+    @service_method
+    def update_epic(self, epic_id: int, epic: EpicUpdate) -> EpicResponse:
         db_epic = self.db.query(Epic).filter(Epic.id == epic_id).first()
         if db_epic:
             # 값이 있는 필드만 기존 Epic 객체에 업데이트
-            epic_data = epic.dict(exclude_unset=True)
-            for field, value in epic_data.items():
-                if hasattr(db_epic, field):
-                    setattr(db_epic, field, value)
-            
-            # updated_at 필드를 현재 시간으로 설정
-            from datetime import datetime
-            db_epic.updated_at = datetime.now()
-            
-            self.db.commit()
+            self._apply_update(db_epic, epic.dict(exclude_unset=True), datetime.now())
+            self._commit()
             self.db.refresh(db_epic)
             return to_epic_response(db_epic)
         return None
+
+    @service_method
+    def apply_updates(self, updates: Dict[int, dict]) -> List[int]:
+        """여러 epic의 변경(필드 dict)을 한 트랜잭션과 commit 한 번으로 반영하고, 반영된 epic id 목록을 반환합니다.
+
+        묶음 쓰기(WriteCoalescer)가 사용하며, 없는 epic은 건너뜁니다.
+        """
+        epics = self.db.query(Epic).filter(Epic.id.in_(list(updates))).all() if updates else []
+        now = datetime.now()
+        for db_epic in epics:
+            self._apply_update(db_epic, dict(updates[db_epic.id]), now)
+        self._commit()
+        return [epic.id for epic in epics]
+
+    def _apply_update(self, db_epic: Epic, epic_data: dict, now: datetime):
+        """EpicUpdate 필드들을 epic에 적용합니다. 이동, rollup, 변경 기록, 캐시 무효화, 이벤트를 함께 처리합니다."""
+        self._invalidate(db_epic.path)
+        before, before_path = self._history_state(db_epic), db_epic.path
+        old_path = None
+        if "core_epic_id" in epic_data and epic_data["core_epic_id"] != db_epic.core_epic_id:
+            old_path = self._move_subtree(db_epic, epic_data.pop("core_epic_id"))
+            epic_data.pop("depth", None)
+        if "status" in epic_data:
+            self._change_status_rollups(db_epic, epic_data["status"])
+        for field, value in epic_data.items():
+            if hasattr(db_epic, field):
+                setattr(db_epic, field, value)
+        # updated_at 필드를 현재 시간으로 설정
+        db_epic.updated_at = now
+        db_epic.revision = self._write_revision()
+        self._record_changes([db_epic.id], "upsert")
+        self._record_updated(db_epic, before, before_path, now)
+        self._publish("move" if old_path else "upsert", db_epic.id, db_epic.path, old_path)
     
-    async def delete_epic(self, epic_id: int) -> EpicResponse:
+    @service_method
+    def move_epic(self, epic_id: int, move: EpicMove) -> Optional[EpicResponse]:
+        """epic을 하위 트리째 다른 상위 epic 아래 칸(또는 루트)으로 옮깁니다.
+
+        하위 트리의 path와 depth는 path 범위 UPDATE 한 번으로 갱신하므로 쿼리 수가 하위 트리 크기와 무관합니다.
+        position이 없으면 새 상위 epic 주변의 빈 칸을 배정하고, 루트로 옮기면 중앙(0)에 둡니다.
+        """
+        db_epic = self.db.query(Epic).filter(Epic.id == epic_id).first()
+        if db_epic is None:
+            return None
+        # 빈 칸 배정이 다른 쓰기와 겹치지 않도록 revision 카운터를 먼저 갱신
+        revision = self._write_revision()
+        self._invalidate(db_epic.path)
+        before, before_path = self._history_state(db_epic), db_epic.path
+        position = move.position
+        old_path = None
+        if move.core_epic_id != db_epic.core_epic_id:
+            if position is None:
+                position = self._allocate_slot(move.core_epic_id) if move.core_epic_id is not None else 0
+            old_path = self._move_subtree(db_epic, move.core_epic_id)
+        if position is not None:
+            db_epic.position = position
+        db_epic.updated_at = datetime.now()
+        db_epic.revision = revision
+        self._record_changes([db_epic.id], "upsert")
+        self._record_updated(db_epic, before, before_path, db_epic.updated_at)
+        self._publish("move" if old_path else "upsert", db_epic.id, db_epic.path, old_path)
+        self._commit()
+        return to_flat_epic_response(
+            self.db.query(Epic).options(selectinload(Epic.rollups)).filter(Epic.id == epic_id).one()
+        )
+
+    @service_method
+    def swap_epics(self, first_id: int, second_id: int) -> Optional[List[EpicResponse]]:
+        """두 epic의 자리(상위 epic과 position)를 하위 트리째 한 트랜잭션에서 맞바꿉니다."""
+        if first_id == second_id:
+            raise ValueError("Cannot swap an epic with itself")
+        epics = {epic.id: epic for epic in self.db.query(Epic).filter(Epic.id.in_([first_id, second_id])).all()}
+        if len(epics) < 2:
+            return None
+        first, second = epics[first_id], epics[second_id]
+        if first.path.startswith(second.path) or second.path.startswith(first.path):
+            raise ValueError("Cannot swap an epic with its ancestor or descendant")
+
+        revision = self._write_revision()
+        slots = {first.id: (second.core_epic_id, second.position), second.id: (first.core_epic_id, first.position)}
+        before = {db_epic.id: (self._history_state(db_epic), db_epic.path) for db_epic in (first, second)}
+        # 맞바꾸는 동안 (core_epic_id, position) 유니크 인덱스에 걸리지 않도록 두 칸을 먼저 비움
+        self.db.query(Epic).filter(Epic.id.in_([first_id, second_id])).update(
+            {Epic.position: None}, synchronize_session="evaluate"
+        )
+        now = datetime.now()
+        for db_epic in (first, second):
+            core_epic_id, position = slots[db_epic.id]
+            self._invalidate(db_epic.path)
+            old_path = None
+            if core_epic_id != db_epic.core_epic_id:
+                old_path = self._move_subtree(db_epic, core_epic_id)
+            db_epic.position = position
+            db_epic.updated_at = now
+            db_epic.revision = revision
+            self._record_updated(db_epic, *before[db_epic.id], now)
+            self._publish("move" if old_path else "upsert", db_epic.id, db_epic.path, old_path)
+        self._record_changes([first_id, second_id], "upsert")
+        self._commit()
+
+        swapped = {
+            epic.id: epic
+            for epic in self.db.query(Epic).options(selectinload(Epic.rollups)).filter(Epic.id.in_([first_id, second_id])).all()
+        }
+        return [to_flat_epic_response(swapped[first_id]), to_flat_epic_response(swapped[second_id])]
+
+    @service_method
+    def batch_epics(self, operations: List[EpicBatchOperation]) -> List[EpicBatchResult]:
+        """create/update/delete 작업 목록을 하나의 트랜잭션으로 적용합니다.
+
+        create -> update -> delete 순서로 처리하며, 같은 batch에서 생성되는 상위 epic은
+        core_temp_id로 참조할 수 있습니다. depth와 path는 메모리에서 계산합니다.
+        """
+        try:
+            results = self._apply_batch(operations)
+            self._commit()
+        except Exception:
+            self.db.rollback()
+            self._rollup_deltas = {}
+            self._history = []
+            self._invalidations = []
+            self._events = []
+            self._revision = None
+            raise
+
+        # commit으로 만료된 객체들을 IN 쿼리 한 번으로 다시 읽어옵니다
+        ids = [result["id"] for result in results if result["op"] != "delete"]
+        epics = {
+            epic.id: epic
+            for epic in self.db.query(Epic).options(selectinload(Epic.rollups)).filter(Epic.id.in_(ids)).all()
+        } if ids else {}
+        return [
+            EpicBatchResult(
+                op=result["op"],
+                id=result["id"],
+                temp_id=result["temp_id"],
+                epic=to_flat_epic_response(epics[result["id"]]) if result["id"] in epics else None,
+            )
+            for result in results
+        ]
+
+    def _apply_batch(self, operations: List[EpicBatchOperation]) -> List[dict]:
+        creates = [(index, op, EpicCreate(**(op.data or {}))) for index, op in enumerate(operations) if op.op == "create"]
+        updates = [(index, op, EpicUpdate(**(op.data or {}))) for index, op in enumerate(operations) if op.op == "update"]
+        deletes = [(index, op) for index, op in enumerate(operations) if op.op == "delete"]
+
+        # batch에서 참조하는 기존 epic들을 한 번에 조회
+        referenced = {data.core_epic_id for _, _, data in creates if data.core_epic_id}
+        referenced |= {data.core_epic_id for _, _, data in updates if data.core_epic_id}
+        referenced |= {op.id for _, op, *_ in updates + deletes}
+        if None in referenced:
+            raise ValueError("update/delete operations require an id")
+        existing = {epic.id: epic for epic in self.db.query(Epic).filter(Epic.id.in_(referenced)).all()} if referenced else {}
+
+        results = {}
+        temp_epics = {}
+
+        # 상위 epic이 먼저 생성되도록 임시 id 의존 관계 단계별로 bulk INSERT
+        path_updates = []
+        remaining = creates
+        while remaining:
+            level = [c for c in remaining if c[1].core_temp_id is None or c[1].core_temp_id in temp_epics]
+            if not level:
+                raise ValueError("Unresolved core_temp_id in batch")
+            parents = []
+            rows = []
+            for index, op, data in level:
+                parent = temp_epics[op.core_temp_id] if op.core_temp_id else existing.get(data.core_epic_id)
+                if data.core_epic_id and parent is None:
+                    raise ValueError(f"Core epic {data.core_epic_id} not found")
+                epic_data = data.dict()
+                epic_data["core_epic_id"] = parent.id if parent else None
+                epic_data["depth"] = parent.depth + 1 if parent else 0
+                epic_data["revision"] = self._write_revision()
+                # RETURNING 행 순서는 보장되지 않으므로 임시 path로 요청 작업과 짝을 맞춤
+                epic_data["path"] = f"#{index}"
+                parents.append(parent)
+                rows.append(epic_data)
+            inserted = {
+                db_epic.path: db_epic
+                for db_epic in self.db.scalars(insert(Epic).returning(Epic), rows).all()
+            }
+            for (index, op, _), parent in zip(level, parents):
+                db_epic = inserted[f"#{index}"]
+                # path는 id가 발급된 뒤에 메모리에서 계산해 마지막에 한 번에 UPDATE
+                db_epic.path = f"{parent.path if parent else '/'}{db_epic.id}/"
+                self._adjust_rollups(db_epic.path, {db_epic.status: 1})
+                self._record_created(db_epic)
+                self._invalidate(db_epic.path)
+                self._publish("upsert", db_epic.id, db_epic.path)
+                path_updates.append({"id": db_epic.id, "path": db_epic.path})
+                if op.temp_id:
+                    temp_epics[op.temp_id] = db_epic
+                results[index] = {"op": "create", "id": db_epic.id, "temp_id": op.temp_id}
+            remaining = [c for c in remaining if c[0] not in results]
+        if path_updates:
+            self.db.execute(update(Epic), path_updates)
+            self._record_changes([row["id"] for row in path_updates], "upsert")
+
+        now = datetime.now()
+        for index, op, data in updates:
+            db_epic = existing.get(op.id)
+            if db_epic is None:
+                raise ValueError(f"Epic {op.id} not found")
+            epic_data = data.dict(exclude_unset=True)
+            if op.core_temp_id:
+                if op.core_temp_id not in temp_epics:
+                    raise ValueError(f"Unknown core_temp_id {op.core_temp_id}")
+                epic_data["core_epic_id"] = temp_epics[op.core_temp_id].id
+            self._apply_update(db_epic, epic_data, now)
+            results[index] = {"op": "update", "id": db_epic.id, "temp_id": op.temp_id}
+
+        if deletes:
+            self._write_revision()
+            targets = []
+            for index, op in deletes:
+                if op.id not in existing:
+                    raise ValueError(f"Epic {op.id} not found")
+                targets.append(existing[op.id])
+                self._record_history(board_of(existing[op.id].path), op.id, "delete")
+                self._invalidate(existing[op.id].path, subtree=True)
+                self._publish("delete", op.id, existing[op.id].path)
+                results[index] = {"op": "delete", "id": op.id, "temp_id": op.temp_id}
+            # 남은 변경사항을 반영한 뒤 모든 하위 트리를 DELETE 한 번으로 삭제
+            self.db.flush()
+            # 다른 삭제 대상 안에 있는 epic은 조상 rollup에서 두 번 빼지 않도록 제외
+            outermost = []
+            for epic in sorted(targets, key=lambda epic: epic.path):
+                if not outermost or not epic.path.startswith(outermost[-1].path):
+                    outermost.append(epic)
+            for epic in outermost:
+                self._adjust_rollups(epic.path, self._subtree_status_counts(epic.path), -1)
+            self._delete_subtrees(or_(*[subtree_filter(epic.path) for epic in targets]))
+            for epic in targets:
+                if epic in self.db:
+                    self.db.expunge(epic)
+
+        return [results[index] for index in sorted(results)]
+
+    @service_method
+    def delete_epic(self, epic_id: int) -> Optional[EpicDeleteResponse]:
         db_epic = self.db.query(Epic).filter(Epic.id == epic_id).first()
         if db_epic:
-            # 하위 epic들도 함께 삭제
-            self._delete_sub_epics(db_epic.id)
-            
-            # 메인 epic 삭제
-            self.db.delete(db_epic)
-            self.db.commit()
-            return to_epic_response(db_epic)
+            # 메인 epic과 하위 epic들, 관련 epic_relations를 한 트랜잭션에서 함께 삭제
+            self._invalidate(db_epic.path, subtree=True)
+            self._publish("delete", db_epic.id, db_epic.path)
+            # 하위 트리는 루트 하나의 삭제로 기록 (재구성 시 루트에서 닿지 않는 epic은 빠짐)
+            self._record_history(board_of(db_epic.path), db_epic.id, "delete")
+            self._adjust_rollups(db_epic.path, self._subtree_status_counts(db_epic.path), -1)
+            deleted_relations, deleted = self._delete_subtrees(subtree_filter(db_epic.path))
+            self.db.expunge(db_epic)
+            self._commit()
+            return EpicDeleteResponse(id=epic_id, deleted=deleted, deleted_relations=deleted_relations)
         return None
     
-    def _delete_sub_epics(self, epic_id: int):
-        """하위 epic들을 재귀적으로 삭제합니다."""
-        # 해당 epic을 상위 epic으로 하는 모든 하위 epic 조회
-        sub_epics = self.db.query(Epic).filter(Epic.core_epic_id == epic_id).all()
-        
-        for sub_epic in sub_epics:
-            # 재귀적으로 하위 epic들 삭제
-            self._delete_sub_epics(sub_epic.id)
-            # 하위 epic 삭제
-            self.db.delete(sub_epic)
-        
-        print(f"Deleted {len(sub_epics)} sub epics for epic {epic_id}")
+    def _delete_subtrees(self, condition):
+        """조건에 맞는 epic들을 tombstone 기록 후 관계, rollup과 함께 집합 단위 DELETE로 삭제합니다."""
+        self._record_matching_changes(condition, "delete")
+        subtree_ids = select(Epic.id).where(condition)
+        # 삭제될 epic에 대한 증감이 남지 않도록 먼저 반영한 뒤 rollup 행을 지움
+        self._flush_rollups()
+        self.db.query(EpicRollupCount).filter(EpicRollupCount.epic_id.in_(subtree_ids)).delete(synchronize_session=False)
+        deleted_relations = (
+            self.db.query(EpicRelation)
+            .filter(or_(EpicRelation.core_epic_id.in_(subtree_ids), EpicRelation.sub_epic_id.in_(subtree_ids)))
+            .delete(synchronize_session=False)
+        )
+        deleted = self.db.query(Epic).filter(condition).delete(synchronize_session=False)
+        return deleted_relations, deleted
+
+    def _move_subtree(self, db_epic: Epic, core_epic_id: Optional[int]) -> str:
+        """epic을 새 상위 epic 아래로 옮기고 하위 트리 전체의 path와 depth를 한 번에 갱신합니다. 이전 path를 반환합니다."""
+        new_parent_path = "/"
+        new_depth = 0
+        if core_epic_id is not None:
+            core_epic = self.db.query(Epic).filter(Epic.id == core_epic_id).first()
+            if core_epic is None:
+                raise ValueError(f"Core epic {core_epic_id} not found")
+            if core_epic.path.startswith(db_epic.path):
+                raise ValueError("Cannot move an epic under itself or its descendants")
+            new_parent_path = core_epic.path
+            new_depth = core_epic.depth + 1
+
+        old_path = db_epic.path
+        new_path = f"{new_parent_path}{db_epic.id}/"
+        depth_delta = new_depth - db_epic.depth
+        # 옮겨지는 하위 트리의 상태별 개수를 이전 조상들에서 빼고 새 조상들에 더함
+        counts = self._subtree_status_counts(old_path)
+        self._adjust_rollups(old_path, counts, -1)
+        self._adjust_rollups(new_path, counts)
+        self.db.query(Epic).filter(subtree_filter(old_path)).update(
+            {
+                Epic.path: literal(new_path) + func.substr(Epic.path, len(old_path) + 1),
+                Epic.depth: Epic.depth + depth_delta,
+                Epic.revision: self._write_revision(),
+            },
+            synchronize_session=False,
+        )
+        # 자기 자신은 호출한 쪽에서 기록하므로 하위 epic들만 기록
+        self._record_matching_changes(and_(subtree_filter(new_path), Epic.id != db_epic.id), "upsert")
+        if board_of(old_path) != board_of(new_path):
+            # 다른 보드로 옮기면 이전 보드에는 삭제로, 새 보드에는 하위 epic들의 생성으로 기록
+            self._record_history(board_of(old_path), db_epic.id, "delete")
+            self.db.flush()
+            for row in self.db.execute(
+                select(*[getattr(Epic, field) for field in SNAPSHOT_FIELDS])
+                .where(subtree_filter(new_path), Epic.id != db_epic.id)
+                .order_by(Epic.id)
+            ):
+                changes = {field: value for field, value in row._mapping.items() if field != "id" and value is not None}
+                self._record_history(board_of(new_path), row.id, "create", changes)
+        self._invalidate(old_path, subtree=True)
+        self._invalidate(new_path)
+        db_epic.core_epic_id = core_epic_id
+        db_epic.path = new_path
+        db_epic.depth = new_depth
+        return old_path
     
-    async def delete_all_epics(self) -> dict:
+    @service_method
+    def rebuild_rollups(self) -> int:
+        """epic_rollups를 현재 트리에서 다시 계산합니다. 각 epic의 하위 트리를 path 범위 조인으로 집계하며 만든 행 수를 반환합니다."""
+        descendant = aliased(Epic)
+        self.db.query(EpicRollupCount).delete(synchronize_session=False)
+        result = self.db.execute(
+            insert(EpicRollupCount).from_select(
+                ["epic_id", "status", "count"],
+                select(Epic.id, func.coalesce(descendant.status, ""), func.count())
+                .join(
+                    descendant,
+                    and_(
+                        descendant.path > Epic.path,
+                        descendant.path < func.substr(Epic.path, 1, func.length(Epic.path) - 1) + "0",
+                    ),
+                )
+                .group_by(Epic.id, descendant.status),
+            )
+        )
+        self._rollup_deltas = {}
+        self.db.commit()
+        epic_cache.clear()
+        return result.rowcount
+
+    @service_method
+    def delete_all_epics(self) -> dict:
         """모든 epic을 삭제합니다."""
         count = self.db.query(Epic).count()
+        self._record_matching_changes(literal(True), "delete")
+        # 보드마다 루트 삭제 하나로 기록하므로 지운 뒤에도 이전 시점의 보드를 재구성할 수 있음
+        self.db.execute(
+            insert(EpicHistory).from_select(
+                ["board_id", "epic_id", "revision", "op", "changed_at"],
+                select(Epic.id, Epic.id, literal(self._write_revision()), literal("delete"), literal(datetime.now()))
+                .where(Epic.core_epic_id.is_(None)),
+            )
+        )
+        self.db.query(EpicRelation).delete()
+        self.db.query(EpicRollupCount).delete()
         self.db.query(Epic).delete()
         self.db.commit()
-        return {"message": f"All {count} epics deleted successfully"}
\ No newline at end of file
+        self._revision = None
+        epic_cache.clear()
+        epic_broker.reset_all()
+        return {"message": f"All {count} epics deleted successfully", "count": count}
\ No newline at end of file
@@ -0,0 +1,131 @@
+import asyncio
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from .epic import EpicImportState, EpicService, export_statement, to_ndjson
+from ..models.epic import (
+    EpicBatchOperation, EpicBatchResult, EpicChangeFeed, EpicCreate, EpicDeleteResponse, EpicFreeSlots, EpicImportResponse,
+    EpicMove, EpicResponse, EpicRollupSummary, EpicSearchResult, EpicUpdate,
+)
+
+class AsyncEpicService:
+    """AsyncSession 위에서 EpicService와 동일한 로직을 실행하는 서비스
+
+    EpicService 메서드의 동기 본문을 AsyncSession.run_sync 안에서 실행하므로 lazy loading을 포함한
+    모든 쿼리가 async 드라이버를 거쳐 이벤트 루프를 막지 않고, 동작은 동기 경로와 같습니다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _run(self, method, *args, **kwargs):
+        return await self.db.run_sync(lambda session: method.sync(EpicService(session), *args, **kwargs))
+
+    async def create_epic(self, epic: EpicCreate, allocate_position: bool = False) -> EpicResponse:
+        return await self._run(EpicService.create_epic, epic, allocate_position=allocate_position)
+
+    async def get_epics(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_subs: bool = True,
+        fields: Optional[List[str]] = None,
+        version: Optional[str] = None,
+    ):
+        return await self._run(EpicService.get_epics, skip, limit, cursor, include_subs, fields, version)
+
+    async def get_epic(self, epic_id: int, version: Optional[str] = None) -> Optional[bytes]:
+        return await self._run(EpicService.get_epic, epic_id, version)
+
+    async def get_epic_tree(self, epic_id: int, max_depth: Optional[int] = None, version: Optional[str] = None) -> Optional[bytes]:
+        return await self._run(EpicService.get_epic_tree, epic_id, max_depth, version)
+
+    async def get_free_slots(self, epic_id: int) -> Optional[EpicFreeSlots]:
+        return await self._run(EpicService.get_free_slots, epic_id)
+
+    async def get_rollup(self, epic_id: int) -> Optional[EpicRollupSummary]:
+        return await self._run(EpicService.get_rollup, epic_id)
+
+    async def get_list_version(self) -> str:
+        return await self._run(EpicService.get_list_version)
+
+    async def get_subtree_version(self, epic_id: int) -> Optional[str]:
+        return await self._run(EpicService.get_subtree_version, epic_id)
+
+    async def get_changes(self, since: int = 0, limit: int = 1000) -> EpicChangeFeed:
+        return await self._run(EpicService.get_changes, since, limit)
+
+    async def get_board_at(self, board_id: int, at: datetime) -> Optional[bytes]:
+        return await self._run(EpicService.get_board_at, board_id, at)
+
+    async def get_epic_path(self, epic_id: int) -> Optional[str]:
+        return await self._run(EpicService.get_epic_path, epic_id)
+
+    async def begin_import(self, core_epic_id: Optional[int] = None) -> Optional[EpicImportState]:
+        return await self._run(EpicService.begin_import, core_epic_id)
+
+    async def import_epics(self, records: List[dict], state: EpicImportState) -> None:
+        return await self._run(EpicService.import_epics, records, state)
+
+    async def finish_import(self, state: EpicImportState) -> EpicImportResponse:
+        return await self._run(EpicService.finish_import, state)
+
+    async def search_epics(
+        self,
+        q: str,
+        root_id: Optional[int] = None,
+        status: Optional[str] = None,
+        depth: Optional[int] = None,
+        limit: int = 20,
+    ) -> Optional[List[EpicSearchResult]]:
+        return await self._run(EpicService.search_epics, q, root_id, status, depth, limit)
+
+    async def get_ancestors(self, epic_id: int) -> Optional[List[EpicResponse]]:
+        return await self._run(EpicService.get_ancestors, epic_id)
+
+    async def update_epic(self, epic_id: int, epic: EpicUpdate) -> EpicResponse:
+        return await self._run(EpicService.update_epic, epic_id, epic)
+
+    async def apply_updates(self, updates: Dict[int, dict]) -> List[int]:
+        return await self._run(EpicService.apply_updates, updates)
+
+    async def move_epic(self, epic_id: int, move: EpicMove) -> Optional[EpicResponse]:
+        return await self._run(EpicService.move_epic, epic_id, move)
+
+    async def swap_epics(self, first_id: int, second_id: int) -> Optional[List[EpicResponse]]:
+        return await self._run(EpicService.swap_epics, first_id, second_id)
+
+    async def batch_epics(self, operations: List[EpicBatchOperation]) -> List[EpicBatchResult]:
+        return await self._run(EpicService.batch_epics, operations)
+
+    async def delete_epic(self, epic_id: int) -> Optional[EpicDeleteResponse]:
+        return await self._run(EpicService.delete_epic, epic_id)
+
+    async def delete_all_epics(self) -> dict:
+        return await self._run(EpicService.delete_all_epics)
+
+    async def export_epics(self, root_path: Optional[str] = None) -> AsyncIterator[bytes]:
+        """EpicService.export_epics와 같은 NDJSON을 async 드라이버의 스트리밍 결과로 만듭니다.
+
+        요청 세션은 본문 전송 전에 닫히므로 같은 bind에 스트림 전용 세션을 엽니다.
+        """
+        async with AsyncSession(self.db.bind) as db:
+            result = await db.stream(export_statement(root_path))
+            async for partition in result.partitions():
+                yield to_ndjson(partition)
+
+async def fan_out(sessions: list, call: Callable[[object], Awaitable]) -> List:
+    """shard 세션마다 call(service)를 병렬로 실행하고 결과를 세션 순서대로 반환합니다.
+
+    동기 Session은 shard마다 스레드풀에서 실행하고, AsyncSession은 이벤트 루프에서 동시에 실행합니다.
+    """
+    async def run(db):
+        if isinstance(db, AsyncSession):
+            return await call(AsyncEpicService(db))
+        # 워커 스레드에서 새 이벤트 루프로 실행 (EpicService 메서드는 이벤트 루프를 막는 동기 본문)
+        return await run_in_threadpool(lambda: asyncio.run(call(EpicService(db))))
+
+    return await asyncio.gather(*[run(db) for db in sessions])
@@ -0,0 +1,119 @@
+import asyncio
+import os
+import threading
+from typing import Dict, List, Optional, Set
+
+EPIC_EVENTS_MAX_PENDING = int(os.getenv("EPIC_EVENTS_MAX_PENDING", "1000"))
+EPIC_EVENTS_COALESCE_MS = int(os.getenv("EPIC_EVENTS_COALESCE_MS", "50"))
+
+class EpicSubscription:
+    """한 연결의 구독 상태
+
+    아직 보내지 않은 이벤트는 epic id별 최신 이벤트만 남겨 합쳐지고(coalescing),
+    max_pending을 넘으면 버퍼를 비우고 클라이언트에 전체 재조회(resync)를 요청합니다.
+    """
+
+    def __init__(self, broker: "EpicEventBroker", root_id: Optional[int], loop: asyncio.AbstractEventLoop,
+                 max_pending: int = EPIC_EVENTS_MAX_PENDING):
+        self.broker = broker
+        self.root_id = root_id
+        self.loop = loop
+        self.max_pending = max_pending
+        self.dropped = 0
+        self._pending: Dict[int, dict] = {}
+        self._resync = False
+        self._ready = asyncio.Event()
+
+    def push(self, event: dict) -> None:
+        """publisher 스레드에서 호출됩니다. broker lock 안에서 실행됩니다."""
+        if self._resync:
+            self.dropped += 1
+            return
+        self._pending.pop(event["epic_id"], None)
+        self._pending[event["epic_id"]] = event
+        if len(self._pending) > self.max_pending:
+            self.dropped += len(self._pending)
+            self._pending.clear()
+            self._resync = True
+        self.loop.call_soon_threadsafe(self._ready.set)
+
+    def reset(self) -> None:
+        with self.broker.lock:
+            self._pending.clear()
+            self._resync = True
+        self.loop.call_soon_threadsafe(self._ready.set)
+
+    async def next_batch(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """다음 메시지를 기다립니다. timeout 동안 이벤트가 없으면 None을 반환합니다."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        # 짧은 시간 동안 들어오는 이벤트를 모아서 한 번에 전송
+        if EPIC_EVENTS_COALESCE_MS:
+            await asyncio.sleep(EPIC_EVENTS_COALESCE_MS / 1000)
+        with self.broker.lock:
+            self._ready.clear()
+            if self._resync:
+                self._resync = False
+                self._pending.clear()
+                return {"type": "resync"}
+            events = list(self._pending.values())
+            self._pending.clear()
+        return {"type": "changes", "events": events}
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+class EpicEventBroker:
+    """프로세스 내 epic 변경 이벤트 pub/sub
+
+    구독은 루트 epic id 단위이며, 이벤트는 path에 포함된 조상 id의 구독자에게만 전달됩니다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._subscribers: Dict[Optional[int], Set[EpicSubscription]] = {}
+        self.published = 0
+
+    def subscribe(self, root_id: Optional[int] = None, max_pending: int = EPIC_EVENTS_MAX_PENDING) -> EpicSubscription:
+        """현재 이벤트 루프에서 root_id 하위 트리(None이면 전체)의 이벤트를 구독합니다."""
+        subscription = EpicSubscription(self, root_id, asyncio.get_running_loop(), max_pending)
+        with self.lock:
+            self._subscribers.setdefault(root_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EpicSubscription) -> None:
+        with self.lock:
+            subscribers = self._subscribers.get(subscription.root_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.root_id]
+
+    def subscriber_count(self) -> int:
+        with self.lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def publish(self, events: List[dict]) -> None:
+        """commit된 변경 이벤트를 해당 하위 트리 구독자들에게 전달합니다."""
+        with self.lock:
+            if not self._subscribers:
+                return
+            for event in events:
+                self.published += 1
+                targets = set(self._subscribers.get(None, ()))
+                for path in event.pop("routing_paths"):
+                    for epic_id in path.strip("/").split("/"):
+                        targets |= self._subscribers.get(int(epic_id), set())
+                for subscription in targets:
+                    subscription.push(event)
+
+    def reset_all(self) -> None:
+        """전체 삭제처럼 개별 이벤트로 표현하기 어려운 변경 후 모든 구독자에게 재조회를 요청합니다."""
+        with self.lock:
+            subscriptions = [s for subscribers in self._subscribers.values() for s in subscribers]
+        for subscription in subscriptions:
+            subscription.reset()
+
+epic_broker = EpicEventBroker()
@@ -0,0 +1,127 @@
+"""
+epic 편집 기록(epic_history)과 보드 스냅샷(epic_snapshots)
+편집 기록에는 바뀐 필드만 JSON으로 남기고, 보드마다 주기적으로 전체 상태를 압축 스냅샷으로 저장합니다.
+특정 시점의 보드는 그 이전의 가장 가까운 스냅샷에 이후 기록을 차례로 적용해 재구성합니다.
+"""
+
+import json
+import os
+import zlib
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from ..models.epic import EPIC_RESPONSE_FIELDS, to_epic_rollup
+
+# 기록하는 필드 (depth, path는 core_epic_id로부터 다시 계산)
+HISTORY_FIELDS = ("core_epic_id", "title", "description", "status", "position")
+# 스냅샷 한 행의 컬럼 순서
+SNAPSHOT_FIELDS = ("id", *HISTORY_FIELDS, "created_at", "updated_at")
+# 마지막 스냅샷 이후 기록이 이 수와 보드 크기 중 큰 값만큼 쌓이면 새 스냅샷을 남김
+# (재구성 시 적용하는 기록 수가 스냅샷 크기를 넘지 않으므로 비용이 보드 크기에 비례)
+HISTORY_SNAPSHOT_EVERY = int(os.getenv("EPIC_HISTORY_SNAPSHOT_EVERY", "500"))
+# compact_history.py가 기록을 그대로 남겨 두는 기간 (그 이전은 보드마다 스냅샷 하나로 합침)
+HISTORY_RETENTION_DAYS = int(os.getenv("EPIC_HISTORY_RETENTION_DAYS", "30"))
+
+class HistoryCompactedError(ValueError):
+    """요청한 시점의 기록이 이미 정리(compaction)되어 재구성할 수 없을 때 발생합니다."""
+
+def board_of(path: str) -> int:
+    """path의 첫 번째 id(루트 epic = 보드)를 반환합니다."""
+    return int(path.split("/", 2)[1])
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def encode_changes(changes: Optional[dict]) -> Optional[str]:
+    """바뀐 필드 dict를 JSON 문자열로 만듭니다. 생성 기록에서 값이 없는 필드는 생략합니다."""
+    if changes is None:
+        return None
+    return json.dumps(changes, ensure_ascii=False, separators=(",", ":"), default=_json_default)
+
+def encode_snapshot(rows: Iterable) -> bytes:
+    """SNAPSHOT_FIELDS 순서의 행들을 zlib으로 압축한 JSON 배열로 만듭니다."""
+    data = json.dumps([list(row) for row in rows], ensure_ascii=False, separators=(",", ":"), default=_json_default)
+    return zlib.compress(data.encode())
+
+def decode_snapshot(data: bytes) -> Dict[int, dict]:
+    """스냅샷을 {epic id: 필드 dict} 상태로 풉니다."""
+    return {row[0]: dict(zip(SNAPSHOT_FIELDS, row)) for row in json.loads(zlib.decompress(data))}
+
+def replay(state: Dict[int, dict], rows: Iterable) -> None:
+    """(epic_id, op, changes, changed_at) 기록들을 순서대로 상태에 적용합니다.
+
+    delete(하위 트리 삭제, 다른 보드로 이동)는 하위 트리의 루트 하나만 기록되므로 상태에서 하위 epic까지 함께 지웁니다.
+    (남겨 두면 나중에 같은 id의 상위 epic이 다시 생성될 때 하위 epic들이 되살아남)
+    """
+    for epic_id, op, changes, changed_at in rows:
+        if op == "create":
+            node = dict.fromkeys(SNAPSHOT_FIELDS)
+            node.update(id=epic_id, created_at=changed_at)
+            node.update(json.loads(changes))
+            state[epic_id] = node
+        elif op == "update":
+            node = state.get(epic_id)
+            if node is not None:
+                node.update(json.loads(changes))
+                node["updated_at"] = changed_at
+        else:
+            _drop_subtree(state, epic_id)
+
+def _drop_subtree(state: Dict[int, dict], epic_id: int) -> None:
+    """epic과 core_epic_id로 이어진 모든 하위 epic을 상태에서 지웁니다."""
+    if state.pop(epic_id, None) is None:
+        return
+    children = {}
+    for node in state.values():
+        children.setdefault(node["core_epic_id"], []).append(node["id"])
+    stack = list(children.get(epic_id, ()))
+    while stack:
+        child_id = stack.pop()
+        state.pop(child_id, None)
+        stack.extend(children.get(child_id, ()))
+
+def reachable(state: Dict[int, dict], board_id: int) -> Dict[int, dict]:
+    """보드 루트에서 core_epic_id로 닿는 epic만 남긴 상태를 반환합니다."""
+    children = {}
+    for node in state.values():
+        children.setdefault(node["core_epic_id"], []).append(node["id"])
+    kept = {}
+    stack = [board_id] if board_id in state else []
+    while stack:
+        epic_id = stack.pop()
+        kept[epic_id] = state[epic_id]
+        stack.extend(children.get(epic_id, ()))
+    return kept
+
+def build_board_tree(state: Dict[int, dict], board_id: int) -> Optional[dict]:
+    """재구성한 상태로 /tree 응답과 같은 형식(EpicResponse, subs는 id 순)의 dict를 만듭니다. 보드가 없으면 None."""
+    if board_id not in state:
+        return None
+    children = {}
+    for node in state.values():
+        children.setdefault(node["core_epic_id"], []).append(node["id"])
+    tree = {}
+    order = []
+    stack = [(board_id, 0)]
+    while stack:
+        epic_id, depth = stack.pop()
+        tree[epic_id] = {field: state[epic_id].get(field) for field in EPIC_RESPONSE_FIELDS}
+        tree[epic_id].update(depth=depth, subs=[])
+        order.append(epic_id)
+        stack.extend((child_id, depth + 1) for child_id in children.get(epic_id, ()))
+    # 하위 epic부터 상태별 개수를 더해 올라가며 rollup을 계산
+    counts = {epic_id: Counter() for epic_id in order}
+    for epic_id in reversed(order):
+        node = tree[epic_id]
+        node["rollup"] = to_epic_rollup(counts[epic_id])
+        if epic_id != board_id:
+            parent = counts[node["core_epic_id"]]
+            parent.update(counts[epic_id])
+            parent[node["status"] or ""] += 1
+    for epic_id in sorted(order):
+        if epic_id != board_id:
+            tree[tree[epic_id]["core_epic_id"]]["subs"].append(tree[epic_id])
+    return tree[board_id]
@@ -0,0 +1,179 @@
+"""
+요청 단위 성능 계측
+요청마다 SQL 문 수, DB 시간, JSON 인코딩 시간, 응답 압축 시간, 전송한 응답 크기를 모으고 경로별로 누적해
+Server-Timing 헤더와 Prometheus 텍스트 형식(/metrics)으로 내보냅니다.
+"""
+
+import contextvars
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+# 이 시간(ms) 이상 걸린 SQL 문을 로그로 남김 (0이면 끔)
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+
+slow_query_logger = logging.getLogger("app.db.slow_query")
+
+class RequestMetrics:
+    """요청 하나에서 측정한 값"""
+
+    __slots__ = ("statements", "db_seconds", "serialize_seconds", "compress_seconds", "response_bytes")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.serialize_seconds = 0.0
+        self.compress_seconds = 0.0
+        self.response_bytes = 0  # 압축 후 실제로 보낸 바이트
+
+    def server_timing(self, total_seconds: float) -> str:
+        return (
+            f'db;dur={self.db_seconds * 1000:.2f};desc="{self.statements} statements", '
+            f"serialize;dur={self.serialize_seconds * 1000:.2f}, "
+            f"compress;dur={self.compress_seconds * 1000:.2f}, "
+            f"total;dur={total_seconds * 1000:.2f}"
+        )
+
+# 현재 요청의 RequestMetrics (스레드풀에서 실행되는 동기 코드에도 컨텍스트가 복사되어 전달됨)
+_current_metrics: contextvars.ContextVar[Optional[RequestMetrics]] = contextvars.ContextVar(
+    "request_metrics", default=None
+)
+
+def current_metrics() -> Optional[RequestMetrics]:
+    return _current_metrics.get()
+
+def record_statement(statement: str, seconds: float) -> None:
+    """엔진 이벤트 훅에서 SQL 문 하나가 끝날 때마다 호출됩니다."""
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.statements += 1
+        metrics.db_seconds += seconds
+    if SLOW_QUERY_MS and seconds * 1000 >= SLOW_QUERY_MS:
+        metrics_registry.record_slow_query()
+        slow_query_logger.warning("Slow query (%.1f ms): %s", seconds * 1000, " ".join(statement.split()))
+
+@contextmanager
+def measure_serialization():
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics = _current_metrics.get()
+        if metrics is not None:
+            metrics.serialize_seconds += time.perf_counter() - start
+
+@contextmanager
+def measure_compression():
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics = _current_metrics.get()
+        if metrics is not None:
+            metrics.compress_seconds += time.perf_counter() - start
+
+class MetricsRegistry:
+    """(method, route, status)별 누적 값"""
+
+    # (이름, 타입, 설명)
+    SERIES = (
+        ("http_requests_total", "counter", "Total HTTP requests"),
+        ("http_request_duration_seconds_total", "counter", "Total time spent handling requests"),
+        ("db_statements_total", "counter", "Total SQL statements executed while handling requests"),
+        ("db_duration_seconds_total", "counter", "Total time spent in SQL statements"),
+        ("serialization_duration_seconds_total", "counter", "Total time spent encoding JSON responses"),
+        ("http_response_bytes_total", "counter", "Total response body bytes sent (after compression)"),
+        ("compression_duration_seconds_total", "counter", "Total time spent compressing responses"),
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str, int], list] = {}
+        self.slow_queries = 0
+
+    def observe(self, method: str, route: str, status: int, metrics: RequestMetrics, seconds: float) -> None:
+        with self._lock:
+            values = self._series.setdefault((method, route, status), [0, 0.0, 0, 0.0, 0.0, 0, 0.0])
+            values[0] += 1
+            values[1] += seconds
+            values[2] += metrics.statements
+            values[3] += metrics.db_seconds
+            values[4] += metrics.serialize_seconds
+            values[5] += metrics.response_bytes
+            values[6] += metrics.compress_seconds
+
+    def record_slow_query(self) -> None:
+        # SQL 문은 여러 스레드(스레드풀, 묶음 쓰기)에서 동시에 끝나므로 잠금 안에서 증가
+        with self._lock:
+            self.slow_queries += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+            self.slow_queries = 0
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식으로 출력합니다."""
+        with self._lock:
+            series = sorted(self._series.items())
+            slow_queries = self.slow_queries
+        lines = []
+        for index, (name, kind, help_text) in enumerate(self.SERIES):
+            lines.append(f"# HELP bemorelog_{name} {help_text}")
+            lines.append(f"# TYPE bemorelog_{name} {kind}")
+            for (method, route, status), values in series:
+                lines.append(f'bemorelog_{name}{{method="{method}",route="{route}",status="{status}"}} {values[index]}')
+        lines.append("# HELP bemorelog_db_slow_queries_total SQL statements slower than SLOW_QUERY_MS")
+        lines.append("# TYPE bemorelog_db_slow_queries_total counter")
+        lines.append(f"bemorelog_db_slow_queries_total {slow_queries}")
+        return "\n".join(lines) + "\n"
+
+metrics_registry = MetricsRegistry()
+
+class MetricsMiddleware:
+    """요청마다 RequestMetrics를 만들어 Server-Timing 헤더를 붙이고 경로별 누적 값에 더합니다."""
+
+    def __init__(self, app):
+        self.app = app
+        self._routes = None  # endpoint 함수 -> 경로 템플릿
+
+    def _route_template(self, scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        if self._routes is None:
+            self._routes = {route.endpoint: route.path for route in scope["app"].routes if hasattr(route, "endpoint")}
+        return self._routes.get(endpoint, "unmatched")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics()
+        token = _current_metrics.set(metrics)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_metrics(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [
+                    (b"server-timing", metrics.server_timing(time.perf_counter() - start).encode())
+                ]
+            elif message["type"] == "http.response.body":
+                metrics.response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            _current_metrics.reset(token)
+            metrics_registry.observe(
+                scope["method"], self._route_template(scope), status, metrics, time.perf_counter() - start
+            )
@@ -0,0 +1,52 @@
+"""
+응답 JSON 인코딩
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 FastAPI 기본 응답과 같은 바이트를 만듭니다.
+"""
+
+import json
+from datetime import datetime, timedelta
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from .metrics import measure_serialization
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None
+
+JSON_MEDIA_TYPE = "application/json"
+
+class Payload(bytes):
+    """미리 인코딩된 응답 본문
+
+    캐시에 저장된 본문은 요청마다 같은 객체가 응답으로 나가므로, 압축 미들웨어가 압축한 본문을 encoded에
+    붙여 두면 캐시 항목이 살아 있는 동안 다시 압축하지 않고 함께 무효화/evict됩니다.
+    """
+
+    def __new__(cls, data: bytes):
+        payload = super().__new__(cls, data)
+        payload.encoded = {}  # Content-Encoding -> 압축한 본문
+        return payload
+
+def _default(value: Any):
+    if isinstance(value, datetime):
+        # pydantic과 같이 UTC는 "Z"로 표기
+        text = value.isoformat()
+        return text[:-6] + "Z" if value.utcoffset() == timedelta(0) else text
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dumps(content: Any) -> bytes:
+    """dict/list를 FastAPI JSONResponse와 같은 형식(공백 없음, UTF-8)의 JSON 바이트(Payload)로 인코딩합니다."""
+    with measure_serialization():
+        if orjson is not None:
+            return Payload(orjson.dumps(content, option=orjson.OPT_UTC_Z))
+        return Payload(json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default).encode())
+
+class TimedJSONResponse(JSONResponse):
+    """인코딩 시간을 요청 계측에 기록하는 JSONResponse (앱 기본 응답 클래스)"""
+
+    def render(self, content: Any) -> bytes:
+        with measure_serialization():
+            return super().render(content)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+동시 읽기 지연 시간 벤치마크 (sync Session vs AsyncSession)
+한 보드를 생성한 뒤 많은 클라이언트가 동시에 트리와 목록을 조회할 때의 p50/p95/p99를 비교합니다.
+
+sync 경로는 async 핸들러 안에서 커넥션을 기다리며 이벤트 루프를 막기 때문에, 동시 요청 수가
+풀 크기(기본 5 + overflow 10)를 넘으면 풀 timeout(30초)까지 멈춥니다. 비교를 위해 sync 모드는
+풀 크기를 동시 접속 수에 맞춰 실행합니다.
+
+실행: python -m benchmarks.async_readers [readers] [requests_per_reader]
+"""
+
+import asyncio
+import json
+import sys
+import time
+
+import httpx
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from benchmarks.common import bench_client, percentiles
+from benchmarks.batch import board_operations
+from app.controllers.epic import get_session
+from app.db.session import to_async_url
+from main import app
+
+async def run_readers(root_id: int, readers: int, requests_per_reader: int) -> list:
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def reader(reader_id: int):
+            for i in range(requests_per_reader):
+                url = f"/api/epic/{root_id}/tree" if (reader_id + i) % 2 else "/api/epic?include_subs=false"
+                start = time.perf_counter()
+                response = await client.get(url)
+                latencies.append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+
+        await asyncio.gather(*(reader(r) for r in range(readers)))
+    return latencies
+
+def main():
+    readers = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    requests_per_reader = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    results = []
+    for mode in ("sync", "async"):
+        engine_kwargs = {"pool_size": readers} if mode == "sync" else {}
+        with bench_client(**engine_kwargs) as (client, counter):
+            response = client.post("/api/epic/batch", json={"operations": board_operations()})
+            root_id = response.json()[0]["id"]
+
+            if mode == "async":
+                engine = create_async_engine(
+                    to_async_url(str(counter.engine.url)), poolclass=AsyncAdaptedQueuePool, pool_size=readers
+                )
+                AsyncBenchSessionLocal = async_sessionmaker(engine, autoflush=False)
+
+                async def get_bench_async_db():
+                    async with AsyncBenchSessionLocal() as db:
+                        yield db
+
+                app.dependency_overrides[get_session] = get_bench_async_db
+
+            start = time.perf_counter()
+            latencies = asyncio.run(run_readers(root_id, readers, requests_per_reader))
+            elapsed = time.perf_counter() - start
+            results.append({
+                "mode": mode,
+                "readers": readers,
+                "requests": len(latencies),
+                "requests_per_second": round(len(latencies) / elapsed, 1),
+                **percentiles(latencies),
+            })
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+81칸 만다라트 보드 채우기 벤치마크
+개별 POST /api/epic 81번 vs POST /api/epic/batch 한 번
+
+실행: python -m benchmarks.batch
+"""
+
+import json
+
+from benchmarks.common import bench_client, timer
+
+def board_operations():
+    """중앙 목표 1개, 주변 목표 8개, 각 주변 목표 아래 8개씩 create 작업
+
+    9x9 보드 81칸 중 주변 목표 8개는 두 칸에 함께 표시되므로 실제 epic은 73개입니다.
+    """
+    operations = [{"op": "create", "temp_id": "root", "data": {"title": "Root", "status": "todo", "position": 0}}]
+    for sub in range(1, 9):
+        operations.append({
+            "op": "create", "temp_id": f"sub-{sub}", "core_temp_id": "root",
+            "data": {"title": f"Goal {sub}", "status": "todo", "position": sub},
+        })
+        for cell in range(1, 9):
+            operations.append({
+                "op": "create", "core_temp_id": f"sub-{sub}",
+                "data": {"title": f"Task {sub}-{cell}", "status": "todo", "position": cell},
+            })
+    return operations
+
+def run_individual(client, operations):
+    ids = {}
+    for op in operations:
+        data = dict(op["data"])
+        if op.get("core_temp_id"):
+            data["core_epic_id"] = ids[op["core_temp_id"]]
+        epic = client.post("/api/epic", json=data).json()
+        if op.get("temp_id"):
+            ids[op["temp_id"]] = epic["id"]
+
+def run_batch(client, operations):
+    response = client.post("/api/epic/batch", json={"operations": operations})
+    response.raise_for_status()
+
+def main():
+    operations = board_operations()
+    result = {"epics": len(operations)}
+    for name, runner in (("individual", run_individual), ("batch", run_batch)):
+        with bench_client() as (client, counter):
+            with timer(result, f"{name}_ms"):
+                runner(client, operations)
+            result[f"{name}_queries"] = counter.count
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
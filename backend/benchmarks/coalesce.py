@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+묶음 쓰기(group commit) 벤치마크
+여러 사용자가 각자 칸에 글자를 입력할 때처럼 epic마다 PUT을 연달아 보내며,
+묶음 쓰기를 끈 경우 / 켠 경우(durable) / 켠 경우(non-durable)의 처리량과 지연 시간, commit 수를 비교합니다.
+
+실행: python -m benchmarks.coalesce [writers] [updates_per_writer] [window_ms]
+"""
+
+import asyncio
+import json
+import sys
+import time
+
+import httpx
+from sqlalchemy.orm import Session, sessionmaker
+
+from benchmarks.common import bench_client, seed_board, percentiles
+from app.services.coalesce import epic_write_coalescer
+from main import app
+
+async def type_into_cells(epic_ids, updates: int, durable: bool) -> list:
+    """epic마다 한 명씩 updates번 제목을 고치며, 각자 이전 응답을 받은 뒤 다음 요청을 보냅니다."""
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def writer(epic_id):
+            for index in range(updates):
+                start = time.perf_counter()
+                response = await client.put(
+                    f"/api/epic/{epic_id}", params={"durable": durable}, json={"title": f"draft {index}"}
+                )
+                response.raise_for_status()
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        await asyncio.gather(*[writer(epic_id) for epic_id in epic_ids])
+    return latencies
+
+def run(mode: str, writers: int, updates: int, window_ms: int) -> dict:
+    with bench_client() as (client, counter):
+        with Session(counter.engine) as session:
+            root_id = seed_board(session, writers, 1)
+        epic_ids = [sub["id"] for sub in client.get(f"/api/epic/{root_id}").json()["subs"]]
+
+        previous = (epic_write_coalescer.session_factory, epic_write_coalescer.window * 1000, epic_write_coalescer.durable)
+        epic_write_coalescer.configure(
+            sessionmaker(autocommit=False, autoflush=False, bind=counter.engine),
+            window_ms=0 if mode == "off" else window_ms,
+        )
+        flushes = epic_write_coalescer.flushes
+        try:
+            start = time.perf_counter()
+            latencies = asyncio.run(type_into_cells(epic_ids, updates, durable=mode != "non_durable"))
+            elapsed = time.perf_counter() - start
+            if mode == "non_durable":
+                # 남은 묶음은 종료 시처럼 바로 반영
+                asyncio.run(epic_write_coalescer.close())
+        finally:
+            commits = epic_write_coalescer.flushes - flushes if mode != "off" else len(latencies)
+            epic_write_coalescer.configure(previous[0], window_ms=previous[1], durable=previous[2])
+
+        final = client.get(f"/api/epic/{epic_ids[0]}").json()["title"]
+        return {
+            "mode": mode,
+            "requests": len(latencies),
+            "throughput_rps": round(len(latencies) / elapsed, 1),
+            "commits": commits,
+            "final_title_ok": final == f"draft {updates - 1}",
+            **percentiles(latencies),
+        }
+
+def main():
+    writers = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    updates = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    window_ms = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    results = [run(mode, writers, updates, window_ms) for mode in ("off", "durable", "non_durable")]
+    print(json.dumps({"writers": writers, "updates_per_writer": updates, "window_ms": window_ms, "results": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+벤치마크 공용 유틸리티
+임시 SQLite DB에 연결된 앱과 TestClient를 만들어 줍니다.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, insert, update
+from sqlalchemy.orm import sessionmaker
+
+from app.models.base import Base
+from app.models.epic import Epic, EpicRollupCount
+from app.db.session import get_db
+from app.controllers.epic import get_db_override
+from main import app
+
+class QueryCounter:
+    """엔진에서 실행된 SQL 문 수를 셉니다."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._count)
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+@contextmanager
+def bench_client(**engine_kwargs):
+    """임시 DB 파일을 사용하는 TestClient와 QueryCounter를 반환합니다."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(
+            f"sqlite:///{os.path.join(tmpdir, 'bench.db')}",
+            connect_args={"check_same_thread": False},
+            **engine_kwargs,
+        )
+        Base.metadata.create_all(bind=engine)
+        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        def get_bench_db():
+            db = SessionLocal()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        overrides = dict(app.dependency_overrides)
+        app.dependency_overrides[get_db] = get_bench_db
+        app.dependency_overrides[get_db_override] = get_bench_db
+        try:
+            with TestClient(app) as client:
+                yield client, QueryCounter(engine)
+        finally:
+            app.dependency_overrides.clear()
+            app.dependency_overrides.update(overrides)
+            engine.dispose()
+
+def seed_board(session, fanout: int = 8, levels: int = 2, title: str = "Board") -> int:
+    """루트 아래로 levels 단계만큼 fanout개씩 하위 epic을 가진 보드를 bulk INSERT로 생성합니다.
+
+    단계별 INSERT ... RETURNING 한 번과 path UPDATE 한 번으로 처리하므로 큰 보드도 빠르게 만들 수 있습니다.
+    모든 epic이 todo이므로 rollup(하위 epic 수)도 단계별로 바로 계산해 넣습니다. 반환값은 루트 epic id 입니다.
+    """
+    root = session.scalars(
+        insert(Epic).returning(Epic.id),
+        [{"title": title, "status": "todo", "depth": 0, "position": 0, "revision": 1}],
+    ).one()
+    session.execute(update(Epic), [{"id": root, "path": f"/{root}/"}])
+    parents = [(root, f"/{root}/")]
+    rollups = [{"epic_id": root, "status": "todo", "count": board_size(fanout, levels) - 1}] if levels else []
+    for depth in range(1, levels + 1):
+        rows = [
+            {
+                "title": f"{title} {depth}-{index}-{position}",
+                "status": "todo",
+                "depth": depth,
+                "position": position,
+                "core_epic_id": parent_id,
+                "revision": 1,
+                # RETURNING 순서와 무관하게 부모를 찾을 수 있도록 임시 path에 부모 path를 기록
+                "path": parent_path,
+            }
+            for index, (parent_id, parent_path) in enumerate(parents)
+            for position in range(1, fanout + 1)
+        ]
+        children = []
+        for start in range(0, len(rows), 10000):
+            children.extend(session.execute(insert(Epic).returning(Epic.id, Epic.path), rows[start:start + 10000]).all())
+        session.execute(update(Epic), [{"id": epic_id, "path": f"{path}{epic_id}/"} for epic_id, path in children])
+        parents = [(epic_id, f"{path}{epic_id}/") for epic_id, path in children]
+        if depth < levels:
+            descendants = board_size(fanout, levels - depth) - 1
+            rollups.extend({"epic_id": epic_id, "status": "todo", "count": descendants} for epic_id, _ in parents)
+    for start in range(0, len(rollups), 10000):
+        session.execute(insert(EpicRollupCount), rollups[start:start + 10000])
+    session.commit()
+    return root
+
+def board_size(fanout: int, levels: int) -> int:
+    return sum(fanout ** depth for depth in range(levels + 1))
+
+def percentiles(latencies_ms: list) -> dict:
+    """지연 시간 목록의 p50/p95/p99 (ms)"""
+    ordered = sorted(latencies_ms)
+    if not ordered:
+        return {"p50_ms": None, "p95_ms": None, "p99_ms": None}
+
+    def at(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 2)
+
+    return {"p50_ms": at(0.50), "p95_ms": at(0.95), "p99_ms": at(0.99)}
+
+@contextmanager
+def timer(result: dict, key: str):
+    start = time.perf_counter()
+    yield
+    result[key] = round((time.perf_counter() - start) * 1000, 2)
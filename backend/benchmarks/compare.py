@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+벤치마크 스위트 결과 비교
+두 결과 파일의 워크로드별 처리량과 p50/p95/p99를 비교하고, threshold(기본 10%)보다 나빠진 항목을 표시합니다.
+나빠진 항목이 있으면 종료 코드 1을 반환합니다.
+
+실행: python -m benchmarks.compare before.json after.json [threshold]
+"""
+
+import json
+import sys
+
+METRICS = (("throughput_rps", True), ("p50_ms", False), ("p95_ms", False), ("p99_ms", False))
+
+def compare(before: dict, after: dict, threshold: float = 0.10) -> list:
+    """(워크로드, 지표, 이전 값, 이후 값, 변화율, 회귀 여부) 목록"""
+    rows = []
+    for workload, result in after["workloads"].items():
+        baseline = before["workloads"].get(workload)
+        if baseline is None:
+            continue
+        for metric, higher_is_better in METRICS:
+            old, new = baseline.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            regressed = -change > threshold if higher_is_better else change > threshold
+            rows.append((workload, metric, old, new, change, regressed))
+    return rows
+
+def main():
+    if len(sys.argv) < 3:
+        raise SystemExit(__doc__)
+    with open(sys.argv[1]) as f:
+        before = json.load(f)
+    with open(sys.argv[2]) as f:
+        after = json.load(f)
+    threshold = float(sys.argv[3]) if len(sys.argv) > 3 else 0.10
+
+    if before.get("config") != after.get("config"):
+        print("Warning: benchmark configs differ", file=sys.stderr)
+    rows = compare(before, after, threshold)
+    for workload, metric, old, new, change, regressed in rows:
+        print(f"{workload:8} {metric:15} {old:>10} -> {new:>10} {change:+7.1%}{'  REGRESSION' if regressed else ''}")
+    sys.exit(1 if any(row[-1] for row in rows) else 0)
+
+if __name__ == "__main__":
+    main()
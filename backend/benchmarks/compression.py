@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+응답 압축 벤치마크
+보드 크기(마지막 단계 칸 수 81/6561/59049)별로 GET /api/epic/{id}/tree를 Accept-Encoding identity/gzip/br/zstd로 요청해
+전송 바이트, 요청당 CPU 시간(process_time), 응답 시간과 Server-Timing의 압축 시간을 비교합니다.
+  - cold: 매번 응답 캐시를 비워 조회/인코딩/압축을 모두 수행
+  - hot: 캐시된 본문과 함께 저장된 압축 결과를 재사용 (첫 요청 이후 다시 압축하지 않음)
+
+실행: python -m benchmarks.compression [repeat]
+"""
+
+import json
+import re
+import sys
+import time
+
+from sqlalchemy.orm import Session
+
+from benchmarks.common import bench_client, seed_board, board_size
+from app.services.cache import epic_cache
+
+BOARD_LEVELS = {81: 2, 6561: 4, 59049: 5}
+ENCODINGS = ("identity", "gzip", "br", "zstd")
+
+def _compress_ms(response) -> float:
+    return float(re.search(r"compress;dur=([\d.]+)", response.headers["server-timing"]).group(1))
+
+def measure(client, url: str, encoding: str, repeat: int, cold: bool) -> dict:
+    wall, cpu, compress = [], [], []
+    wire_bytes = 0
+    if not cold:
+        # 캐시와 압축 결과를 채워 둠
+        client.get(url, headers={"Accept-Encoding": encoding}).raise_for_status()
+    for _ in range(repeat):
+        if cold:
+            epic_cache.clear()
+        start, cpu_start = time.perf_counter(), time.process_time()
+        with client.stream("GET", url, headers={"Accept-Encoding": encoding}) as response:
+            wire_bytes = sum(len(chunk) for chunk in response.iter_raw())
+        cpu.append((time.process_time() - cpu_start) * 1000)
+        wall.append((time.perf_counter() - start) * 1000)
+        compress.append(_compress_ms(response))
+    return {
+        "wire_bytes": wire_bytes,
+        "ms": round(min(wall), 2),
+        "cpu_ms": round(min(cpu), 2),
+        "compress_ms": round(min(compress), 2),
+    }
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    epic_cache.enabled = True
+    results = []
+    for cells, levels in BOARD_LEVELS.items():
+        with bench_client() as (client, counter):
+            with Session(counter.engine) as session:
+                root_id = seed_board(session, 9, levels)
+            url = f"/api/epic/{root_id}/tree"
+            result = {"cells": cells, "epics": board_size(9, levels)}
+            for encoding in ENCODINGS:
+                result[encoding] = {
+                    "cold": measure(client, url, encoding, repeat, cold=True),
+                    "hot": measure(client, url, encoding, repeat, cold=False),
+                }
+                result[encoding]["ratio"] = round(result["identity"]["hot"]["wire_bytes"] / result[encoding]["hot"]["wire_bytes"], 1)
+            results.append(result)
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+DB 프로필별 동시 쓰기 처리량 벤치마크
+여러 스레드가 동시에 epic을 생성할 때 프로필(default / production)별 처리량과 잠금 오류 수를 측정합니다.
+BENCH_POSTGRES_URL 환경 변수가 있으면 PostgreSQL도 함께 측정합니다.
+
+실행: python -m benchmarks.db_profiles [writers] [writes_per_writer]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.db.session import create_db_engine
+from app.models.base import Base
+from app.models.epic import Epic
+
+def run_writers(url: str, profile: str, writers: int, writes_per_writer: int) -> dict:
+    engine = create_db_engine(url, profile)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def writer(writer_id: int) -> int:
+        errors = 0
+        for i in range(writes_per_writer):
+            db = SessionLocal()
+            try:
+                db.add(Epic(title=f"w{writer_id}-{i}", status="todo", depth=0))
+                db.commit()
+            except OperationalError:
+                db.rollback()
+                errors += 1
+            finally:
+                db.close()
+        return errors
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=writers) as pool:
+        errors = sum(pool.map(writer, range(writers)))
+    elapsed = time.perf_counter() - start
+    engine.dispose()
+
+    committed = writers * writes_per_writer - errors
+    return {
+        "profile": profile,
+        "backend": url.split(":", 1)[0],
+        "writers": writers,
+        "committed": committed,
+        "lock_errors": errors,
+        "seconds": round(elapsed, 3),
+        "writes_per_second": round(committed / elapsed, 1),
+    }
+
+def main():
+    writers = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    writes_per_writer = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for profile in ("default", "production"):
+            url = f"sqlite:///{os.path.join(tmpdir, profile + '.db')}"
+            results.append(run_writers(url, profile, writers, writes_per_writer))
+    postgres_url = os.getenv("BENCH_POSTGRES_URL")
+    if postgres_url:
+        results.append(run_writers(postgres_url, "default", writers, writes_per_writer))
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
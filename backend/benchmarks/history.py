@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+편집 기록/시점 재구성 벤치마크
+보드 크기별로 자동 저장 PUT을 edits번 보낸 뒤 편집 기록 한 건의 크기, 스냅샷 수와 압축 크기,
+임의 시점 재구성(GET /history?at=) 지연 시간과 적용한 기록 수를 현재 트리 조회(GET /tree)와 비교합니다.
+기존 보드처럼 편집 기록 없이 만든 보드는 시작할 때 스냅샷 하나를 남겨 기준으로 삼습니다.
+
+실행: python -m benchmarks.history [edits]
+"""
+
+import json
+import random
+import sys
+import time
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from benchmarks.common import bench_client, seed_board, board_size, percentiles
+from app.models.epic import Epic, EpicHistory, EpicSnapshot
+from app.services.epic import EpicService
+
+def main():
+    edits = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    random.seed(0)
+    results = []
+
+    for levels in (2, 4):
+        with bench_client() as (client, counter):
+            with Session(counter.engine) as session:
+                board_id = seed_board(session, 8, levels)
+                EpicService(session)._take_snapshot(board_id)
+                session.commit()
+                cell_ids = session.execute(select(Epic.id).where(Epic.id != board_id)).scalars().all()
+
+            moments = []
+            start = time.perf_counter()
+            for index in range(edits):
+                client.put(
+                    f"/api/epic/{random.choice(cell_ids)}",
+                    json={"title": f"edit {index}", "status": random.choice(["todo", "running", "done"])},
+                ).raise_for_status()
+                if index % (edits // 20 or 1) == 0:
+                    moments.append(datetime.now())
+            put_ms = (time.perf_counter() - start) * 1000 / edits
+
+            tree_ms = []
+            for _ in range(5):
+                start = time.perf_counter()
+                client.get(f"/api/epic/{board_id}/tree", headers={"Cache-Control": "no-cache"}).raise_for_status()
+                tree_ms.append((time.perf_counter() - start) * 1000)
+                # 캐시된 응답이 아니라 조회 비용을 재도록 매번 하나를 바꿈
+                client.put(f"/api/epic/{cell_ids[0]}", json={"title": "tick"})
+
+            history_ms, replayed = [], []
+            with Session(counter.engine) as session:
+                service = EpicService(session)
+                for moment in moments:
+                    start = time.perf_counter()
+                    client.get(f"/api/epic/{board_id}/history", params={"at": moment.isoformat()}).raise_for_status()
+                    history_ms.append((time.perf_counter() - start) * 1000)
+                    replayed.append(service._board_state_at(board_id, moment)[2])
+                history_rows, change_bytes = session.execute(
+                    select(func.count(), func.sum(func.length(EpicHistory.changes)))
+                ).one()
+                snapshots, snapshot_bytes = session.execute(
+                    select(func.count(), func.sum(func.length(EpicSnapshot.data)))
+                ).one()
+
+            results.append({
+                "board_epics": board_size(8, levels),
+                "edits": edits,
+                "put_ms_avg": round(put_ms, 2),
+                "history_rows": history_rows,
+                "change_bytes_avg": round(change_bytes / history_rows, 1),
+                "snapshots": snapshots,
+                "snapshot_kb_avg": round(snapshot_bytes / snapshots / 1024, 1),
+                "tree": percentiles(tree_ms),
+                "history": percentiles(history_ms),
+                "replayed_max": max(replayed),
+            })
+
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+하위 트리 이동/교환 벤치마크
+루트 아래 1~levels단계(단계마다 fanout개)의 하위 트리를 다른 보드로 옮기고 되돌려 맞바꿀 때
+하위 트리 크기에 따른 SQL 문 수와 시간을 측정합니다. 문 수는 크기와 관계없이 같아야 합니다.
+
+실행: python -m benchmarks.move [fanout] [levels]
+"""
+
+import json
+import sys
+
+from sqlalchemy.orm import Session
+
+from benchmarks.common import bench_client, seed_board, board_size, timer
+
+def main():
+    fanout = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    levels = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    results = []
+
+    for depth in range(1, levels + 1):
+        with bench_client() as (client, counter):
+            with Session(counter.engine) as session:
+                source_id = seed_board(session, fanout, depth, title="Source")
+                target_id = seed_board(session, fanout, 0, title="Target")
+            # 옮길 하위 트리: 원래 보드의 첫 번째 칸 (fanout개씩 depth-1단계)
+            subtree_id = client.get(f"/api/epic/{source_id}/rollup").json()["subs"][0]["id"]
+            result = {"subtree_epics": board_size(fanout, depth - 1)}
+
+            counter.count = 0
+            with timer(result, "move_ms"):
+                response = client.post(f"/api/epic/{subtree_id}/move", json={"core_epic_id": target_id})
+            response.raise_for_status()
+            result["move_queries"] = counter.count
+
+            # 다른 보드의 칸과 맞바꾸어 원래 보드로 되돌림
+            second_id = client.get(f"/api/epic/{source_id}/rollup").json()["subs"][0]["id"]
+            counter.count = 0
+            with timer(result, "swap_ms"):
+                response = client.post("/api/epic/swap", json={"first_id": subtree_id, "second_id": second_id})
+            response.raise_for_status()
+            result["swap_queries"] = counter.count
+            results.append(result)
+
+    print(json.dumps({"fanout": fanout, "results": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
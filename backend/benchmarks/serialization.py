@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+트리 응답 직렬화 벤치마크
+약 1천/1만/10만 개 epic 트리에 대해 GET /api/epic/{id}/tree 응답 시간을 비교합니다.
+  - legacy: ORM 객체 → EpicResponse 트리(build_epic_tree) → response_model 검증 → JSONResponse
+  - fast: Core row → 중첩 dict → 미리 인코딩한 JSON 바이트 (현재 구현)
+응답 캐시는 끄고 측정합니다.
+
+실행: python -m benchmarks.serialization [repeat]
+"""
+
+import json
+import sys
+import time
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+
+from benchmarks.common import bench_client, seed_board, board_size
+from app.controllers.epic import get_db_override
+from app.models.epic import Epic, EpicResponse, build_epic_tree
+from app.services.cache import epic_cache
+from main import app
+
+legacy_router = APIRouter(prefix="/legacy")
+
+@legacy_router.get("/{epic_id}/tree", response_model=EpicResponse)
+async def read_legacy_tree(epic_id: int, db: Session = Depends(get_db_override)):
+    tree = select(Epic.id).where(Epic.id == epic_id).cte("epic_tree", recursive=True)
+    tree = tree.union_all(select(Epic.id).join(tree, Epic.core_epic_id == tree.c.id))
+    epics = db.query(Epic).options(selectinload(Epic.rollups)).join(tree, Epic.id == tree.c.id).order_by(Epic.id).all()
+    return build_epic_tree(epics, epic_id)
+
+app.include_router(legacy_router)
+
+SIZES = [(10, 3), (10, 4), (10, 5)]  # 1,111 / 11,111 / 111,111개
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    epic_cache.enabled = False
+    results = []
+    for fanout, levels in SIZES:
+        result = {"epics": board_size(fanout, levels)}
+        with bench_client() as (client, counter):
+            with Session(counter.engine) as session:
+                root_id = seed_board(session, fanout, levels)
+            for name, url in (("legacy", f"/legacy/{root_id}/tree"), ("fast", f"/api/epic/{root_id}/tree")):
+                timings = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    response = client.get(url)
+                    timings.append((time.perf_counter() - start) * 1000)
+                    response.raise_for_status()
+                result[f"{name}_ms"] = round(min(timings), 2)
+                result[f"{name}_bytes"] = len(response.content)
+            result["speedup"] = round(result["legacy_ms"] / result["fast_ms"], 1)
+        results.append(result)
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+보드 shard 쓰기 처리량 벤치마크
+보드마다 한 명씩(워커 프로세스) 자기 보드의 칸 제목을 연달아 고칠 때(요청마다 commit), 모든 보드를 한 DB에 둔 경우와
+보드마다 shard(SQLite 파일)를 나눈 경우의 초당 쓰기 수를 보드 수별로 비교합니다.
+한 DB에서는 쓰기 잠금 때문에 보드가 늘어도 처리량이 그대로이고, shard를 나누면 CPU/디스크가 허락하는 만큼
+보드 수에 비례해 늘어나야 합니다 (쓰기 한 번이 CPU를 주로 쓰므로 코어가 하나이면 두 경우 모두 그대로입니다).
+
+실행: python -m benchmarks.shards [max_boards] [updates_per_board]
+      (DB_PROFILE=production이면 WAL/synchronous=NORMAL로 측정)
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.common import seed_board
+from app.db.session import create_db_engine
+from app.db.sharding import ShardMap
+from app.models.base import Base
+from app.models.epic import Epic, EpicUpdate
+from app.services.epic import EpicService
+
+def write_cells(url: str, board_id: int, updates: int, start) -> None:
+    """워커 프로세스: 자기 보드가 있는 DB에 따로 연결해 updates번 commit합니다."""
+    engine = create_db_engine(url)
+    start.wait()
+    with sessionmaker(autocommit=False, autoflush=False, bind=engine)() as db:
+        cells = [epic_id for (epic_id,) in db.query(Epic.id).filter(Epic.core_epic_id == board_id)]
+        for index in range(updates):
+            service = EpicService(db)
+            asyncio.run(service.update_epic(cells[index % len(cells)], EpicUpdate(title=f"draft {index}")))
+    engine.dispose()
+
+def run(boards: int, sharded: bool, updates: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        directory_url = f"sqlite:///{os.path.join(tmpdir, 'board_0.db')}"
+        engine = create_db_engine(directory_url)
+        Base.metadata.create_all(bind=engine)
+        directory_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        shard_map = ShardMap()
+        if sharded:
+            urls = [f"sqlite:///{os.path.join(tmpdir, f'board_{shard}.db')}" for shard in range(1, boards)]
+            for url in urls:
+                shard_engine = create_db_engine(url)
+                Base.metadata.create_all(bind=shard_engine)
+                shard_engine.dispose()
+            shard_map.configure(urls, engine, async_mode=False)
+            with directory_factory() as directory:
+                shard_map.register(directory)
+
+        writers = []
+        for _ in range(boards):
+            with directory_factory() as directory:
+                shard = shard_map.place_board(directory)
+            session_factory = directory_factory if shard == 0 else shard_map.session_factory(shard)
+            with session_factory() as db:
+                writers.append((str(db.get_bind().url) if shard else directory_url, seed_board(db, 8, 1)))
+
+        start = multiprocessing.Barrier(boards + 1)
+        processes = [
+            multiprocessing.Process(target=write_cells, args=(url, board_id, updates, start)) for url, board_id in writers
+        ]
+        for process in processes:
+            process.start()
+        # 모든 워커가 연결을 마친 뒤 동시에 시작
+        start.wait()
+        started = time.perf_counter()
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - started
+        shard_map.reset()
+        engine.dispose()
+        return {
+            "boards": boards,
+            "mode": "sharded" if sharded else "single",
+            "writes": boards * updates,
+            "writes_per_sec": round(boards * updates / elapsed, 1),
+        }
+
+def main():
+    max_boards = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    updates = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    board_counts = [count for count in (1, 2, 4, 8, 16) if count <= max_boards]
+    results = [run(boards, sharded, updates) for boards in board_counts for sharded in (False, True)]
+    print(json.dumps({
+        "updates_per_board": updates,
+        "cpus": os.cpu_count(),
+        "profile": os.getenv("DB_PROFILE", "default"),
+        "results": results,
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
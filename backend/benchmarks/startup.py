@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+워커 시작 시간 벤치마크
+워커 N개를 동시에 띄워 워커마다 모듈 import, 앱 구성(create_app), 첫 요청(보드 트리 조회)에 걸린 시간과
+프로세스 시작부터 첫 응답까지의 시간을 측정합니다. 스키마는 배포 단계처럼 한 번만 마이그레이션해 두고,
+create_all 모드는 예전처럼 워커마다 시작할 때 Base.metadata.create_all을 실행합니다.
+
+실행: python -m benchmarks.startup [max_workers]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def worker(mode: str, board_id: int) -> None:
+    """워커 프로세스: 단계별 시간을 JSON 한 줄로 출력합니다."""
+    # 워커 프로세스에서는 앱 모듈을 import하는 benchmarks.common을 불러오지 않음
+    start = time.perf_counter()
+    import fastapi.testclient
+    import main
+    imported = time.perf_counter()
+
+    if mode == "create_all":
+        from app.db.session import engine
+        from app.models.base import Base
+        Base.metadata.create_all(bind=engine)
+    app = main.create_app()
+    constructed = time.perf_counter()
+
+    with fastapi.testclient.TestClient(app) as client:
+        client.get(f"/api/epic/{board_id}/tree").raise_for_status()
+    served = time.perf_counter()
+    print(json.dumps({
+        "import_ms": (imported - start) * 1000,
+        "app_ms": (constructed - imported) * 1000,
+        "first_request_ms": (served - constructed) * 1000,
+        "served_at": time.time(),
+    }))
+
+def run(mode: str, workers: int, url: str, board_id: int) -> dict:
+    from benchmarks.common import percentiles
+
+    env = {**os.environ, "DATABASE_URL": url}
+    launched = time.time()
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.startup", "--worker", mode, str(board_id)],
+            cwd=BACKEND_DIR, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        )
+        for _ in range(workers)
+    ]
+    results = [json.loads(process.communicate()[0].strip().splitlines()[-1]) for process in processes]
+    summary = {"mode": mode, "workers": workers}
+    for phase in ("import_ms", "app_ms", "first_request_ms"):
+        summary[phase] = percentiles([result[phase] for result in results])["p50_ms"]
+    # 모든 워커가 첫 요청에 응답할 때까지 걸린 시간 (프로세스 시작 포함)
+    summary["all_ready_ms"] = round((max(result["served_at"] for result in results) - launched) * 1000, 1)
+    return summary
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--worker":
+        worker(sys.argv[2], int(sys.argv[3]))
+        return
+
+    from sqlalchemy.orm import Session
+    from sqlalchemy import create_engine
+    from benchmarks.common import seed_board
+    from app.db.init_db import upgrade
+
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    with tempfile.TemporaryDirectory() as tmpdir:
+        url = f"sqlite:///{os.path.join(tmpdir, 'startup.db')}"
+        upgrade(url)
+        engine = create_engine(url)
+        with Session(engine) as session:
+            board_id = seed_board(session, 8, 2)
+        engine.dispose()
+
+        worker_counts = [count for count in (1, 2, 4, 8, 16) if count <= max_workers]
+        results = [run(mode, workers, url, board_id) for workers in worker_counts for mode in ("create_all", "migrated")]
+    print(json.dumps({"cpus": os.cpu_count(), "results": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+하위 트리 삭제 벤치마크
+루트 아래 4단계, 단계마다 9개씩(마지막 단계 6561개) 하위 epic이 있는 보드를 삭제할 때
+집합 단위 DELETE와 기존 방식(단계마다 SELECT 후 ORM 객체를 하나씩 삭제)을 비교합니다.
+
+실행: python -m benchmarks.subtree_delete [fanout] [levels]
+"""
+
+import json
+import sys
+
+from sqlalchemy.orm import Session
+
+from benchmarks.common import bench_client, seed_board, board_size, timer
+from app.models.epic import Epic
+
+def legacy_recursive_delete(db: Session, epic_id: int):
+    """기존 _delete_sub_epics 방식: 단계마다 SELECT 후 ORM 객체를 하나씩 삭제"""
+    for sub_epic in db.query(Epic).filter(Epic.core_epic_id == epic_id).all():
+        legacy_recursive_delete(db, sub_epic.id)
+        db.delete(sub_epic)
+
+def main():
+    fanout = int(sys.argv[1]) if len(sys.argv) > 1 else 9
+    levels = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    result = {"fanout": fanout, "levels": levels, "epics": board_size(fanout, levels)}
+
+    with bench_client() as (client, counter):
+        with Session(counter.engine) as session:
+            root_id = seed_board(session, fanout, levels)
+        counter.count = 0
+        with timer(result, "set_based_ms"):
+            response = client.delete(f"/api/epic/{root_id}")
+        response.raise_for_status()
+        result["set_based_queries"] = counter.count
+        result["deleted"] = response.json()["deleted"]
+
+    with bench_client() as (client, counter):
+        with Session(counter.engine) as session:
+            root_id = seed_board(session, fanout, levels)
+            counter.count = 0
+            with timer(result, "legacy_recursive_ms"):
+                legacy_recursive_delete(session, root_id)
+                session.delete(session.get(Epic, root_id))
+                session.commit()
+        result["legacy_recursive_queries"] = counter.count
+
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+epic API 부하/벤치마크 스위트
+만다라트 보드(한 칸마다 3x3 그리드의 9개 하위 칸)를 원하는 크기로 생성한 뒤, 프로세스 안의 ASGI 앱에
+동시 요청을 보내 워크로드별 처리량과 p50/p95/p99 지연 시간을 JSON으로 출력합니다.
+커밋 사이의 성능 회귀는 결과 파일을 benchmarks.compare로 비교해 확인합니다.
+
+보드 크기는 마지막 단계 칸 수입니다: 81(2단계), 6561(4단계), 531441(6단계)
+
+실행 예:
+  python -m benchmarks.suite --board 6561 --concurrency 16 --output before.json
+  python -m benchmarks.suite --board 81 --workloads get,tree --requests 500
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import sqlite3
+import subprocess
+import time
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from benchmarks.common import bench_client, seed_board, board_size, percentiles
+from app.models.epic import Epic
+from app.services.cache import epic_cache
+from main import app
+
+FANOUT = 9
+BOARD_LEVELS = {81: 2, 6561: 4, 531441: 6}
+# delete는 보드를 지우므로 마지막에 실행
+WORKLOADS = ("list", "get", "tree", "create", "mixed", "delete")
+
+class Board:
+    """생성한 보드의 단계별 epic id (요청 대상을 고르는 데 사용)"""
+
+    def __init__(self, session: Session, root_id: int, levels: int, seed: int):
+        self.root_id = root_id
+        self.levels = levels
+        self.random = random.Random(seed)
+        self.ids = []
+        self.ids_by_depth = [[] for _ in range(levels + 1)]
+        for epic_id, depth in session.execute(select(Epic.id, Epic.depth)):
+            self.ids.append(epic_id)
+            self.ids_by_depth[depth].append(epic_id)
+        # 하위 트리 조회/삭제 대상: 9 + 81개 하위 epic을 가진 단계 (작은 보드는 루트 바로 아래)
+        self.subtree_depth = max(0, levels - 2)
+        self.delete_targets = list(self.ids_by_depth[max(1, self.subtree_depth)])
+        self.random.shuffle(self.delete_targets)
+
+    def any_id(self) -> int:
+        # 칸 수에 비례해 고르므로 대부분 마지막 단계 칸이 선택됨
+        return self.random.choice(self.ids)
+
+    def leaf_id(self) -> int:
+        return self.random.choice(self.ids_by_depth[self.levels])
+
+    def subtree_id(self) -> int:
+        return self.random.choice(self.ids_by_depth[self.subtree_depth])
+
+    def parent_id(self) -> int:
+        return self.random.choice(self.ids_by_depth[self.levels - 1])
+
+def request_for(workload: str, board: Board, index: int):
+    """워크로드의 index번째 요청 (method, url, json)"""
+    if workload == "list":
+        return "GET", f"/api/epic?limit=100&include_subs=false&skip={board.random.randrange(1000)}", None
+    if workload == "get":
+        return "GET", f"/api/epic/{board.any_id()}", None
+    if workload == "tree":
+        return "GET", f"/api/epic/{board.subtree_id()}/tree", None
+    if workload == "create":
+        return "POST", "/api/epic", {"title": f"Burst {index}", "status": "TODO", "core_epic_id": board.parent_id()}
+    if workload == "delete":
+        return "DELETE", f"/api/epic/{board.delete_targets.pop()}", None
+    # mixed: 읽기 80%, 쓰기 20%
+    roll = board.random.random()
+    if roll < 0.4:
+        return request_for("get", board, index)
+    if roll < 0.8:
+        return request_for("tree", board, index)
+    if roll < 0.9:
+        return request_for("create", board, index)
+    return "PUT", f"/api/epic/{board.leaf_id()}", {"status": board.random.choice(["TODO", "DOING", "DONE"])}
+
+async def run_workload(workload: str, board: Board, requests: int, concurrency: int) -> dict:
+    if workload == "delete":
+        requests = min(requests, len(board.delete_targets))
+    latencies = []
+    errors = 0
+    queue = iter(range(requests))
+    # 앱 예외는 500 응답으로 받아 오류 수에 포함
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def worker():
+            nonlocal errors
+            for index in queue:
+                method, url, body = request_for(workload, board, index)
+                start = time.perf_counter()
+                response = await client.request(method, url, json=body)
+                latencies.append((time.perf_counter() - start) * 1000)
+                if response.status_code >= 400:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else None,
+        **percentiles(latencies),
+    }
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "machine": platform.machine(),
+    }
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--board", type=int, choices=sorted(BOARD_LEVELS), default=6561, help="마지막 단계 칸 수")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=400, help="워크로드별 요청 수")
+    parser.add_argument("--workloads", default=",".join(WORKLOADS))
+    parser.add_argument("--cache", action="store_true", help="응답 캐시를 켠 상태로 측정 (기본: 끔)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    workloads = [workload.strip() for workload in args.workloads.split(",") if workload.strip()]
+    unknown = set(workloads) - set(WORKLOADS)
+    if unknown:
+        raise SystemExit(f"Unknown workloads: {', '.join(sorted(unknown))}")
+
+    levels = BOARD_LEVELS[args.board]
+    epic_cache.enabled = args.cache
+    report = {
+        "environment": environment(),
+        "config": {
+            "board": args.board,
+            "epics": board_size(FANOUT, levels),
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "cache": args.cache,
+            "seed": args.seed,
+        },
+        "workloads": {},
+    }
+
+    # 동기 Session은 async 핸들러 안에서 커넥션을 기다리며 이벤트 루프를 막으므로 풀 크기를 동시 요청 수에 맞춤
+    with bench_client(pool_size=args.concurrency) as (client, counter):
+        start = time.perf_counter()
+        with Session(counter.engine) as session:
+            root_id = seed_board(session, FANOUT, levels, title="Mandalart")
+            board = Board(session, root_id, levels, args.seed)
+        report["config"]["seed_s"] = round(time.perf_counter() - start, 2)
+
+        for workload in workloads:
+            counter.count = 0
+            result = asyncio.run(run_workload(workload, board, args.requests, args.concurrency))
+            result["statements"] = counter.count
+            report["workloads"][workload] = result
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+
+if __name__ == "__main__":
+    main()
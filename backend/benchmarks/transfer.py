@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+NDJSON export/import 벤치마크
+fanout^levels 규모의 보드를 export한 뒤 다시 import하면서 소요 시간과
+Python 힙 최대 사용량(tracemalloc)을 측정합니다. 최대 사용량이 보드 크기에 비례하지 않아야 합니다.
+
+실행: python -m benchmarks.transfer [fanout] [levels]   (10 6 이면 약 111만 개)
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from sqlalchemy.orm import Session
+
+from benchmarks.common import bench_client, seed_board, board_size, timer
+from app.services.epic import EpicService, TRANSFER_CHUNK_SIZE, iter_ndjson_records
+
+async def read_file(path: str, chunk_size: int = 64 * 1024):
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+async def import_file(service: EpicService, path: str):
+    state = await service.begin_import()
+    records = []
+    async for record in iter_ndjson_records(read_file(path)):
+        records.append(record)
+        if len(records) >= TRANSFER_CHUNK_SIZE:
+            await service.import_epics(records, state)
+            records = []
+    await service.import_epics(records, state)
+    return await service.finish_import(state)
+
+TRACE = not os.getenv("NO_TRACE")
+
+def main():
+    fanout = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    levels = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    result = {"fanout": fanout, "levels": levels, "epics": board_size(fanout, levels)}
+
+    with bench_client() as (client, counter), tempfile.TemporaryDirectory() as tmpdir:
+        export_path = os.path.join(tmpdir, "epics.ndjson")
+        with Session(counter.engine) as session:
+            seed_board(session, fanout, levels)
+
+        with Session(counter.engine) as session:
+            if TRACE: tracemalloc.start()
+            with timer(result, "export_ms"), open(export_path, "wb") as f:
+                for chunk in EpicService(session).export_epics():
+                    f.write(chunk)
+            if TRACE: result["export_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 1)
+            if TRACE: tracemalloc.stop()
+        result["export_file_mb"] = round(os.path.getsize(export_path) / 2**20, 1)
+
+        with Session(counter.engine) as session:
+            if TRACE: tracemalloc.start()
+            with timer(result, "import_ms"):
+                response = asyncio.run(import_file(EpicService(session), export_path))
+            if TRACE: result["import_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 1)
+            if TRACE: tracemalloc.stop()
+        result["imported"] = response.imported
+
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
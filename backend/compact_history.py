@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+편집 기록 정리(retention/compaction) 스크립트
+EPIC_HISTORY_RETENTION_DAYS(기본 30일)보다 오래된 epic 편집 기록을 보드마다 그 시점의 스냅샷 하나로 합칩니다.
+보존 기간 안의 시점은 계속 재구성할 수 있고, 그 이전에 삭제된 보드는 기록이 모두 지워집니다.
+기본 DB와 DB_SHARD_URLS의 모든 shard에 실행하며, 주기적으로(예: 하루 한 번) 다시 실행해도 안전합니다.
+
+실행: python compact_history.py [보존 일수]
+"""
+
+import sys
+import os
+import asyncio
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.db.session import SQLALCHEMY_DATABASE_URL
+from app.db.sharding import DB_SHARD_URLS
+from app.services.epic import EpicService
+from app.services.history import HISTORY_RETENTION_DAYS
+
+def compact_history(url: str, before: datetime):
+    """url의 DB에서 before 이전의 편집 기록을 정리합니다."""
+    engine = create_engine(url)
+
+    db = sessionmaker(bind=engine)()
+    try:
+        result = asyncio.run(EpicService(db).compact_history(before))
+        print(f"✅ 보드 {result['boards']}개: 기록 {result['history']}개, 스냅샷 {result['snapshots']}개를 정리했습니다.")
+
+    except Exception as e:
+        print(f"❌ 편집 기록 정리 중 오류 발생: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+        engine.dispose()
+
+if __name__ == "__main__":
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else HISTORY_RETENTION_DAYS
+    before = datetime.now() - timedelta(days=days)
+    print(f"🚀 {before.isoformat(timespec='seconds')} 이전의 편집 기록을 정리합니다...")
+    for url in [SQLALCHEMY_DATABASE_URL, *DB_SHARD_URLS]:
+        compact_history(url, before)
+    print("🎉 편집 기록 정리가 완료되었습니다.")
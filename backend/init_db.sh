@@ -5,7 +5,7 @@ if [ -d "venv" ]; then
     source venv/bin/activate
 fi
 
-# Run the database initialization script
+# Apply alembic migrations (default DB and every DB_SHARD_URLS shard) and register shards
 python -m app.db.init_db
 
 echo "Database initialization completed" 
\ No newline at end of file
@@ -1,23 +1,56 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.models.base import Base
-from app.db.session import engine
-from app.controllers import epic, epic_relation
-
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
-app = FastAPI()
-
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:5173"],  # Vue.js default dev server port
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include API routes from controllers
-app.include_router(epic.router)
-app.include_router(epic_relation.router)
\ No newline at end of file
+from app.db.session import engine, SessionLocal, AsyncSessionLocal, USE_ASYNC_DB
+from app.db.sharding import DB_SHARD_URLS, shard_map
+from app.controllers import epic, epic_relation, epic_events, metrics
+from app.services.coalesce import epic_write_coalescer
+from app.services.compression import CompressionMiddleware
+from app.services.metrics import MetricsMiddleware
+from app.services.serialization import TimedJSONResponse
+
+def create_app() -> FastAPI:
+    """앱을 구성합니다. 워커마다 실행되므로 DB에 접속하지 않습니다.
+
+    스키마는 배포 시 한 번 `python -m app.db.init_db`(alembic upgrade head)로 적용하고,
+    엔진과 shard 디렉터리는 첫 요청에서 연결됩니다.
+    """
+    app = FastAPI(default_response_class=TimedJSONResponse)
+
+    # Configure CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:5173"],  # Vue.js default dev server port
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["X-Next-Cursor", "ETag", "Server-Timing"],
+    )
+    # Accept-Encoding에 맞춰 zstd/br/gzip으로 압축 (캐시된 본문은 압축 결과도 함께 재사용)
+    app.add_middleware(CompressionMiddleware)
+    # 요청별 SQL 문 수/DB 시간/인코딩/압축 시간을 Server-Timing 헤더와 /metrics로 제공
+    # (압축 미들웨어보다 바깥에 있으므로 압축 후 실제로 보낸 바이트를 셈)
+    app.add_middleware(MetricsMiddleware)
+
+    # Include API routes from controllers
+    # epic_relation, epic_events의 고정 경로(/api/epic/relations, /api/epic/events)가
+    # /api/epic/{epic_id}보다 먼저 매칭되도록 먼저 등록
+    app.include_router(epic_relation.router)
+    app.include_router(epic_events.router)
+    app.include_router(epic.router)
+    app.include_router(metrics.router)
+
+    # DB_SHARD_URLS가 있으면 보드(루트 epic)마다 하위 트리를 나눠 담을 shard로 라우팅
+    if DB_SHARD_URLS:
+        shard_map.configure(DB_SHARD_URLS, engine)
+
+    # EPIC_WRITE_COALESCE_MS > 0이면 연속된 PUT을 묶어 한 트랜잭션으로 반영
+    epic_write_coalescer.configure(AsyncSessionLocal if USE_ASYNC_DB else SessionLocal)
+
+    @app.on_event("shutdown")
+    async def flush_pending_writes():
+        # 종료 전에 아직 반영되지 않은 묶음 쓰기를 바로 commit
+        await epic_write_coalescer.close()
+
+    return app
+
+app = create_app()
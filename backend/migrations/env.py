@@ -0,0 +1,50 @@
+"""
+alembic 마이그레이션 환경
+대상 DB URL 우선순위: config.attributes["url"] (app.db.init_db) > -x url=... > DATABASE_URL
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from app.db.session import SQLALCHEMY_DATABASE_URL
+from app.models.base import Base
+import app.models.epic  # noqa: F401 - 모든 테이블을 Base.metadata에 등록
+from migrations.schema import include_name
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+def database_url() -> str:
+    return config.attributes.get("url") or context.get_x_argument(as_dictionary=True).get("url") or SQLALCHEMY_DATABASE_URL
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=database_url(),
+        target_metadata=target_metadata,
+        include_name=include_name,
+        literal_binds=True,
+        render_as_batch=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online() -> None:
+    engine = create_engine(database_url(), poolclass=pool.NullPool)
+    with engine.connect() as connection:
+        # SQLite의 컬럼 변경은 테이블을 다시 만드는 batch 모드로 실행
+        context.configure(
+            connection=connection, target_metadata=target_metadata, include_name=include_name, render_as_batch=True
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+    engine.dispose()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,28 @@
+"""
+마이그레이션 공용 헬퍼
+이전 migrate_*.py 스크립트나 create_all로 이미 바뀐 DB에서도 같은 revision을 그대로 적용할 수 있도록
+테이블/컬럼/인덱스가 이미 있는지 확인합니다.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+def has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+def has_column(table: str, column: str) -> bool:
+    return any(info["name"] == column for info in sa.inspect(op.get_bind()).get_columns(table))
+
+def has_index(table: str, index: str) -> bool:
+    return any(info["name"] == index for info in sa.inspect(op.get_bind()).get_indexes(table))
+
+def create_index_if_missing(index: str, table: str, columns: list, **kw) -> None:
+    if not has_index(table, index):
+        op.create_index(index, table, columns, **kw)
+
+def dialect() -> str:
+    return op.get_bind().dialect.name
+
+def include_name(name, type_, parent_names) -> bool:
+    """autogenerate 비교에서 FTS5 가상 테이블(epics_fts)과 그 내부 테이블은 제외 (0006에서 직접 관리)"""
+    return not (type_ == "table" and name.startswith("epics_fts"))
@@ -0,0 +1,54 @@
+"""initial schema: epics, epic_relations
+
+처음 공개된 스키마입니다. create_all로 이미 만들어진 DB에서는 건너뜁니다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.schema import has_table
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not has_table("epics"):
+        op.create_table(
+            "epics",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("title", sa.String()),
+            sa.Column("description", sa.String()),
+            sa.Column("status", sa.String()),
+            sa.Column("depth", sa.Integer()),
+            sa.Column("position", sa.Integer(), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column("updated_at", sa.DateTime(timezone=True)),
+            sa.Column("core_epic_id", sa.Integer(), sa.ForeignKey("epics.id"), nullable=True),
+            # SQLite에서도 id를 재사용하지 않음 (shard별 id 시작값을 sqlite_sequence로 지정)
+            sqlite_autoincrement=True,
+        )
+        op.create_index("ix_epics_id", "epics", ["id"])
+        op.create_index("ix_epics_title", "epics", ["title"])
+
+    if not has_table("epic_relations"):
+        op.create_table(
+            "epic_relations",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("core_epic_id", sa.Integer(), sa.ForeignKey("epics.id"), nullable=False),
+            sa.Column("sub_epic_id", sa.Integer(), sa.ForeignKey("epics.id"), nullable=False),
+            sa.Column("position_row", sa.Integer(), nullable=False),
+            sa.Column("position_col", sa.Integer(), nullable=False),
+            sa.Column("depth", sa.Integer(), nullable=False),
+        )
+        op.create_index("ix_epic_relations_id", "epic_relations", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_table("epic_relations")
+    op.drop_table("epics")
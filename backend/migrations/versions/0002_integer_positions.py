@@ -0,0 +1,93 @@
+"""integer grid positions
+
+이전 스크립트(migrate_add_position.py, update_position_format.py)는 position을 VARCHAR로 추가하거나
+INTEGER 컬럼에 '(4, 4)' 같은 9x9 좌표 문자열을 써 넣었습니다. 좌표를 3x3 그리드의 시계방향 칸 번호
+(0: 중앙, 1: 좌상단 ~ 8: 좌측)로 바꾸고, 숫자가 아닌 값은 NULL로 비운 뒤 컬럼을 INTEGER로 맞춥니다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.schema import dialect, has_column, has_table
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+# 9x9 좌표 문자열 -> 시계방향 칸 번호
+LEGACY_POSITIONS = {
+    "(4, 4)": 0,
+    "(1, 1)": 1,
+    "(1, 4)": 2,
+    "(1, 7)": 3,
+    "(4, 7)": 4,
+    "(7, 7)": 5,
+    "(7, 4)": 6,
+    "(7, 1)": 7,
+    "(4, 1)": 8,
+}
+# 한 자리 칸 번호 문자열인지 확인하는 식
+POSTGRES_IS_DIGIT = "trim(position) ~ '^[0-8]$'"
+SQLITE_IS_DIGIT = "trim(position) GLOB '[0-8]'"
+
+# 테이블을 다시 만들면 트리거가 사라지므로 검색 인덱스(0006)가 이미 있으면 다시 만듦
+SQLITE_SEARCH_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS epics_fts_ai AFTER INSERT ON epics BEGIN
+        INSERT INTO epics_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS epics_fts_ad AFTER DELETE ON epics BEGIN
+        INSERT INTO epics_fts(epics_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS epics_fts_au AFTER UPDATE OF title, description ON epics BEGIN
+        INSERT INTO epics_fts(epics_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO epics_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+def _legacy_case(is_digit: str) -> str:
+    """좌표 문자열은 칸 번호로, 한 자리 숫자 문자열(is_digit)은 정수로, 나머지는 NULL로 바꾸는 CASE 식"""
+    cases = " ".join(f"WHEN '{legacy}' THEN {slot}" for legacy, slot in LEGACY_POSITIONS.items())
+    return f"CASE trim(position) {cases} ELSE CASE WHEN {is_digit} THEN CAST(trim(position) AS INTEGER) END END"
+
+
+def upgrade() -> None:
+    if not has_column("epics", "position"):
+        op.add_column("epics", sa.Column("position", sa.Integer(), nullable=True))
+        return
+
+    position = next(info for info in sa.inspect(op.get_bind()).get_columns("epics") if info["name"] == "position")
+    is_integer = isinstance(position["type"], sa.Integer)
+
+    if dialect() == "postgresql":
+        if not is_integer:
+            op.execute(
+                "ALTER TABLE epics ALTER COLUMN position TYPE INTEGER "
+                f"USING {_legacy_case(POSTGRES_IS_DIGIT)}"
+            )
+        return
+
+    # SQLite는 컬럼 타입과 관계없이 문자열을 저장할 수 있으므로 문자열 값만 골라 변환
+    op.execute(
+        f"UPDATE epics SET position = {_legacy_case(SQLITE_IS_DIGIT)} WHERE typeof(position) = 'text'"
+    )
+    if not is_integer:
+        with op.batch_alter_table("epics", recreate="always") as batch:
+            batch.alter_column("position", type_=sa.Integer(), existing_nullable=True)
+        if has_table("epics_fts"):
+            for statement in SQLITE_SEARCH_TRIGGERS:
+                op.execute(statement)
+
+
+def downgrade() -> None:
+    # 칸 번호는 그대로 둠 (좌표 문자열로 되돌리지 않음)
+    pass
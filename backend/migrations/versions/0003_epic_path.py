@@ -0,0 +1,45 @@
+"""materialized path: epics.path
+
+루트부터 core_epic_id를 따라 내려가며 path('/1/5/23/')와 depth를 채웁니다. (이전 migrate_add_path.py)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.schema import create_index_if_missing, has_column
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not has_column("epics", "path"):
+        op.add_column("epics", sa.Column("path", sa.String(), nullable=True))
+        op.execute("""
+            WITH RECURSIVE tree(id, path, depth) AS (
+                SELECT id, '/' || id || '/', 0
+                FROM epics
+                WHERE core_epic_id IS NULL
+                   OR core_epic_id NOT IN (SELECT id FROM epics)
+                UNION ALL
+                SELECT e.id, tree.path || e.id || '/', tree.depth + 1
+                FROM epics e
+                JOIN tree ON e.core_epic_id = tree.id
+            )
+            UPDATE epics
+            SET path = (SELECT path FROM tree WHERE tree.id = epics.id),
+                depth = (SELECT depth FROM tree WHERE tree.id = epics.id)
+            WHERE id IN (SELECT id FROM tree)
+        """)
+    create_index_if_missing("ix_epics_path", "epics", ["path"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_epics_path", table_name="epics")
+    with op.batch_alter_table("epics") as batch:
+        batch.drop_column("path")
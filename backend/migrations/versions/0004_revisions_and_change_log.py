@@ -0,0 +1,52 @@
+"""revision counter and change log
+
+epics.revision, (path, revision) 인덱스, 전역 revision 카운터(epic_revision)와 변경 기록(epic_changes).
+(이전 migrate_add_revision.py)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.schema import create_index_if_missing, has_column, has_table
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not has_column("epics", "revision"):
+        op.add_column("epics", sa.Column("revision", sa.Integer(), nullable=False, server_default="0"))
+        # 기존 epic들은 모두 첫 revision
+        op.execute("UPDATE epics SET revision = 1")
+    create_index_if_missing("ix_epics_path_revision", "epics", ["path", "revision"])
+
+    if not has_table("epic_revision"):
+        revision_table = op.create_table(
+            "epic_revision",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("value", sa.Integer(), nullable=False),
+        )
+        op.bulk_insert(revision_table, [{"id": 1, "value": 1}])
+
+    if not has_table("epic_changes"):
+        op.create_table(
+            "epic_changes",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("revision", sa.Integer(), nullable=False),
+            sa.Column("epic_id", sa.Integer(), nullable=False),
+            sa.Column("op", sa.String(), nullable=False),
+        )
+        op.create_index("ix_epic_changes_revision", "epic_changes", ["revision"])
+
+
+def downgrade() -> None:
+    op.drop_table("epic_changes")
+    op.drop_table("epic_revision")
+    op.drop_index("ix_epics_path_revision", table_name="epics")
+    with op.batch_alter_table("epics") as batch:
+        batch.drop_column("revision")
@@ -0,0 +1,28 @@
+"""epic_relations lookup indexes
+
+(이전 migrate_add_relation_indexes.py)
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+
+from migrations.schema import create_index_if_missing
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_index_if_missing(
+        "ix_epic_relations_core_position", "epic_relations", ["core_epic_id", "position_row", "position_col"]
+    )
+    create_index_if_missing("ix_epic_relations_sub_epic_id", "epic_relations", ["sub_epic_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_epic_relations_sub_epic_id", table_name="epic_relations")
+    op.drop_index("ix_epic_relations_core_position", table_name="epic_relations")
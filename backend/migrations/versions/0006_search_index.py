@@ -0,0 +1,70 @@
+"""full-text search index
+
+SQLite: epics를 외부 콘텐츠로 쓰는 FTS5 테이블과 동기화 트리거, PostgreSQL: tsvector 생성 컬럼과 GIN 인덱스.
+(이전 migrate_add_search_index.py)
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+
+from migrations.schema import dialect, has_table
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+SEARCH_INDEX_DDL = {
+    "sqlite": [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS epics_fts USING fts5(
+            title, description, content='epics', content_rowid='id', prefix='2 3'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS epics_fts_ai AFTER INSERT ON epics BEGIN
+            INSERT INTO epics_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS epics_fts_ad AFTER DELETE ON epics BEGIN
+            INSERT INTO epics_fts(epics_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS epics_fts_au AFTER UPDATE OF title, description ON epics BEGIN
+            INSERT INTO epics_fts(epics_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+            INSERT INTO epics_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+        END
+        """,
+    ],
+    "postgresql": [
+        """
+        ALTER TABLE epics ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+            to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, ''))
+        ) STORED
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_epics_search_vector ON epics USING gin (search_vector)",
+    ],
+}
+
+
+def upgrade() -> None:
+    created = dialect() == "sqlite" and not has_table("epics_fts")
+    for statement in SEARCH_INDEX_DDL.get(dialect(), []):
+        op.execute(statement)
+    if created:
+        # 외부 콘텐츠 테이블(epics)의 기존 행으로 인덱스를 채움
+        op.execute("INSERT INTO epics_fts(epics_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if dialect() == "sqlite":
+        for trigger in ("epics_fts_ai", "epics_fts_ad", "epics_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS epics_fts")
+    elif dialect() == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_epics_search_vector")
+        op.execute("ALTER TABLE epics DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,58 @@
+"""unique grid positions: ux_epics_core_position
+
+같은 상위 epic 아래에서 겹치는 position을 빈 칸(없으면 NULL)으로 옮긴 뒤 (core_epic_id, position)
+유니크 인덱스를 추가합니다. (이전 migrate_add_position_index.py)
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.schema import has_index
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+# 상위 epic 주변 칸 (시계방향 1~8)
+GRID_SLOTS = tuple(range(1, 9))
+
+
+def upgrade() -> None:
+    if has_index("epics", "ux_epics_core_position"):
+        return
+    conn = op.get_bind()
+    duplicates = conn.execute(sa.text("""
+        SELECT DISTINCT core_epic_id FROM epics
+        WHERE core_epic_id IS NOT NULL AND position IS NOT NULL
+        GROUP BY core_epic_id, position
+        HAVING COUNT(*) > 1
+    """)).scalars().all()
+
+    for core_epic_id in duplicates:
+        rows = conn.execute(
+            sa.text("SELECT id, position FROM epics WHERE core_epic_id = :core_epic_id ORDER BY id"),
+            {"core_epic_id": core_epic_id},
+        ).all()
+        taken = set()
+        conflicts = []
+        for epic_id, position in rows:
+            if position is None or position not in taken:
+                taken.add(position)
+            else:
+                conflicts.append(epic_id)
+        free = [slot for slot in GRID_SLOTS if slot not in taken]
+        for epic_id in conflicts:
+            conn.execute(
+                sa.text("UPDATE epics SET position = :position WHERE id = :id"),
+                {"position": free.pop(0) if free else None, "id": epic_id},
+            )
+
+    op.create_index("ux_epics_core_position", "epics", ["core_epic_id", "position"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ux_epics_core_position", table_name="epics")
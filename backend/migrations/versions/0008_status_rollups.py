@@ -0,0 +1,42 @@
+"""per-epic status rollups: epic_rollups
+
+epic별 하위 epic(자기 자신 제외)의 상태별 개수. 테이블을 새로 만들면 현재 트리에서 한 번에 계산합니다.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.schema import has_table
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if has_table("epic_rollups"):
+        return
+    op.create_table(
+        "epic_rollups",
+        sa.Column("epic_id", sa.Integer(), sa.ForeignKey("epics.id"), primary_key=True),
+        sa.Column("status", sa.String(), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False),
+    )
+    # 각 epic의 하위 트리를 path 범위 조인으로 집계
+    op.execute("""
+        INSERT INTO epic_rollups (epic_id, status, count)
+        SELECT epics.id, coalesce(descendant.status, ''), count(*)
+        FROM epics
+        JOIN epics AS descendant
+          ON descendant.path > epics.path
+         AND descendant.path < substr(epics.path, 1, length(epics.path) - 1) || '0'
+        GROUP BY epics.id, descendant.status
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("epic_rollups")
@@ -0,0 +1,31 @@
+"""board shard directory: epic_shards
+
+기본 DB에서만 사용합니다. 등록은 app.db.init_db가 마이그레이션 후에 합니다.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.schema import has_table
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not has_table("epic_shards"):
+        op.create_table(
+            "epic_shards",
+            sa.Column("shard", sa.Integer(), primary_key=True),
+            sa.Column("url", sa.String(), nullable=True, unique=True),
+            sa.Column("boards", sa.Integer(), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("epic_shards")
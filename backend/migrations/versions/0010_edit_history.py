@@ -0,0 +1,85 @@
+"""append-only edit history and board snapshots: epic_history, epic_snapshots
+
+기존 보드는 편집 기록이 없으므로 현재 상태를 history_id 0인 스냅샷으로 남겨 이후 기록을 적용할 기준으로 삼습니다.
+스냅샷 형식은 app.services.history.encode_snapshot과 같습니다 (id, core_epic_id, title, description, status,
+position, created_at, updated_at 순서의 행 배열을 zlib으로 압축한 JSON).
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 00:00:00
+"""
+import json
+import zlib
+from collections import defaultdict
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.schema import has_table
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+SNAPSHOT_COLUMNS = ("id", "core_epic_id", "title", "description", "status", "position", "created_at", "updated_at")
+
+
+def _isoformat(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def upgrade() -> None:
+    if not has_table("epic_history"):
+        op.create_table(
+            "epic_history",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("board_id", sa.Integer(), nullable=False),
+            sa.Column("epic_id", sa.Integer(), nullable=False),
+            sa.Column("revision", sa.Integer(), nullable=False),
+            sa.Column("op", sa.String(), nullable=False),
+            sa.Column("changes", sa.String(), nullable=True),
+            sa.Column("changed_at", sa.DateTime(timezone=True), nullable=False),
+            sqlite_autoincrement=True,
+        )
+        op.create_index("ix_epic_history_board_id", "epic_history", ["board_id", "id"])
+    if has_table("epic_snapshots"):
+        return
+    snapshots = op.create_table(
+        "epic_snapshots",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("board_id", sa.Integer(), nullable=False),
+        sa.Column("history_id", sa.Integer(), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("taken_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_epic_snapshots_board_id", "epic_snapshots", ["board_id", "history_id"])
+
+    epics = sa.table("epics", *[sa.column(name) for name in (*SNAPSHOT_COLUMNS, "path")])
+    boards = defaultdict(list)
+    rows = op.get_bind().execute(
+        sa.select(*[epics.c[name] for name in SNAPSHOT_COLUMNS], epics.c.path)
+        .where(epics.c.path.is_not(None))
+        .order_by(epics.c.id)
+    )
+    for row in rows:
+        boards[int(row.path.split("/", 2)[1])].append([_isoformat(value) for value in row[:-1]])
+    now = datetime.now()
+    if boards:
+        op.bulk_insert(snapshots, [
+            {
+                "board_id": board_id,
+                "history_id": 0,
+                "size": len(board_rows),
+                "data": zlib.compress(json.dumps(board_rows, ensure_ascii=False, separators=(",", ":")).encode()),
+                "taken_at": now,
+            }
+            for board_id, board_rows in boards.items()
+        ])
+
+
+def downgrade() -> None:
+    op.drop_table("epic_snapshots")
+    op.drop_table("epic_history")
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+데이터베이스 복구 스크립트
+현재 트리에서 epic 진행률 rollup(epic_rollups, 상태별 하위 epic 수)을 다시 계산합니다.
+테이블은 마이그레이션(0008)이 만들며, 증분 값이 어긋났다고 의심될 때 다시 실행해도 안전합니다.
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.db.session import SQLALCHEMY_DATABASE_URL
+from app.services.epic import EpicService
+
+def rebuild_rollups():
+    """epic_rollups 전체를 다시 계산합니다."""
+    engine = create_engine(SQLALCHEMY_DATABASE_URL)
+
+    db = sessionmaker(bind=engine)()
+    try:
+        rows = asyncio.run(EpicService(db).rebuild_rollups())
+        print(f"✅ rollup {rows}개 행이 다시 계산되었습니다.")
+        
+    except Exception as e:
+        print(f"❌ rollup 재계산 중 오류 발생: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    print("🚀 epic rollup 재계산을 시작합니다...")
+    rebuild_rollups()
+    print("🎉 rollup 재계산이 완료되었습니다.")
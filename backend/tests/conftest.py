@@ -1,17 +1,21 @@
-import os
+from contextlib import contextmanager
 import pytest
-from sqlalchemy import create_engine
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from app.db.base import Base
-from app.db.models import Epic
+from app.models.base import Base
+from app.db.session import get_db, instrument_engine
+from app.controllers.epic import get_db_override
+from app.services.cache import epic_cache
+from main import app
 
 # Test database URL
 TEST_SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 
 # Create test engine
-test_engine = create_engine(
+test_engine = instrument_engine(create_engine(
     TEST_SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+))
 
 # Create test session
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
@@ -20,6 +24,8 @@ TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_
 def test_db():
     # Create test database tables
     Base.metadata.create_all(bind=test_engine)
+    # 이전 테스트의 id가 재사용되므로 응답 캐시를 비움
+    epic_cache.clear()
     
     # Create a new database session for the test
     db = TestingSessionLocal()
@@ -30,9 +36,57 @@ def test_db():
         # Drop all tables after the test
         Base.metadata.drop_all(bind=test_engine)
 
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+def create_epic(client, title, core_epic_id=None, position=None, status="todo", description=None) -> int:
+    """POST /api/epic으로 epic을 만들고 id를 반환합니다."""
+    response = client.post("/api/epic", json={
+        "title": title, "status": status, "core_epic_id": core_epic_id, "position": position, "description": description,
+    })
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+@pytest.fixture
+def query_counter():
+    """테스트 엔진에서 실행된 SQL 문을 기록합니다."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(test_engine, "before_cursor_execute", before_cursor_execute)
+
+@pytest.fixture
+def query_budget(query_counter):
+    """블록 안에서 실행된 SQL 문 수가 예산 이하인지 확인합니다.
+
+    with query_budget(2):
+        client.get(f"/api/epic/{epic_id}")
+    """
+    @contextmanager
+    def budget(max_statements: int):
+        start = len(query_counter)
+        yield
+        statements = query_counter[start:]
+        assert len(statements) <= max_statements, (
+            f"Expected at most {max_statements} statements, got {len(statements)}:\n" + "\n".join(statements)
+        )
+
+    return budget
+
 def get_test_db():
     db = TestingSessionLocal()
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+# API 요청이 테스트 DB를 사용하도록 의존성 교체
+app.dependency_overrides[get_db] = get_test_db
+app.dependency_overrides[get_db_override] = get_test_db
@@ -0,0 +1,102 @@
+import gzip
+import json
+import zstandard
+from app.services import compression
+from app.services.compression import negotiate
+from tests.conftest import create_epic
+
+def _build_board(client, size=20):
+    root_id = create_epic(client, "Root")
+    for index in range(size):
+        create_epic(client, f"Sub {index}", root_id)
+    return root_id
+
+def _raw(client, url, encoding, **headers):
+    """자동 해제 없이 전송된 그대로의 본문을 받습니다."""
+    with client.stream("GET", url, headers={"Accept-Encoding": encoding, **headers}) as response:
+        return response, b"".join(response.iter_raw())
+
+def test_negotiate_respects_quality_and_server_preference():
+    encodings = ("zstd", "br", "gzip")
+    assert negotiate("gzip, deflate, br", encodings) == "br"
+    assert negotiate("gzip, zstd", encodings) == "zstd"
+    assert negotiate("br;q=0, gzip", encodings) == "gzip"
+    assert negotiate("gzip;q=1.0, br;q=0.5", encodings) == "gzip"
+    assert negotiate("*", encodings) == "zstd"
+    assert negotiate("*, zstd;q=0", encodings) == "br"
+    assert negotiate("deflate, identity", encodings) is None
+    assert negotiate("br", ("gzip",)) is None
+
+def test_tree_is_compressed_with_negotiated_encoding(client, test_db):
+    root_id = _build_board(client)
+    url = f"/api/epic/{root_id}/tree"
+    plain, plain_body = _raw(client, url, "identity")
+    assert "content-encoding" not in plain.headers
+    tree = json.loads(plain_body)
+    assert len(tree["subs"]) == 20
+
+    response, body = _raw(client, url, "zstd")
+    assert response.headers["content-encoding"] == "zstd"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(body) < len(plain_body)
+    assert json.loads(zstandard.ZstdDecompressor().decompress(body)) == tree
+
+    response, body = _raw(client, url, "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert json.loads(gzip.decompress(body)) == tree
+
+    # httpx는 br을 자동으로 해제
+    response = client.get(url, headers={"Accept-Encoding": "br"})
+    assert response.headers["content-encoding"] == "br"
+    assert response.json() == tree
+    assert "compress;dur=" in response.headers["server-timing"]
+
+def test_small_responses_are_not_compressed(client, test_db):
+    epic_id = create_epic(client, "Small")
+    response, body = _raw(client, f"/api/epic/{epic_id}", "gzip, br, zstd")
+    assert "content-encoding" not in response.headers
+    assert json.loads(body)["title"] == "Small"
+
+def test_cached_payload_is_compressed_once(client, test_db, monkeypatch):
+    root_id = _build_board(client)
+    url = f"/api/epic/{root_id}/tree"
+    calls = []
+    original = compression.compress
+
+    def counting_compress(encoding, data):
+        calls.append(encoding)
+        return original(encoding, data)
+
+    monkeypatch.setattr(compression, "compress", counting_compress)
+    first = _raw(client, url, "gzip")[1]
+    assert _raw(client, url, "gzip")[1] == first
+    assert calls == ["gzip"]
+    _raw(client, url, "zstd")
+    _raw(client, url, "zstd")
+    assert calls == ["gzip", "zstd"]
+
+    # 수정되면 캐시 항목과 함께 압축 결과도 버려짐
+    client.put(f"/api/epic/{root_id}", json={"title": "Renamed"}, headers={"Accept-Encoding": "identity"})
+    response, body = _raw(client, url, "gzip")
+    assert json.loads(gzip.decompress(body))["title"] == "Renamed"
+    assert calls == ["gzip", "zstd", "gzip"]
+
+def test_compressed_response_uses_weak_etag(client, test_db):
+    root_id = _build_board(client)
+    url = f"/api/epic/{root_id}/tree"
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+    assert client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": etag}).status_code == 304
+    # 압축하지 않은 응답의 강한 ETag로도 일치
+    plain_etag = client.get(url, headers={"Accept-Encoding": "identity"}).headers["etag"]
+    assert plain_etag == etag[2:]
+    assert client.get(url, headers={"Accept-Encoding": "br", "If-None-Match": plain_etag}).status_code == 304
+
+def test_export_stream_is_compressed(client, test_db):
+    root_id = _build_board(client)
+    response, body = _raw(client, f"/api/epic/export?root_id={root_id}", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    records = [json.loads(line) for line in gzip.decompress(body).decode().splitlines()]
+    assert len(records) == 21
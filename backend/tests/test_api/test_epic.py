@@ -1,6 +1,11 @@
+import json
+from fastapi.encoders import jsonable_encoder
 from fastapi.testclient import TestClient
 import pytest
-from app.main import app
+from main import app
+from sqlalchemy import update
+from app.models.epic import Epic, EpicRevision, to_epic_response
+from app.services.epic import encode_cursor
 
 @pytest.fixture
 def client():
@@ -51,4 +56,307 @@ def test_read_epic(client, test_db):
     
     # Test reading non-existent epic
     response = client.get("/api/epic/999")
-    assert response.status_code == 404 
\ No newline at end of file
+    assert response.status_code == 404 
+
+def test_update_missing_epic(client, test_db):
+    response = client.put("/api/epic/999", json={"status": "DONE"})
+    assert response.status_code == 404
+
+def _create_board(client, levels=2):
+    """중앙 epic 아래로 levels 단계만큼 8개씩 하위 epic을 생성합니다."""
+    root = client.post("/api/epic", json={"title": "Root", "status": "TODO"}).json()
+    parents = [root["id"]]
+    for level in range(levels):
+        next_parents = []
+        for parent_id in parents:
+            for position in range(1, 9):
+                sub = client.post("/api/epic", json={
+                    "title": f"L{level + 1}-{parent_id}-{position}",
+                    "status": "TODO",
+                    "core_epic_id": parent_id,
+                    "position": position,
+                }).json()
+                next_parents.append(sub["id"])
+        parents = next_parents
+    return root["id"]
+
+def test_read_epic_tree(client, test_db, query_counter):
+    root_id = _create_board(client, levels=2)
+
+    query_counter.clear()
+    response = client.get(f"/api/epic/{root_id}/tree")
+    assert response.status_code == 200
+    # ETag 버전 확인 1번 + 하위 트리 조회 1번
+    assert len(query_counter) == 2
+
+    data = response.json()
+    assert len(data["subs"]) == 8
+    assert all(len(sub["subs"]) == 8 for sub in data["subs"])
+    assert data["subs"][0]["subs"][0]["depth"] == 2
+
+def test_read_epic_tree_max_depth(client, test_db):
+    root_id = _create_board(client, levels=2)
+
+    response = client.get(f"/api/epic/{root_id}/tree", params={"max_depth": 1})
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["subs"]) == 8
+    assert all(sub["subs"] == [] for sub in data["subs"])
+
+    response = client.get("/api/epic/999/tree")
+    assert response.status_code == 404
+
+def _legacy_json(content) -> bytes:
+    """response_model 검증 후 JSONResponse로 직렬화하던 기존 경로와 같은 방식으로 인코딩"""
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode()
+
+def test_fast_serialization_matches_legacy_schema(client, test_db):
+    root_id = _create_board(client, levels=1)
+    sub_id = client.get(f"/api/epic/{root_id}/tree").json()["subs"][0]["id"]
+    client.put(f"/api/epic/{sub_id}", json={"title": "하위 목표 \"1\"", "description": "설명"})
+
+    epics = test_db.query(Epic).order_by(Epic.id).all()
+    root = next(epic for epic in epics if epic.id == root_id)
+    assert client.get(f"/api/epic/{root_id}/tree").content == _legacy_json(to_epic_response(root))
+    assert client.get(f"/api/epic/{root_id}").content == _legacy_json(to_epic_response(root))
+    assert client.get("/api/epic").content == _legacy_json([to_epic_response(epic) for epic in epics])
+
+def test_epic_ancestry_path(client, test_db, query_counter):
+    root_id = _create_board(client, levels=2)
+    tree = client.get(f"/api/epic/{root_id}/tree").json()
+    middle = tree["subs"][0]
+    leaf = middle["subs"][0]
+
+    response = client.get(f"/api/epic/{leaf['id']}/ancestors")
+    assert response.status_code == 200
+    assert [epic["id"] for epic in response.json()] == [root_id, middle["id"]]
+
+    # 다른 중간 epic 아래로 옮기면 하위 트리 전체의 depth가 갱신됨
+    other = tree["subs"][1]
+    # 새 상위 epic의 칸이 모두 차 있으면 옮길 수 없음
+    response = client.put(f"/api/epic/{other['id']}", json={"core_epic_id": middle["id"]})
+    assert response.status_code == 409
+    freed = middle["subs"][-1]
+    client.delete(f"/api/epic/{freed['id']}")
+    response = client.put(f"/api/epic/{other['id']}", json={"core_epic_id": middle["id"], "position": freed["position"]})
+    assert response.status_code == 200
+    assert response.json()["depth"] == 2
+    moved = client.get(f"/api/epic/{other['id']}/tree").json()
+    assert all(sub["depth"] == 3 for sub in moved["subs"])
+    ancestors = client.get(f"/api/epic/{moved['subs'][0]['id']}/ancestors").json()
+    assert [epic["id"] for epic in ancestors] == [root_id, middle["id"], other["id"]]
+
+    # 자기 하위 epic 아래로는 옮길 수 없음
+    response = client.put(f"/api/epic/{middle['id']}", json={"core_epic_id": leaf["id"]})
+    assert response.status_code == 400
+
+    query_counter.clear()
+    response = client.delete(f"/api/epic/{middle['id']}")
+    assert response.status_code == 200
+    assert len([s for s in query_counter if s.startswith("DELETE FROM epics ")]) == 1
+    assert client.get(f"/api/epic/{leaf['id']}").status_code == 404
+    assert client.get(f"/api/epic/{moved['subs'][0]['id']}").status_code == 404
+    assert len(client.get(f"/api/epic/{root_id}/tree").json()["subs"]) == 6
+
+def test_read_epics_cursor_pagination(client, test_db):
+    root_id = _create_board(client, levels=1)
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 4, "include_subs": False}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/epic", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert all(epic["subs"] == [] for epic in page)
+        seen.extend(epic["id"] for epic in page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert len(seen) == 9
+    assert seen == sorted(seen)
+    assert seen[0] == root_id
+
+    # 기존 skip/limit 방식도 유지됨
+    data = client.get("/api/epic", params={"skip": 1, "limit": 2}).json()
+    assert [epic["id"] for epic in data] == seen[1:3]
+    assert len(client.get("/api/epic").json()[0]["subs"]) == 8
+
+    response = client.get("/api/epic", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+    # 마지막 페이지가 가득 차도 다음 페이지가 없으면 커서를 내려주지 않음
+    response = client.get("/api/epic", params={"cursor": encode_cursor(seen[5]), "limit": 3, "include_subs": False})
+    assert [epic["id"] for epic in response.json()] == seen[6:]
+    assert "X-Next-Cursor" not in response.headers
+
+def test_read_epics_field_projection(client, test_db):
+    _create_board(client, levels=1)
+
+    response = client.get("/api/epic", params={"fields": "id,title", "limit": 3})
+    assert response.status_code == 200
+    data = response.json()
+    assert data[0] == {"id": data[0]["id"], "title": "Root"}
+    assert "X-Next-Cursor" in response.headers
+
+    response = client.get("/api/epic", params={"fields": "id,secret"})
+    assert response.status_code == 400
+    assert client.get("/api/epic", params={"fields": ","}).status_code == 400
+    assert "X-Next-Cursor" not in client.get("/api/epic", params={"fields": "id", "limit": 9}).headers
+
+def test_batch_epics(client, test_db, query_counter):
+    existing = client.post("/api/epic", json={"title": "Existing", "status": "TODO"}).json()
+    doomed = client.post("/api/epic", json={"title": "Doomed", "status": "TODO"}).json()
+    client.post("/api/epic", json={"title": "Doomed child", "status": "TODO", "core_epic_id": doomed["id"]})
+
+    operations = [{"op": "create", "temp_id": "root", "data": {"title": "Root", "status": "TODO", "position": 0}}]
+    for position in range(1, 9):
+        operations.append({
+            "op": "create",
+            "temp_id": f"sub-{position}",
+            "core_temp_id": "root",
+            "data": {"title": f"Sub {position}", "status": "TODO", "position": position},
+        })
+    operations.append({"op": "create", "core_temp_id": "sub-1", "data": {"title": "Leaf", "status": "TODO"}})
+    operations.append({"op": "update", "id": existing["id"], "data": {"title": "Renamed"}})
+    operations.append({"op": "delete", "id": doomed["id"]})
+
+    query_counter.clear()
+    response = client.post("/api/epic/batch", json={"operations": operations})
+    assert response.status_code == 200
+    # 생성 단계(3) 수와 무관하게 INSERT는 단계당 한 번씩만 실행됨
+    assert len([s for s in query_counter if s.startswith("INSERT INTO epics ")]) == 3
+
+    results = response.json()
+    assert [result["op"] for result in results] == ["create"] * 10 + ["update", "delete"]
+    root_id = results[0]["id"]
+    assert results[9]["epic"]["depth"] == 2
+    assert results[10]["epic"]["title"] == "Renamed"
+    assert results[11]["epic"] is None
+
+    tree = client.get(f"/api/epic/{root_id}/tree").json()
+    assert len(tree["subs"]) == 8
+    assert client.get(f"/api/epic/{doomed['id']}").status_code == 404
+    assert len(client.get("/api/epic").json()) == 11
+
+def test_batch_epics_is_atomic(client, test_db):
+    operations = [
+        {"op": "create", "data": {"title": "Never saved", "status": "TODO"}},
+        {"op": "update", "id": 999, "data": {"title": "Missing"}},
+    ]
+    response = client.post("/api/epic/batch", json={"operations": operations})
+    assert response.status_code == 400
+    assert client.get("/api/epic").json() == []
+
+def test_conditional_get_with_etag(client, test_db, query_counter):
+    root = client.post("/api/epic", json={"title": "Root", "status": "TODO"}).json()
+    left = client.post("/api/epic", json={"title": "Left", "status": "TODO", "core_epic_id": root["id"]}).json()
+    right = client.post("/api/epic", json={"title": "Right", "status": "TODO", "core_epic_id": root["id"]}).json()
+
+    urls = ["/api/epic", f"/api/epic/{root['id']}", f"/api/epic/{root['id']}/tree", f"/api/epic/{right['id']}/tree"]
+    etags = {}
+    for url in urls:
+        response = client.get(url)
+        etags[url] = response.headers["ETag"]
+
+        query_counter.clear()
+        response = client.get(url, headers={"If-None-Match": etags[url]})
+        assert response.status_code == 304
+        assert response.content == b""
+        # 버전 확인용 인덱스 쿼리만 실행됨
+        assert len(query_counter) <= 2
+
+    client.put(f"/api/epic/{left['id']}", json={"title": "Changed"})
+    changed = {url for url in urls if client.get(url, headers={"If-None-Match": etags[url]}).status_code == 200}
+    assert changed == set(urls[:3])
+
+    response = client.get(f"/api/epic/{root['id']}/tree")
+    etag = response.headers["ETag"]
+    client.post("/api/epic", json={"title": "Extra", "status": "TODO", "core_epic_id": right["id"]})
+    assert client.get(f"/api/epic/{root['id']}/tree", headers={"If-None-Match": etag}).status_code == 200
+    etag = client.get(f"/api/epic/{root['id']}/tree").headers["ETag"]
+    client.delete(f"/api/epic/{left['id']}")
+    assert client.get(f"/api/epic/{root['id']}/tree", headers={"If-None-Match": etag}).status_code == 200
+
+def _write_from_other_worker(db, epic_id, title):
+    """다른 워커의 쓰기처럼 이 프로세스의 캐시 무효화를 거치지 않고 DB만 바꿉니다."""
+    revision = db.query(EpicRevision.value).filter(EpicRevision.id == 1).scalar() + 1
+    db.execute(update(EpicRevision).where(EpicRevision.id == 1).values(value=revision))
+    db.execute(update(Epic).where(Epic.id == epic_id).values(title=title, revision=revision))
+    db.commit()
+
+def test_etag_reflects_writes_from_other_workers(client, test_db):
+    root = client.post("/api/epic", json={"title": "Root", "status": "TODO"}).json()
+    sub = client.post("/api/epic", json={"title": "Sub", "status": "TODO", "core_epic_id": root["id"]}).json()
+    urls = ["/api/epic", f"/api/epic/{root['id']}", f"/api/epic/{root['id']}/tree"]
+    etags = {url: client.get(url).headers["ETag"] for url in urls}
+
+    _write_from_other_worker(test_db, sub["id"], "Elsewhere")
+    for url in urls:
+        response = client.get(url, headers={"If-None-Match": etags[url]})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etags[url]
+
+def test_change_feed(client, test_db):
+    start = client.get("/api/epic/changes").json()["revision"]
+
+    root = client.post("/api/epic", json={"title": "Root", "status": "TODO"}).json()
+    sub = client.post("/api/epic", json={"title": "Sub", "status": "TODO", "core_epic_id": root["id"]}).json()
+    leaf = client.post("/api/epic", json={"title": "Leaf", "status": "TODO", "core_epic_id": sub["id"]}).json()
+    client.put(f"/api/epic/{root['id']}", json={"title": "Root v2"})
+
+    feed = client.get("/api/epic/changes", params={"since": start}).json()
+    assert [change["epic_id"] for change in feed["changes"]] == [sub["id"], leaf["id"], root["id"]]
+    assert feed["changes"][-1]["epic"]["title"] == "Root v2"
+    revision = feed["revision"]
+
+    # 변경이 없으면 빈 목록과 같은 revision
+    assert client.get("/api/epic/changes", params={"since": revision}).json() == {
+        "revision": revision, "has_more": False, "changes": []
+    }
+
+    # 하위 트리 삭제는 모든 삭제된 epic의 tombstone을 남김
+    client.delete(f"/api/epic/{sub['id']}")
+    feed = client.get("/api/epic/changes", params={"since": revision}).json()
+    assert sorted((change["epic_id"], change["op"]) for change in feed["changes"]) == [
+        (sub["id"], "delete"), (leaf["id"], "delete")
+    ]
+    assert all(change["epic"] is None for change in feed["changes"])
+
+    client.delete("/api/epic")
+    feed = client.get("/api/epic/changes", params={"since": feed["revision"]}).json()
+    assert feed["changes"] == [{"revision": feed["revision"], "epic_id": root["id"], "op": "delete", "epic": None}]
+
+def test_change_feed_pages_by_revision(client, test_db):
+    operations = [{"op": "create", "data": {"title": f"Cell {i}", "status": "TODO"}} for i in range(5)]
+    client.post("/api/epic/batch", json={"operations": operations})
+    client.post("/api/epic", json={"title": "After", "status": "TODO"})
+
+    # 한 revision(batch)의 변경은 limit보다 많아도 나뉘지 않음
+    feed = client.get("/api/epic/changes", params={"limit": 3}).json()
+    assert feed["has_more"] is True
+    assert len(feed["changes"]) == 5
+    feed = client.get("/api/epic/changes", params={"since": feed["revision"], "limit": 3}).json()
+    assert feed["has_more"] is False
+    assert [change["epic"]["title"] for change in feed["changes"]] == ["After"]
+
+def test_read_epics_large_page(client, test_db):
+    operations = [{"op": "create", "data": {"title": f"Cell {i}", "status": "TODO"}} for i in range(1200)]
+    client.post("/api/epic/batch", json={"operations": operations})
+    root_id = client.get("/api/epic", params={"limit": 1}).json()[0]["id"]
+    client.post("/api/epic", json={"title": "Child", "status": "TODO", "core_epic_id": root_id})
+
+    # 페이지 크기가 커도 하위 트리 조회 SQL이 커지지 않음
+    response = client.get("/api/epic", params={"limit": 1201})
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1201
+    assert [sub["title"] for sub in data[0]["subs"]] == ["Child"]
+    assert data[-1]["title"] == "Child"
+
+    data = client.get("/api/epic", params={"skip": 1, "limit": 2}).json()
+    assert [epic["title"] for epic in data] == ["Cell 1", "Cell 2"]
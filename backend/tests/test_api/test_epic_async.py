@@ -0,0 +1,50 @@
+from fastapi.testclient import TestClient
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import NullPool
+from main import app
+from app.controllers.epic import get_session
+from tests.conftest import TEST_SQLALCHEMY_DATABASE_URL
+from app.db.session import to_async_url
+
+@pytest.fixture
+def async_client(test_db):
+    """API가 AsyncSession 경로로 테스트 DB에 접근하도록 의존성을 교체합니다."""
+    engine = create_async_engine(to_async_url(TEST_SQLALCHEMY_DATABASE_URL), poolclass=NullPool)
+    AsyncTestingSessionLocal = async_sessionmaker(engine, autoflush=False)
+
+    async def get_test_async_db():
+        async with AsyncTestingSessionLocal() as db:
+            yield db
+
+    previous = app.dependency_overrides.get(get_session)
+    app.dependency_overrides[get_session] = get_test_async_db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides[get_session] = previous
+
+def test_async_epic_crud(async_client):
+    root = async_client.post("/api/epic", json={"title": "Root", "status": "TODO"}).json()
+    sub = async_client.post("/api/epic", json={"title": "Sub", "status": "TODO", "core_epic_id": root["id"]}).json()
+    assert sub["depth"] == 1
+
+    # lazy loading이 필요한 중첩 응답도 run_sync 안에서 처리됨
+    data = async_client.get("/api/epic").json()
+    assert [s["title"] for s in data[0]["subs"]] == ["Sub"]
+    assert async_client.get(f"/api/epic/{root['id']}/tree").json()["subs"][0]["id"] == sub["id"]
+
+    response = async_client.put(f"/api/epic/{sub['id']}", json={"status": "DONE"})
+    assert response.json()["status"] == "DONE"
+
+    assert async_client.delete(f"/api/epic/{root['id']}").status_code == 200
+    assert async_client.get(f"/api/epic/{sub['id']}").status_code == 404
+
+def test_async_export_import(async_client):
+    root = async_client.post("/api/epic", json={"title": "Root", "status": "TODO"}).json()
+    async_client.post("/api/epic", json={"title": "Sub", "status": "TODO", "core_epic_id": root["id"]})
+
+    exported = async_client.get(f"/api/epic/export?root_id={root['id']}").content
+    assert len(exported.splitlines()) == 2
+    assert async_client.post("/api/epic/import", content=exported).json()["imported"] == 2
+    assert [epic["title"] for epic in async_client.get("/api/epic").json()] == ["Root", "Sub", "Root", "Sub"]
@@ -0,0 +1,73 @@
+from app.services.cache import EpicCache, MemoryCacheBackend
+from tests.conftest import create_epic
+
+def test_epic_reads_are_cached(client, test_db, query_counter):
+    root_id = create_epic(client, "Root")
+    create_epic(client, "Sub", root_id)
+
+    client.get(f"/api/epic/{root_id}/tree")
+    query_counter.clear()
+    response = client.get(f"/api/epic/{root_id}/tree")
+    assert response.json()["subs"][0]["title"] == "Sub"
+    # ETag 버전 확인만 DB에서 읽고 하위 트리는 캐시에서 응답
+    assert len(query_counter) == 1
+
+    stats = client.get("/api/epic/cache/stats").json()
+    assert stats["hits"] >= 1 and stats["misses"] >= 1
+
+def test_writes_invalidate_only_affected_ancestors(client, test_db, query_counter):
+    root_id = create_epic(client, "Root")
+    left_id = create_epic(client, "Left", root_id)
+    right_id = create_epic(client, "Right", root_id)
+    leaf_id = create_epic(client, "Leaf", left_id)
+
+    for epic_id in (root_id, left_id, right_id, leaf_id):
+        client.get(f"/api/epic/{epic_id}/tree")
+
+    client.put(f"/api/epic/{leaf_id}", json={"title": "Renamed"})
+
+    # 형제 하위 트리는 그대로 캐시에서 응답
+    query_counter.clear()
+    client.get(f"/api/epic/{right_id}/tree")
+    assert len(query_counter) == 1
+
+    # 조상들의 하위 트리 응답은 새로 읽어 변경 내용이 반영됨
+    tree = client.get(f"/api/epic/{root_id}/tree").json()
+    left = next(sub for sub in tree["subs"] if sub["id"] == left_id)
+    assert left["subs"][0]["title"] == "Renamed"
+    assert client.get(f"/api/epic/{left_id}/tree").json()["subs"][0]["title"] == "Renamed"
+
+    # 삭제된 하위 epic의 캐시 항목도 함께 무효화
+    client.delete(f"/api/epic/{left_id}")
+    assert client.get(f"/api/epic/{leaf_id}/tree").status_code == 404
+    assert [sub["id"] for sub in client.get(f"/api/epic/{root_id}/tree").json()["subs"]] == [right_id]
+
+    client.get("/api/epic")
+    client.delete("/api/epic")
+    assert client.get("/api/epic").json() == []
+
+def test_memory_backend_lru_and_ttl():
+    backend = MemoryCacheBackend(max_size=2, ttl=60)
+    cache = EpicCache(backend, enabled=True)
+    cache.set(("epic", 1), "one", "v1", "/1/")
+    cache.set(("epic", 2), "two", "v1", "/2/")
+    cache.get(("epic", 1), "v1")
+    cache.set(("epic", 3), "three", "v1", "/3/")
+    assert cache.get(("epic", 2), "v1") is None
+    assert cache.get(("epic", 1), "v1") == "one"
+    assert cache.stats()["evictions"] == 1
+
+    backend.ttl = -1
+    cache.set(("epic", 4), "four", "v1", "/4/")
+    assert cache.get(("epic", 4), "v1") is None
+    assert cache.stats()["evictions"] == 3
+
+def test_entries_are_served_only_for_the_version_they_were_read_at():
+    cache = EpicCache(MemoryCacheBackend(), enabled=True)
+    # 버전 v1을 읽고 조회하는 동안 다른 요청이 v2로 바꾸고 무효화한 뒤, 늦게 끝난 조회가 v1으로 저장
+    cache.invalidate("/1/")
+    cache.set(("tree", 1), "stale", "v1", "/1/")
+    assert cache.get(("tree", 1), "v2") is None
+    cache.set(("tree", 1), "fresh", "v2", "/1/")
+    assert cache.get(("tree", 1), "v2") == "fresh"
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
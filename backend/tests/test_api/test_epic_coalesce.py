@@ -0,0 +1,115 @@
+import asyncio
+import logging
+import httpx
+import pytest
+from main import app
+from app.services.coalesce import epic_write_coalescer
+from app.services.epic import EpicService
+from tests.conftest import TestingSessionLocal, create_epic
+
+@pytest.fixture
+def coalescing():
+    previous = (epic_write_coalescer.session_factory, epic_write_coalescer.window * 1000, epic_write_coalescer.durable)
+    epic_write_coalescer.configure(TestingSessionLocal, window_ms=50, durable=True)
+    yield epic_write_coalescer
+    epic_write_coalescer.configure(previous[0], window_ms=previous[1], durable=previous[2])
+
+async def _put_all(requests, coalescer=None):
+    """요청들을 동시에 보냅니다.
+
+    coalescer가 주어지면 요청이 보낸 순서대로 묶음에 들어가도록 하나씩 들어간 것을 확인하며 보내고,
+    모두 들어가면 window를 기다리지 않고 반영합니다.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        if coalescer is None:
+            return await asyncio.gather(*[client.put(url, json=body) for url, body in requests])
+        puts = []
+        for url, body in requests:
+            submitted = coalescer.requests
+            puts.append(asyncio.ensure_future(client.put(url, json=body)))
+            while coalescer.requests == submitted:
+                await asyncio.sleep(0.001)
+        coalescer._wake.set()
+        return await asyncio.gather(*puts)
+
+def test_updates_are_merged_into_one_commit(client, test_db, coalescing):
+    board_id = create_epic(client, "Board")
+    first = create_epic(client, "first", board_id)
+    second = create_epic(client, "second", board_id)
+    # window가 끝나기 전에 직접 반영하므로 요청이 늦게 도착해도 한 묶음에 들어감
+    coalescing.configure(TestingSessionLocal, window_ms=60_000, durable=True)
+    flushes = coalescing.flushes
+
+    requests = [(f"/api/epic/{first}", {"title": f"typing {i}"}) for i in range(10)]
+    requests += [(f"/api/epic/{second}", {"description": "note"}), (f"/api/epic/{second}", {"status": "done"})]
+    requests.append(("/api/epic/9999", {"title": "missing"}))
+    responses = asyncio.run(_put_all(requests, coalescing))
+
+    assert coalescing.flushes == flushes + 1
+    # 모든 요청은 commit된 최종 상태로 응답 (필드별 마지막 값)
+    assert {response.json()["title"] for response in responses[:10]} == {"typing 9"}
+    assert responses[11].json()["description"] == "note"
+    assert responses[11].json()["status"] == "done"
+    assert responses[-1].status_code == 404
+
+    assert client.get(f"/api/epic/{first}").json()["title"] == "typing 9"
+    assert client.get(f"/api/epic/{board_id}").json()["rollup"]["statuses"] == {"done": 1, "todo": 1}
+
+def test_non_durable_writes_flush_on_shutdown(client, test_db, coalescing):
+    epic_id = create_epic(client, "draft")
+    coalescing.configure(TestingSessionLocal, window_ms=60_000, durable=False)
+
+    async def write_then_shutdown():
+        responses = await _put_all([(f"/api/epic/{epic_id}", {"title": "saved"})])
+        # 아직 commit되지 않았지만 응답에는 반영될 값이 담김
+        assert responses[0].json()["title"] == "saved"
+        assert coalescing.pending(epic_id) == {"title": "saved"}
+        await coalescing.close()
+
+    asyncio.run(write_then_shutdown())
+    assert coalescing.pending(epic_id) == {}
+    assert client.get(f"/api/epic/{epic_id}").json()["title"] == "saved"
+
+def test_structural_updates_bypass_coalescing(client, test_db, coalescing):
+    board_id = create_epic(client, "Board")
+    epic_id = create_epic(client, "cell", board_id)
+    flushes = coalescing.flushes
+
+    response = client.put(f"/api/epic/{epic_id}", json={"position": 3, "title": "moved"})
+    assert response.status_code == 200
+    assert response.json()["position"] == 3
+    assert coalescing.flushes == flushes
+
+def test_failed_batch_is_retried_one_epic_at_a_time(client, test_db, coalescing, monkeypatch, caplog):
+    good = create_epic(client, "good")
+    bad = create_epic(client, "bad")
+    draft = create_epic(client, "draft")
+    coalescing.configure(TestingSessionLocal, window_ms=60_000, durable=True)
+    apply_update = EpicService._apply_update
+
+    def failing_apply_update(self, db_epic, epic_data, now):
+        if db_epic.id in (bad, draft):
+            raise ValueError("invalid update")
+        apply_update(self, db_epic, epic_data, now)
+
+    monkeypatch.setattr(EpicService, "_apply_update", failing_apply_update)
+
+    async def write():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            # 기다리지 않는 변경이 버려지면 로그로 남음
+            await http.put(f"/api/epic/{draft}", params={"durable": False}, json={"title": "lost"})
+        return await _put_all(
+            [(f"/api/epic/{good}", {"title": "saved"}), (f"/api/epic/{bad}", {"title": "rejected"})], coalescing
+        )
+
+    with caplog.at_level(logging.ERROR, logger="app.db.coalesce"):
+        responses = asyncio.run(write())
+    # 묶음 전체가 실패해도 잘못된 epic만 실패하고 나머지는 반영됨
+    assert responses[0].status_code == 200
+    assert responses[0].json()["title"] == "saved"
+    assert responses[1].status_code == 400
+    assert client.get(f"/api/epic/{good}").json()["title"] == "saved"
+    assert client.get(f"/api/epic/{bad}").json()["title"] == "bad"
+    assert f"dropped non-durable write to epic {draft}" in caplog.text
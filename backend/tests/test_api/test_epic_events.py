@@ -0,0 +1,90 @@
+import asyncio
+import json
+from app.controllers.epic_events import epic_event_stream
+from app.services.events import EpicEventBroker, epic_broker
+from tests.conftest import create_epic
+
+def test_events_are_scoped_to_subtree(client, test_db):
+    board_a = create_epic(client, "Board A")
+    board_b = create_epic(client, "Board B")
+    cell = create_epic(client, "Cell", board_a)
+
+    async def scenario():
+        sub_a = epic_broker.subscribe(board_a)
+        sub_b = epic_broker.subscribe(board_b)
+        sub_all = epic_broker.subscribe()
+        try:
+            await asyncio.to_thread(client.put, f"/api/epic/{cell}", json={"title": "v1"})
+            await asyncio.to_thread(client.put, f"/api/epic/{cell}", json={"title": "v2"})
+
+            message = await sub_a.next_batch(timeout=1)
+            # 연속된 변경은 epic별 최신 이벤트 하나로 합쳐짐
+            assert message["type"] == "changes"
+            assert [(e["op"], e["epic_id"]) for e in message["events"]] == [("upsert", cell)]
+            assert (await sub_all.next_batch(timeout=1))["events"][0]["epic_id"] == cell
+            assert await sub_b.next_batch(timeout=0.1) is None
+
+            # 다른 보드로 옮기면 이전/새 보드 구독자 모두 받음
+            await asyncio.to_thread(client.put, f"/api/epic/{cell}", json={"core_epic_id": board_b})
+            assert (await sub_a.next_batch(timeout=1))["events"][0]["op"] == "move"
+            assert (await sub_b.next_batch(timeout=1))["events"][0]["op"] == "move"
+
+            await asyncio.to_thread(client.delete, "/api/epic")
+            assert (await sub_b.next_batch(timeout=1))["type"] == "resync"
+        finally:
+            for subscription in (sub_a, sub_b, sub_all):
+                subscription.close()
+        assert epic_broker.subscriber_count() == 0
+
+    asyncio.run(scenario())
+
+def test_publish_failure_does_not_fail_committed_write(client, test_db, monkeypatch):
+    def broken_publish(events):
+        raise RuntimeError("broker down")
+
+    monkeypatch.setattr(epic_broker, "publish", broken_publish)
+    epic_id = create_epic(client, "Board")
+    response = client.put(f"/api/epic/{epic_id}", json={"title": "Renamed"})
+    assert response.status_code == 200
+    assert client.get(f"/api/epic/{epic_id}").json()["title"] == "Renamed"
+
+def test_events_for_missing_epic_is_404(client, test_db):
+    assert client.get("/api/epic/9999/events").status_code == 404
+
+def test_slow_subscriber_gets_resync_instead_of_unbounded_buffer():
+    broker = EpicEventBroker()
+
+    async def scenario():
+        subscription = broker.subscribe(1, max_pending=3)
+        broker.publish([{"op": "upsert", "epic_id": i, "path": f"/1/{i}/", "routing_paths": [f"/1/{i}/"]} for i in range(2, 10)])
+        assert await subscription.next_batch(timeout=1) == {"type": "resync"}
+        assert subscription.dropped > 0
+
+        broker.publish([{"op": "upsert", "epic_id": 2, "path": "/1/2/", "routing_paths": ["/1/2/"]}])
+        assert len((await subscription.next_batch(timeout=1))["events"]) == 1
+
+        # 유휴 구독자가 많아도 구독 객체만 유지
+        idle = [broker.subscribe(root_id) for root_id in range(1000)]
+        assert broker.subscriber_count() == 1001
+        for s in idle:
+            s.close()
+        subscription.close()
+
+    asyncio.run(scenario())
+
+def test_sse_stream_format():
+    class FakeRequest:
+        async def is_disconnected(self):
+            return False
+
+    async def scenario():
+        stream = epic_event_stream(FakeRequest(), 1)
+        assert (await stream.__anext__()).startswith("event: ready")
+        epic_broker.publish([{"op": "delete", "epic_id": 5, "path": "/1/5/", "routing_paths": ["/1/5/"], "revision": 3}])
+        chunk = await stream.__anext__()
+        assert chunk.startswith("event: changes\ndata: ")
+        assert json.loads(chunk.split("data: ", 1)[1])["events"][0]["epic_id"] == 5
+        await stream.aclose()
+        assert epic_broker.subscriber_count() == 0
+
+    asyncio.run(scenario())
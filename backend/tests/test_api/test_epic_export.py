@@ -0,0 +1,61 @@
+import json
+from app.services import epic as epic_service
+from tests.conftest import create_epic
+
+def _build_board(client):
+    root_id = create_epic(client, "Root")
+    left_id = create_epic(client, "Left", root_id)
+    create_epic(client, "Leaf", left_id)
+    right_id = create_epic(client, "Right", root_id)
+    create_epic(client, "Other")
+    return root_id, right_id
+
+def test_export_streams_subtree_as_ndjson(client, test_db):
+    root_id, _ = _build_board(client)
+
+    response = client.get(f"/api/epic/export?root_id={root_id}")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    # 상위 epic이 항상 하위 epic보다 먼저 나옴
+    assert [record["title"] for record in records] == ["Root", "Left", "Leaf", "Right"]
+
+    assert len(client.get("/api/epic/export").text.splitlines()) == 5
+    assert client.get("/api/epic/export?root_id=9999").status_code == 404
+
+def test_full_export_streams_every_row_across_partitions(client, test_db, monkeypatch):
+    # 요청 세션이 닫힌 뒤에도 스트림 전용 세션으로 여러 조각을 끝까지 읽음
+    monkeypatch.setattr(epic_service, "TRANSFER_CHUNK_SIZE", 2)
+    _build_board(client)
+    records = [json.loads(line) for line in client.get("/api/epic/export").text.splitlines()]
+    assert sorted(record["title"] for record in records) == ["Leaf", "Left", "Other", "Right", "Root"]
+    assert all(record["id"] for record in records)
+
+def test_import_remaps_ids_under_target(client, test_db, monkeypatch):
+    root_id, right_id = _build_board(client)
+    exported = client.get(f"/api/epic/export?root_id={root_id}").content
+
+    # 청크 경계에 걸친 상위/하위 관계도 이어지는지 확인
+    monkeypatch.setattr(epic_service, "TRANSFER_CHUNK_SIZE", 2)
+    monkeypatch.setattr("app.controllers.epic.TRANSFER_CHUNK_SIZE", 2)
+    response = client.post(f"/api/epic/import?core_epic_id={right_id}", content=exported)
+    assert response.status_code == 200
+    assert response.json() == {"imported": 4, "roots": 1, "core_epic_id": right_id}
+
+    tree = client.get(f"/api/epic/{right_id}/tree").json()
+    copy = tree["subs"][0]
+    assert copy["title"] == "Root" and copy["id"] != root_id and copy["depth"] == 2
+    assert [sub["title"] for sub in copy["subs"]] == ["Left", "Right"]
+    assert copy["subs"][0]["subs"][0]["title"] == "Leaf"
+    assert copy["subs"][0]["subs"][0]["depth"] == 4
+
+    ancestors = client.get(f"/api/epic/{copy['subs'][0]['subs'][0]['id']}/ancestors").json()
+    assert [epic["title"] for epic in ancestors] == ["Root", "Right", "Root", "Left"]
+
+def test_import_rejects_invalid_lines(client, test_db):
+    create_epic(client, "Existing")
+    response = client.post("/api/epic/import", content=b'{"id": 1, "title": "A", "status": "TODO"}\n{"id": 2')
+    assert response.status_code == 400
+    # 실패한 import는 아무것도 남기지 않음
+    assert len(client.get("/api/epic").json()) == 1
+    assert client.post("/api/epic/import?core_epic_id=9999", content=b"").status_code == 404
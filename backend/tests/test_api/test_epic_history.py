@@ -0,0 +1,110 @@
+import asyncio
+from datetime import datetime
+from app.models.epic import EpicHistory, EpicSnapshot
+from app.services.epic import EpicService
+from tests.conftest import TestingSessionLocal, create_epic
+
+def _shape(node):
+    """비교용: 시각을 제외한 트리 구조"""
+    return (
+        node["id"], node["title"], node["status"], node["position"], node["depth"], node["rollup"],
+        [_shape(sub) for sub in node["subs"]],
+    )
+
+def _at(client, board_id, at=None):
+    return client.get(f"/api/epic/{board_id}/history", params={"at": at.isoformat()} if at else None)
+
+def test_board_is_reconstructed_at_past_times(client, test_db):
+    before_board = datetime.now()
+    board = create_epic(client, "Board", position=0)
+    health = create_epic(client, "건강", board, position=1)
+    run = create_epic(client, "달리기", health, position=1)
+    create_epic(client, "독서", board, position=2)
+    other = create_epic(client, "Other", position=0)
+    created = _shape(client.get(f"/api/epic/{board}/tree").json())
+    t1 = datetime.now()
+
+    client.put(f"/api/epic/{health}", json={"title": "운동", "status": "running"})
+    client.post(f"/api/epic/{run}/move", json={"core_epic_id": board, "position": 3})
+    client.post("/api/epic/batch", json={"operations": [
+        {"op": "create", "data": {"title": "수영", "status": "done", "core_epic_id": health, "position": 2}},
+    ]})
+    edited = _shape(client.get(f"/api/epic/{board}/tree").json())
+    t2 = datetime.now()
+
+    # 하위 트리째 다른 보드로 옮긴 뒤 삭제
+    client.post(f"/api/epic/{health}/move", json={"core_epic_id": other, "position": 1})
+    moved = _shape(client.get(f"/api/epic/{other}/tree").json())
+    t3 = datetime.now()
+    client.delete(f"/api/epic/{board}")
+
+    assert _shape(_at(client, board, t1).json()) == created
+    assert _shape(_at(client, board, t2).json()) == edited
+    assert _shape(_at(client, other, t3).json()) == moved
+    assert [sub["title"] for sub in _at(client, board, t3).json()["subs"]] == ["달리기", "독서"]
+    assert _at(client, other, t2).json()["subs"] == []
+    assert _at(client, board, before_board).status_code == 404
+    assert _at(client, board).status_code == 404
+
+    # 전체 삭제 후에도 이전 시점은 재구성 가능
+    t4 = datetime.now()
+    client.delete("/api/epic")
+    assert _shape(_at(client, other, t4).json()) == moved
+    assert _at(client, other).status_code == 404
+
+def test_deleted_subtree_does_not_return_when_parent_comes_back(client, test_db):
+    board = create_epic(client, "A", position=0)
+    middle = create_epic(client, "M", board, position=1)
+    leaf = create_epic(client, "D", middle, position=1)
+
+    # M을 보드 밖(루트)으로 옮기고 D를 지운 뒤 M을 다시 A 아래로 옮김
+    assert client.post(f"/api/epic/{middle}/move", json={"core_epic_id": None}).status_code == 200
+    assert client.delete(f"/api/epic/{leaf}").status_code == 200
+    assert client.post(f"/api/epic/{middle}/move", json={"core_epic_id": board, "position": 1}).status_code == 200
+
+    current = _shape(client.get(f"/api/epic/{board}/tree").json())
+    assert [sub["id"] for sub in client.get(f"/api/epic/{board}/tree").json()["subs"]] == [middle]
+    assert _shape(_at(client, board).json()) == current
+
+def test_snapshots_bound_replay_and_compaction(client, test_db, monkeypatch):
+    monkeypatch.setattr("app.services.epic.HISTORY_SNAPSHOT_EVERY", 5)
+    board = create_epic(client, "Board", position=0)
+    cells = [create_epic(client, f"cell {index}", board, position=index) for index in range(1, 4)]
+    for index in range(12):
+        client.put(f"/api/epic/{cells[index % 3]}", json={"title": f"edit {index}"})
+    middle = _shape(client.get(f"/api/epic/{board}/tree").json())
+    t_mid = datetime.now()
+    for index in range(12, 24):
+        client.put(f"/api/epic/{cells[index % 3]}", json={"status": "done" if index % 2 else "todo", "title": f"edit {index}"})
+    gone = create_epic(client, "Gone", position=0)
+    client.delete(f"/api/epic/{gone}")
+    current = _shape(client.get(f"/api/epic/{board}/tree").json())
+
+    with TestingSessionLocal() as db:
+        assert db.query(EpicSnapshot).filter(EpicSnapshot.board_id == board).count() >= 4
+        # 가장 가까운 스냅샷 이후 기록만 적용
+        state, _, replayed = EpicService(db)._board_state_at(board, datetime.now())
+        assert replayed < 5
+        assert len(state) == 4
+    assert _shape(_at(client, board).json()) == current
+
+    t_end = datetime.now()
+    with TestingSessionLocal() as db:
+        result = asyncio.run(EpicService(db).compact_history(t_mid))
+        assert result["history"] > 0
+        assert db.query(EpicHistory).filter(EpicHistory.changed_at <= t_mid).count() == 0
+        assert db.query(EpicSnapshot).filter(EpicSnapshot.taken_at <= t_mid).count() == 1
+        # 다시 실행해도 바뀌는 것이 없음
+        assert asyncio.run(EpicService(db).compact_history(t_mid)) == {"boards": 1, "history": 0, "snapshots": 0}
+
+    assert _shape(_at(client, board, t_mid).json()) == middle
+    assert _shape(_at(client, board, t_end).json()) == current
+    assert _at(client, board, datetime(2000, 1, 1)).status_code == 410
+
+    # 삭제된 보드는 보존 기간이 지나면 기록이 모두 지워짐
+    with TestingSessionLocal() as db:
+        asyncio.run(EpicService(db).compact_history(datetime.now()))
+        assert db.query(EpicHistory).filter(EpicHistory.board_id == gone).count() == 0
+        assert db.query(EpicSnapshot).filter(EpicSnapshot.board_id == gone).count() == 0
+        assert db.query(EpicSnapshot).filter(EpicSnapshot.board_id == board).count() == 1
+    assert _shape(_at(client, board).json()) == current
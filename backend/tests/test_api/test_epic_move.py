@@ -0,0 +1,84 @@
+from tests.conftest import create_epic
+
+def _grow(client, core_epic_id, levels):
+    """core_epic_id 아래에 levels 단계만큼 2개씩 하위 epic을 만듭니다."""
+    if levels:
+        for position in (1, 2):
+            _grow(client, create_epic(client, f"sub {levels}-{position}", core_epic_id, position), levels - 1)
+
+def test_move_subtree(client, test_db):
+    first_board = create_epic(client, "Board A", position=0)
+    second_board = create_epic(client, "Board B", position=0)
+    goal = create_epic(client, "Goal", first_board, position=3)
+    _grow(client, goal, 2)
+    create_epic(client, "taken", second_board, position=1)
+
+    # 위치를 정하지 않으면 새 상위 epic 주변의 빈 칸을 배정
+    response = client.post(f"/api/epic/{goal}/move", json={"core_epic_id": second_board})
+    assert response.status_code == 200
+    assert response.json()["position"] == 2
+    assert response.json()["rollup"] == {"total": 6, "statuses": {"todo": 6}}
+
+    tree = client.get(f"/api/epic/{second_board}/tree").json()
+    moved = next(sub for sub in tree["subs"] if sub["id"] == goal)
+    assert moved["depth"] == 1
+    assert all(sub["depth"] == 2 and all(leaf["depth"] == 3 for leaf in sub["subs"]) for sub in moved["subs"])
+    assert tree["rollup"]["total"] == 8
+    assert client.get(f"/api/epic/{first_board}").json()["rollup"] is None
+
+    leaf = moved["subs"][0]["subs"][0]["id"]
+    assert [epic["id"] for epic in client.get(f"/api/epic/{leaf}/ancestors").json()][:2] == [second_board, goal]
+
+    # 사용 중인 칸, 자기 하위로의 이동, 없는 epic
+    assert client.post(f"/api/epic/{goal}/move", json={"core_epic_id": first_board, "position": 3}).status_code == 200
+    other = create_epic(client, "other", first_board, position=4)
+    assert client.post(f"/api/epic/{other}/move", json={"core_epic_id": first_board, "position": 3}).status_code == 409
+    assert client.post(f"/api/epic/{goal}/move", json={"core_epic_id": leaf}).status_code == 400
+    assert client.post("/api/epic/9999/move", json={"core_epic_id": first_board}).status_code == 404
+
+    # 루트로 옮기면 중앙(0)에 놓임
+    response = client.post(f"/api/epic/{goal}/move", json={"core_epic_id": None})
+    assert (response.json()["depth"], response.json()["position"], response.json()["core_epic_id"]) == (0, 0, None)
+
+def test_move_query_count_is_independent_of_subtree_size(client, test_db, query_counter):
+    board = create_epic(client, "Board", position=0)
+    small = create_epic(client, "small", board, position=1)
+    large = create_epic(client, "large", board, position=2)
+    _grow(client, large, 4)
+    target = create_epic(client, "target", board, position=3)
+
+    counts = []
+    for epic_id in (small, large):
+        query_counter.clear()
+        assert client.post(f"/api/epic/{epic_id}/move", json={"core_epic_id": target}).status_code == 200
+        counts.append(len(query_counter))
+    assert counts[0] == counts[1]
+
+def test_swap_cells_and_subtrees(client, test_db):
+    board = create_epic(client, "Board", position=0)
+    left = create_epic(client, "Left", board, position=1)
+    right = create_epic(client, "Right", board, position=2)
+    create_epic(client, "left child", left, position=1, status="done")
+    deep = create_epic(client, "deep", right, position=1)
+    create_epic(client, "deep child", deep, position=1)
+
+    # 같은 상위 epic 아래에서는 칸만 맞바꿈
+    response = client.post("/api/epic/swap", json={"first_id": left, "second_id": right})
+    assert response.status_code == 200
+    assert [(epic["id"], epic["position"]) for epic in response.json()] == [(left, 2), (right, 1)]
+
+    # 다른 단계의 epic과 맞바꾸면 하위 트리째 자리와 depth가 바뀜
+    response = client.post("/api/epic/swap", json={"first_id": left, "second_id": deep})
+    assert response.status_code == 200
+    assert [(epic["core_epic_id"], epic["position"], epic["depth"]) for epic in response.json()] == [
+        (right, 1, 2), (board, 2, 1),
+    ]
+    deep_tree = client.get(f"/api/epic/{deep}/tree").json()
+    assert deep_tree["subs"][0]["depth"] == 2
+    right_tree = client.get(f"/api/epic/{right}/tree").json()
+    assert right_tree["rollup"] == {"total": 2, "statuses": {"done": 1, "todo": 1}}
+    assert right_tree["subs"][0]["subs"][0]["depth"] == 3
+
+    assert client.post("/api/epic/swap", json={"first_id": board, "second_id": left}).status_code == 400
+    assert client.post("/api/epic/swap", json={"first_id": left, "second_id": left}).status_code == 400
+    assert client.post("/api/epic/swap", json={"first_id": left, "second_id": 9999}).status_code == 404
@@ -0,0 +1,52 @@
+from tests.conftest import create_epic
+
+def test_relation_lookups(client, test_db, query_counter):
+    core_id = create_epic(client, "Core")
+    other_core_id = create_epic(client, "Other Core")
+    sub_ids = [create_epic(client, f"Sub {i}") for i in range(3)]
+
+    for i, sub_id in enumerate(sub_ids):
+        client.post("/api/epic/relation", json={
+            "core_epic_id": core_id, "sub_epic_id": sub_id, "position_row": 0, "position_col": 2 - i,
+        })
+    client.post("/api/epic/relation", json={
+        "core_epic_id": other_core_id, "sub_epic_id": sub_ids[0], "position_row": 1, "position_col": 1,
+    })
+
+    query_counter.clear()
+    response = client.get(f"/api/epic/{core_id}/subs")
+    assert response.status_code == 200
+    assert len(query_counter) == 1
+    assert [rel["title"] for rel in response.json()] == ["Sub 2", "Sub 1", "Sub 0"]
+
+    response = client.get(f"/api/epic/{sub_ids[0]}/cores")
+    assert sorted(rel["title"] for rel in response.json()) == ["Core", "Other Core"]
+
+    query_counter.clear()
+    response = client.get("/api/epic/relations", params={"core_ids": f"{core_id},{other_core_id}"})
+    assert response.status_code == 200
+    assert len(query_counter) == 1
+    data = response.json()
+    assert len(data) == 4
+    assert data[-1]["core_epic_id"] == other_core_id
+
+    response = client.get("/api/epic/relations", params={"core_ids": "1,abc"})
+    assert response.status_code == 400
+
+def test_subtree_delete_removes_relations(client, test_db):
+    core_id = create_epic(client, "Core")
+    sub_id = client.post("/api/epic", json={"title": "Sub", "status": "TODO", "core_epic_id": core_id}).json()["id"]
+    leaf_id = client.post("/api/epic", json={"title": "Leaf", "status": "TODO", "core_epic_id": sub_id}).json()["id"]
+    other_id = create_epic(client, "Other")
+
+    client.post("/api/epic/relation", json={"core_epic_id": sub_id, "sub_epic_id": leaf_id, "position_row": 0, "position_col": 0})
+    client.post("/api/epic/relation", json={"core_epic_id": other_id, "sub_epic_id": leaf_id, "position_row": 0, "position_col": 1})
+    client.post("/api/epic/relation", json={"core_epic_id": other_id, "sub_epic_id": core_id, "position_row": 0, "position_col": 2})
+
+    response = client.delete(f"/api/epic/{sub_id}")
+    assert response.status_code == 200
+    assert response.json() == {"id": sub_id, "deleted": 2, "deleted_relations": 2}
+
+    # 남은 관계는 삭제되지 않은 epic끼리의 관계뿐
+    assert [rel["sub_epic_id"] for rel in client.get(f"/api/epic/{other_id}/subs").json()] == [core_id]
+    assert client.delete(f"/api/epic/{sub_id}").status_code == 404
@@ -0,0 +1,93 @@
+import asyncio
+import json
+import random
+from collections import Counter
+from app.models.epic import Epic, EpicRollupCount
+from app.services.epic import EpicService
+from tests.conftest import create_epic
+
+STATUSES = ["todo", "running", "done", "blocked"]
+
+def _stored_rollups(db):
+    db.expire_all()
+    return {(row.epic_id, row.status): row.count for row in db.query(EpicRollupCount).all() if row.count > 0}
+
+def _expected_rollups(db):
+    """epic 전체를 읽어 path로부터 상태별 하위 epic 수를 처음부터 계산합니다."""
+    db.expire_all()
+    expected = Counter()
+    for epic in db.query(Epic).all():
+        for ancestor_id in epic.path.strip("/").split("/")[:-1]:
+            expected[(int(ancestor_id), epic.status)] += 1
+    return dict(expected)
+
+def test_rollup_in_responses_and_endpoint(client, test_db):
+    board_id = create_epic(client, "Board")
+    health_id = create_epic(client, "건강", board_id, status="running")
+    create_epic(client, "달리기", health_id, status="done")
+    create_epic(client, "수영", health_id, status="todo")
+    create_epic(client, "독서", board_id)
+
+    tree = client.get(f"/api/epic/{board_id}/tree").json()
+    assert tree["rollup"] == {"total": 4, "statuses": {"done": 1, "running": 1, "todo": 2}}
+    health = next(sub for sub in tree["subs"] if sub["id"] == health_id)
+    assert health["rollup"] == {"total": 2, "statuses": {"done": 1, "todo": 1}}
+    assert health["subs"][0]["rollup"] is None
+
+    summary = client.get(f"/api/epic/{board_id}/rollup").json()
+    assert summary["rollup"]["total"] == 4
+    assert [sub["rollup"] and sub["rollup"]["total"] for sub in summary["subs"]] == [2, None]
+    assert client.get("/api/epic/9999/rollup").status_code == 404
+
+    # 상태 변경은 모든 조상에 반영되고, 응답 캐시도 무효화됨
+    client.put(f"/api/epic/{health_id}", json={"status": "done"})
+    assert client.get(f"/api/epic/{board_id}/rollup").json()["rollup"]["statuses"] == {"done": 2, "todo": 2}
+    assert client.get(f"/api/epic/{board_id}").json()["rollup"]["statuses"] == {"done": 2, "todo": 2}
+
+def test_rollups_stay_consistent_with_tree(client, test_db):
+    rng = random.Random(18)
+    ids = [create_epic(client, "Board")]
+    for i in range(30):
+        ids.append(create_epic(client, f"epic {i}", rng.choice(ids), status=rng.choice(STATUSES)))
+
+    for i in range(40):
+        action = rng.choice(["create", "status", "move", "delete", "batch"])
+        if action == "create":
+            ids.append(create_epic(client, f"new {i}", rng.choice(ids), status=rng.choice(STATUSES)))
+        elif action == "status":
+            client.put(f"/api/epic/{rng.choice(ids)}", json={"status": rng.choice(STATUSES)})
+        elif action == "move":
+            # 자기 하위로 옮기는 요청은 400으로 거부되고 아무것도 바뀌지 않아야 함
+            client.put(f"/api/epic/{rng.choice(ids[1:])}", json={"core_epic_id": rng.choice(ids), "status": rng.choice(STATUSES)})
+        elif action == "delete" and len(ids) > 5:
+            client.delete(f"/api/epic/{rng.choice(ids[1:])}")
+        elif action == "batch":
+            first, second = rng.sample(ids, 2)
+            client.post("/api/epic/batch", json={"operations": [
+                {"op": "create", "temp_id": "a", "data": {"title": "a", "status": "todo", "core_epic_id": first}},
+                {"op": "create", "temp_id": "b", "core_temp_id": "a", "data": {"title": "b", "status": "done"}},
+                {"op": "update", "id": second, "data": {"status": rng.choice(STATUSES)}},
+            ]})
+        ids = [epic_id for epic_id, in test_db.query(Epic.id).all()]
+        assert _stored_rollups(test_db) == _expected_rollups(test_db), f"after step {i} ({action})"
+
+    # 하위 트리 import와 중첩된 대상을 포함한 batch 삭제
+    target = rng.choice(ids)
+    records = [
+        {"id": 1, "title": "r", "status": "todo"},
+        {"id": 2, "title": "c", "status": "done", "core_epic_id": 1},
+        {"id": 3, "title": "g", "status": "blocked", "core_epic_id": 2},
+    ]
+    body = "".join(json.dumps(record) + "\n" for record in records)
+    assert client.post(f"/api/epic/import?core_epic_id={target}", content=body).status_code == 200
+    assert _stored_rollups(test_db) == _expected_rollups(test_db)
+
+    parent = create_epic(client, "parent", ids[0])
+    child = create_epic(client, "child", parent, status="done")
+    client.post("/api/epic/batch", json={"operations": [{"op": "delete", "id": parent}, {"op": "delete", "id": child}]})
+    assert _stored_rollups(test_db) == _expected_rollups(test_db)
+
+    # 재계산 결과도 증분으로 유지한 값과 같아야 함
+    incremental = _stored_rollups(test_db)
+    asyncio.run(EpicService(test_db).rebuild_rollups())
+    assert _stored_rollups(test_db) == incremental
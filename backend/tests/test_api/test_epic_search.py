@@ -0,0 +1,65 @@
+from app.services import epic as epic_service
+from tests.conftest import create_epic
+
+def _search(client, **params):
+    response = client.get("/api/epic/search", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+def test_search_prefix_matching_with_ancestors(client, test_db):
+    board_id = create_epic(client, "2024 목표")
+    health_id = create_epic(client, "건강", board_id)
+    run_id = create_epic(client, "마라톤 완주", health_id, description="running every morning")
+    create_epic(client, "독서", board_id)
+
+    results = _search(client, q="마라")
+    assert [result["epic"]["id"] for result in results] == [run_id]
+    assert results[0]["epic"]["subs"] == []
+    assert results[0]["ancestors"] == [{"id": board_id, "title": "2024 목표"}, {"id": health_id, "title": "건강"}]
+
+    # 설명도 검색하며, 여러 단어는 모두 포함해야 함
+    assert [result["epic"]["id"] for result in _search(client, q="run morn")] == [run_id]
+    assert _search(client, q="run 독서") == []
+
+def test_search_is_ranked_and_filtered(client, test_db):
+    first_board = create_epic(client, "Board A")
+    second_board = create_epic(client, "Board B")
+    strong = create_epic(client, "focus focus focus", first_board)
+    weak = create_epic(client, "focus and many other words here", first_board, status="DONE")
+    other = create_epic(client, "focus", second_board)
+
+    results = _search(client, q="focus", root_id=first_board)
+    assert [result["epic"]["id"] for result in results] == [strong, weak]
+    assert results[0]["score"] > results[1]["score"]
+
+    assert [result["epic"]["id"] for result in _search(client, q="focus", status="DONE")] == [weak]
+    assert len(_search(client, q="focus", depth=1)) == 3
+    assert len(_search(client, q="focus", limit=1)) == 1
+    assert other in [result["epic"]["id"] for result in _search(client, q="focus")]
+    assert client.get("/api/epic/search", params={"q": "focus", "root_id": 9999}).status_code == 404
+
+def test_search_keeps_best_ranked_candidates(client, test_db, monkeypatch):
+    # 후보는 관련도 순으로 잘리므로, 먼저 만들어진 약한 결과가 많아도 가장 관련 있는 epic이 남음
+    monkeypatch.setattr(epic_service, "SEARCH_MAX_CANDIDATES", 2)
+    board_id = create_epic(client, "Board")
+    for index in range(5):
+        create_epic(client, f"focus with many other words number {index}", board_id)
+    strong = create_epic(client, "focus focus focus", board_id)
+
+    assert [result["epic"]["id"] for result in _search(client, q="focus", limit=1)] == [strong]
+    assert [result["epic"]["id"] for result in _search(client, q="focus", root_id=board_id, limit=1)] == [strong]
+
+def test_search_index_follows_writes(client, test_db):
+    board_id = create_epic(client, "Board")
+    epic_id = create_epic(client, "Sleep early", board_id)
+
+    client.put(f"/api/epic/{epic_id}", json={"title": "Wake early"})
+    assert _search(client, q="sleep") == []
+    assert [result["epic"]["id"] for result in _search(client, q="wake")] == [epic_id]
+
+    # 하위 트리 삭제(집합 단위 DELETE)도 트리거로 반영
+    client.delete(f"/api/epic/{board_id}")
+    assert _search(client, q="wake") == []
+
+    # 특수문자가 있어도 FTS 구문 오류가 나지 않음
+    assert _search(client, q='"quoted" AND (x') == []
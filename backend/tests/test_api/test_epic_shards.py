@@ -0,0 +1,109 @@
+import pytest
+from sqlalchemy import create_engine
+from app.db.sharding import shard_map
+from app.models.base import Base
+from app.models.epic import EpicShard
+from app.services.cache import epic_cache
+from tests.conftest import TestingSessionLocal, create_epic, test_engine
+
+def _register(urls):
+    """배포 단계처럼 shard DB 스키마를 만들고 디렉터리에 등록합니다."""
+    for url in urls:
+        engine = create_engine(url)
+        Base.metadata.create_all(bind=engine)
+        engine.dispose()
+    shard_map.configure(urls, test_engine, async_mode=False)
+    with TestingSessionLocal() as directory:
+        shard_map.register(directory)
+
+@pytest.fixture
+def shards(test_db, tmp_path):
+    urls = [f"sqlite:///{tmp_path / 'board_1.db'}", f"sqlite:///{tmp_path / 'board_2.db'}"]
+    _register(urls)
+    yield urls
+    shard_map.reset()
+    epic_cache.clear()
+
+def test_boards_are_routed_to_shards(client, shards):
+    boards = [create_epic(client, f"Board {index}", position=0) for index in range(3)]
+    # 새 보드는 보드가 가장 적은 shard에 배치되고, id 상위 비트가 shard 번호
+    assert [shard_map.shard_of(board_id) for board_id in boards] == [0, 1, 2]
+    assert boards[1] == shard_map.first_id(1)
+
+    cells = [create_epic(client, f"alpha cell {index}", board_id, position=1) for index, board_id in enumerate(boards)]
+    assert [shard_map.shard_of(cell_id) for cell_id in cells] == [0, 1, 2]
+    tree = client.get(f"/api/epic/{boards[2]}/tree").json()
+    assert [sub["id"] for sub in tree["subs"]] == [cells[2]]
+    assert tree["rollup"] == {"total": 1, "statuses": {"todo": 1}}
+    assert client.put(f"/api/epic/{cells[1]}", json={"status": "done"}).json()["status"] == "done"
+    assert client.get(f"/api/epic/{shard_map.first_id(7)}").status_code == 404
+
+    # 목록/검색은 모든 shard에서 모아 id 순서(목록), 점수 순서(검색)로 합침
+    assert [epic["id"] for epic in client.get("/api/epic", params={"include_subs": False}).json()] == sorted(boards + cells)
+    page = client.get("/api/epic", params={"limit": 4, "include_subs": False})
+    rest = client.get("/api/epic", params={"cursor": page.headers["X-Next-Cursor"], "include_subs": False})
+    assert [epic["id"] for epic in page.json() + rest.json()] == sorted(boards + cells)
+    results = client.get("/api/epic/search", params={"q": "alpha"}).json()
+    assert {result["epic"]["id"] for result in results} == set(cells)
+    assert [result["epic"]["id"] for result in client.get(
+        "/api/epic/search", params={"q": "alpha", "root_id": boards[1]}
+    ).json()] == [cells[1]]
+
+    # 보드를 넘나드는 이동/교환은 같은 shard 안에서만 가능
+    assert client.post(f"/api/epic/{cells[1]}/move", json={"core_epic_id": boards[2]}).status_code == 400
+    assert client.post("/api/epic/swap", json={"first_id": cells[1], "second_id": cells[2]}).status_code == 400
+    assert client.post(f"/api/epic/{cells[1]}/move", json={"core_epic_id": None}).status_code == 200
+
+    exported = client.get("/api/epic/export").text.splitlines()
+    assert len(exported) == 6
+    assert client.delete("/api/epic").json()["count"] == 6
+    assert client.get("/api/epic").json() == []
+
+def test_shard_numbers_are_kept_in_directory(client, shards, tmp_path):
+    board_id = next(
+        board_id for board_id in (create_epic(client, f"Board {index}") for index in range(3))
+        if shard_map.shard_of(board_id) == 2
+    )
+
+    # URL 순서가 바뀌어도 디렉터리에 등록된 번호를 유지하므로 기존 id가 같은 shard로 라우팅됨
+    _register([*reversed(shards), f"sqlite:///{tmp_path / 'board_3.db'}"])
+    with TestingSessionLocal() as directory:
+        assert [(row.shard, row.boards) for row in directory.query(EpicShard).order_by(EpicShard.shard)] == [
+            (0, 1), (1, 1), (2, 1), (3, 0),
+        ]
+    assert client.get(f"/api/epic/{board_id}").json()["title"].startswith("Board")
+    assert shard_map.shard_of(create_epic(client, "Board 3")) == 3
+
+def test_relations_are_routed_to_board_shards(client, shards):
+    boards = [create_epic(client, f"Board {index}", position=0) for index in range(3)]
+    core_id = create_epic(client, "Core", boards[1], position=1)
+    sub_ids = [create_epic(client, f"Sub {index}", boards[1], position=index + 2) for index in range(2)]
+    other_core_id = create_epic(client, "Other Core", boards[2], position=1)
+    other_sub_id = create_epic(client, "Other Sub", boards[2], position=2)
+
+    for index, sub_id in enumerate(sub_ids):
+        assert client.post("/api/epic/relation", json={
+            "core_epic_id": core_id, "sub_epic_id": sub_id, "position_row": 0, "position_col": index,
+        }).status_code == 200
+    client.post("/api/epic/relation", json={
+        "core_epic_id": other_core_id, "sub_epic_id": other_sub_id, "position_row": 0, "position_col": 0,
+    })
+    # 다른 shard의 epic끼리는 관계를 만들 수 없음
+    assert client.post("/api/epic/relation", json={
+        "core_epic_id": core_id, "sub_epic_id": other_sub_id, "position_row": 1, "position_col": 1,
+    }).status_code == 400
+
+    assert [rel["title"] for rel in client.get(f"/api/epic/{core_id}/subs").json()] == ["Sub 0", "Sub 1"]
+    assert [rel["title"] for rel in client.get(f"/api/epic/{other_sub_id}/cores").json()] == ["Other Core"]
+    relations = client.get("/api/epic/relations", params={"core_ids": f"{other_core_id},{core_id}"}).json()
+    assert [rel["core_epic_id"] for rel in relations] == [core_id, core_id, other_core_id]
+    assert client.get(f"/api/epic/{shard_map.first_id(7)}/subs").status_code == 404
+
+def test_failed_board_creation_releases_its_placement(client, shards):
+    create_epic(client, "Board 0", position=0)
+    # 상위 epic 없이 칸 배정을 요청하면 400: 디렉터리에 늘린 보드 수를 되돌림
+    response = client.post("/api/epic", params={"allocate_position": True}, json={"title": "Bad", "status": "todo"})
+    assert response.status_code == 400
+    with TestingSessionLocal() as directory:
+        assert [row.boards for row in directory.query(EpicShard).order_by(EpicShard.shard)] == [1, 0, 0]
+    assert shard_map.shard_of(create_epic(client, "Board 1")) == 1
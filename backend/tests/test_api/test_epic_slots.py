@@ -0,0 +1,63 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from app.models.epic import EpicCreate
+from app.services.epic import EpicService, PositionConflictError
+from tests.conftest import TestingSessionLocal
+
+def _create(client, title, core_epic_id=None, position=None, allocate=False):
+    return client.post(
+        "/api/epic",
+        params={"allocate_position": allocate},
+        json={"title": title, "status": "todo", "core_epic_id": core_epic_id, "position": position},
+    )
+
+def test_free_slots_and_position_uniqueness(client, test_db, query_budget):
+    board_id = _create(client, "Board", position=0).json()["id"]
+    _create(client, "A", board_id, position=1)
+    _create(client, "B", board_id, position=5)
+
+    with query_budget(2):
+        assert client.get(f"/api/epic/{board_id}/free-slots").json() == {
+            "id": board_id, "free": [2, 3, 4, 6, 7, 8], "taken": [1, 5],
+        }
+    assert client.get("/api/epic/9999/free-slots").status_code == 404
+
+    # 같은 칸은 한 epic만 차지하고, 범위를 벗어난 칸은 거부
+    assert _create(client, "dup", board_id, position=5).status_code == 409
+    assert _create(client, "out", board_id, position=9).status_code == 422
+
+    # 서버 배정은 비어 있는 가장 작은 칸부터 채움
+    assert _create(client, "C", board_id, allocate=True).json()["position"] == 2
+    assert client.get(f"/api/epic/{board_id}/free-slots").json()["free"] == [3, 4, 6, 7, 8]
+    assert _create(client, "root", allocate=True).status_code == 400
+
+def test_allocation_is_atomic_under_concurrency(client, test_db):
+    board_id = _create(client, "Board", position=0).json()["id"]
+
+    def allocate(i):
+        # 요청마다 별도 세션(커넥션)으로 동시에 배정
+        db = TestingSessionLocal()
+        try:
+            epic = EpicCreate(title=f"cell {i}", status="todo", core_epic_id=board_id)
+            return asyncio.run(EpicService(db).create_epic(epic, allocate_position=True)).position
+        except PositionConflictError:
+            return None
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        positions = list(executor.map(allocate, range(10)))
+
+    assert sorted(position for position in positions if position is not None) == list(range(1, 9))
+    assert positions.count(None) == 2
+    assert client.get(f"/api/epic/{board_id}/free-slots").json()["free"] == []
+
+def test_import_keeps_target_slots_unique(client, test_db):
+    board_id = _create(client, "Board", position=0).json()["id"]
+    _create(client, "A", board_id, position=1)
+    body = (
+        b'{"id": 1, "title": "X", "status": "todo", "position": 1}\n'
+        b'{"id": 2, "title": "Y", "status": "todo", "position": 2}\n'
+    )
+    assert client.post(f"/api/epic/import?core_epic_id={board_id}", content=body).status_code == 200
+    assert client.get(f"/api/epic/{board_id}/free-slots").json()["taken"] == [1, 2, 3]
@@ -0,0 +1,62 @@
+import logging
+import threading
+from fastapi.testclient import TestClient
+import pytest
+from main import app
+from app.services import metrics
+from app.services.metrics import metrics_registry
+from tests.conftest import create_epic
+
+@pytest.fixture
+def client():
+    metrics_registry.reset()
+    return TestClient(app)
+
+def test_query_budget_for_epic_reads(client, test_db, query_budget):
+    root_id = create_epic(client, "Root")
+    create_epic(client, "Sub", root_id)
+
+    # ETag 버전 확인 1번 + 하위 트리 조회 1번
+    with query_budget(2):
+        assert client.get(f"/api/epic/{root_id}").status_code == 200
+    # 캐시 적중 시 ETag 버전 확인 1번만
+    with query_budget(1):
+        client.get(f"/api/epic/{root_id}")
+    with query_budget(3):
+        client.get("/api/epic")
+
+def test_server_timing_header(client, test_db):
+    root_id = create_epic(client, "Root")
+    response = client.get(f"/api/epic/{root_id}/tree")
+    timing = response.headers["server-timing"]
+    assert 'desc="2 statements"' in timing
+    assert "serialize;dur=" in timing and "total;dur=" in timing
+
+def test_metrics_endpoint(client, test_db):
+    root_id = create_epic(client, "Root")
+    client.get(f"/api/epic/{root_id}")
+    client.get(f"/api/epic/{root_id}")
+    client.get("/api/epic/9999")
+
+    text = client.get("/metrics").text
+    assert 'bemorelog_http_requests_total{method="GET",route="/api/epic/{epic_id}",status="200"} 2' in text
+    assert 'bemorelog_http_requests_total{method="GET",route="/api/epic/{epic_id}",status="404"} 1' in text
+    assert 'bemorelog_db_statements_total{method="POST",route="/api/epic",status="200"}' in text
+    assert "# TYPE bemorelog_http_response_bytes_total counter" in text
+
+def test_slow_query_log(client, test_db, monkeypatch, caplog):
+    monkeypatch.setattr(metrics, "SLOW_QUERY_MS", 0.000001)
+    with caplog.at_level(logging.WARNING, logger="app.db.slow_query"):
+        client.get("/api/epic")
+    assert any("Slow query" in record.getMessage() for record in caplog.records)
+    assert metrics_registry.slow_queries > 0
+
+def test_slow_query_counter_is_thread_safe():
+    registry = metrics.MetricsRegistry()
+    threads = [threading.Thread(target=lambda: [registry.record_slow_query() for _ in range(10_000)]) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert registry.slow_queries == 80_000
+    assert "bemorelog_db_slow_queries_total 80000" in registry.render()
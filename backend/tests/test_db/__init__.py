@@ -0,0 +1 @@
+# This file makes the test_db directory a Python package
@@ -0,0 +1,73 @@
+import asyncio
+import json
+from datetime import datetime
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from app.db.init_db import upgrade
+from app.models.base import Base
+from app.services.epic import EpicService
+from migrations.schema import include_name
+
+LEGACY_SCHEMA = [
+    # migrate_add_position.py 이전 스키마 + VARCHAR position (마이그레이션 도입 전 DB)
+    """
+    CREATE TABLE epics (
+        id INTEGER NOT NULL PRIMARY KEY, title VARCHAR, description VARCHAR, status VARCHAR,
+        depth INTEGER, created_at DATETIME DEFAULT (CURRENT_TIMESTAMP), updated_at DATETIME,
+        core_epic_id INTEGER REFERENCES epics (id), position VARCHAR
+    )
+    """,
+    """
+    CREATE TABLE epic_relations (
+        id INTEGER NOT NULL PRIMARY KEY, core_epic_id INTEGER NOT NULL, sub_epic_id INTEGER NOT NULL,
+        position_row INTEGER NOT NULL, position_col INTEGER NOT NULL, depth INTEGER NOT NULL
+    )
+    """,
+]
+
+def test_fresh_database_matches_models(tmp_path):
+    url = f"sqlite:///{tmp_path / 'fresh.db'}"
+    upgrade(url)
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        context = MigrationContext.configure(conn, opts={"include_name": include_name})
+        assert compare_metadata(context, Base.metadata) == []
+    engine.dispose()
+
+def test_legacy_database_is_upgraded(tmp_path):
+    url = f"sqlite:///{tmp_path / 'legacy.db'}"
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        for statement in LEGACY_SCHEMA:
+            conn.execute(text(statement))
+        conn.execute(text("INSERT INTO epics (id, title, status, depth, position) VALUES (1, 'Board', 'todo', 0, '(4, 4)')"))
+        conn.execute(text(
+            "INSERT INTO epics (id, title, status, depth, core_epic_id, position) VALUES "
+            "(2, 'left', 'todo', 1, 1, '(1, 1)'), (3, 'corner', 'done', 1, 1, '(7, 7)'), (4, 'numeric', 'todo', 1, 1, '3'), "
+            "(5, 'broken', 'todo', 1, 1, 'middle'), (6, 'same cell', 'todo', 1, 1, '(1, 1)')"
+        ))
+
+    upgrade(url)
+    # 다시 실행해도 바뀌는 것이 없음
+    upgrade(url)
+
+    with engine.connect() as conn:
+        position_type = next(row.type for row in conn.execute(text("PRAGMA table_info(epics)")) if row.name == "position")
+        assert position_type == "INTEGER"
+        rows = conn.execute(text("SELECT id, position, typeof(position), path FROM epics ORDER BY id")).all()
+        # 좌표 문자열은 칸 번호로, 겹치는 칸은 빈 칸으로, 알 수 없는 값은 NULL로
+        assert [(row.id, row.position) for row in rows] == [(1, 0), (2, 1), (3, 5), (4, 3), (5, None), (6, 2)]
+        assert {row[2] for row in rows} == {"integer", "null"}
+        assert rows[1].path == "/1/2/"
+        assert conn.execute(text("SELECT rowid FROM epics_fts WHERE epics_fts MATCH 'corner'")).scalars().all() == [3]
+
+    with Session(engine) as db:
+        rollup = asyncio.run(EpicService(db).get_rollup(1))
+        assert rollup.rollup.statuses == {"done": 1, "todo": 4}
+        # 편집 기록이 없던 보드는 마이그레이션 때 남긴 스냅샷에서 재구성
+        board = json.loads(asyncio.run(EpicService(db).get_board_at(1, datetime.now())))
+        assert [(sub["id"], sub["position"]) for sub in board["subs"]] == [(2, 1), (3, 5), (4, 3), (5, None), (6, 2)]
+        assert board["rollup"] == {"total": 5, "statuses": {"done": 1, "todo": 4}}
+    engine.dispose()
@@ -0,0 +1,16 @@
+from sqlalchemy import text
+from app.db.session import create_db_engine
+
+def test_sqlite_production_profile(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'prod.db'}", "production")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+    engine.dispose()
+
+def test_sqlite_default_profile(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'dev.db'}", "default")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+    engine.dispose()
@@ -32,6 +32,12 @@ export interface EpicUpdate {
   core_epic_id?: number | null;
 }
 
+export interface EpicDeleteResult {
+  id: number;
+  deleted: number;  // 삭제된 epic 수 (하위 epic 포함)
+  deleted_relations: number;
+}
+
 class EpicService {
   async getEpics(): Promise<Epic[]> {
     try {
@@ -73,7 +79,7 @@ class EpicService {
     }
   }
 
-  async deleteEpic(id: number): Promise<Epic> {
+  async deleteEpic(id: number): Promise<EpicDeleteResult> {
     try {
       const response = await axios.delete(`${API_BASE_URL}/api/epic/${id}`);
       return response.data;